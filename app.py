@@ -1,12 +1,22 @@
+import time
+_script_started = time.perf_counter()  # 첫 실행(콜드 스타트)의 import/첫 화면 시간 측정 기준
 import streamlit as st
-import uuid
 import pandas as pd
 from datetime import datetime
-from database import init_database, load_table, append_row, get_donors, get_requests, update_donor, update_request
-from matching import calculate_match_score
+from database import (
+    check_connection, is_local_backend, append_row, get_donors, get_requests,
+    prefetch_tables, data_status, rebuild_matches, matches_pending, iter_donors, iter_requests,
+    find_changed_values, bulk_update, get_snapshot_version, page_donors, page_requests, count_donors,
+    count_requests, default_page_size, snapshot_ttl, donor_stats, request_stats, SORT_OPTIONS,
+    page_matches, iter_matches, count_matches, fetch_rows, match_top_k
+)
+from records import DONOR_MODES, REQUEST_STATUSES, validate_donor, validate_request, new_donor_row, new_request_row
+from importer import import_file
+from exporter import EXPORT_FORMATS, available_formats, export_bytes
+import metrics
 
-# 데이터베이스 초기화
-init_database()
+# 프로세스의 첫 실행에서만 기록됨 (이후 실행은 모듈이 이미 로드되어 있음)
+metrics.record_startup("imports", time.perf_counter() - _script_started)
 
 st.set_page_config(
     page_title="재능기부포털",
@@ -14,41 +24,130 @@ st.set_page_config(
     layout="wide"
 )
 
+# 이번 실행(rerun)의 계측 구간 시작
+perf_marker = metrics.mark()
+
+# 세션 시작 시 스냅샷 캐시를 백그라운드에서 미리 채움 (첫 화면 전환 대기 시간 단축)
+if "prefetched" not in st.session_state:
+    st.session_state.prefetched = True
+    prefetch_tables()
+
 # 사이드바 정보
 st.sidebar.title("📌 재능기부포털")
 
-# Supabase 연결 확인
-try:
-    from database import get_supabase_client
-    client = get_supabase_client()
-    if client:
-        st.sidebar.success("✅ Supabase 연결됨")
-    else:
-        st.sidebar.warning("⚠️ Supabase 설정 필요")
-        with st.sidebar.expander("설정 방법"):
-            st.markdown("""
-            Streamlit Cloud Secrets에 다음을 추가하세요:
-            ```toml
-            SUPABASE_URL = "your-url"
-            SUPABASE_KEY = "your-key"
-            ```
-            """)
-except Exception as e:
-    st.sidebar.error(f"❌ DB 연결 오류: {str(e)}")
-
-# 메인 탭 구성
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
-    "🧑‍🤝‍🧑 재능기부자 등록",
-    "🙋 재능수요자 등록",
-    "👥 기부자 현황",
-    "🙋 수요자 현황",
-    "🔗 매칭 현황"
-])
+# 연결 상태 표시 자리 (확인은 화면을 그린 뒤에 한 번만 수행)
+connection_status = st.sidebar.container()
+
+def show_connection_status(container):
+    """Supabase 연결 확인 (결과는 database 모듈에서 캐시되며, 화면 조회가 성공했다면 추가 요청 없음)"""
+    try:
+        connected = check_connection()
+        if connected and is_local_backend():
+            container.success("✅ 로컬 DB (SQLite) 사용 중")
+        elif connected:
+            container.success("✅ Supabase 연결됨")
+        elif connected is None:
+            container.warning("⚠️ Supabase 설정 필요")
+            with container.expander("설정 방법"):
+                st.markdown("""
+                Streamlit Cloud Secrets에 다음을 추가하세요:
+                ```toml
+                SUPABASE_URL = "your-url"
+                SUPABASE_KEY = "your-key"
+                ```
+                """)
+        else:
+            container.error("❌ Supabase 서버에 연결할 수 없습니다")
+    except Exception as e:
+        container.error(f"❌ DB 연결 오류: {str(e)}")
+
+def export_buttons(name: str, key: tuple, build, file_label: str):
+    """다운로드 파일은 '파일 준비'를 누를 때만 생성 (key가 같으면 만들어 둔 파일을 SNAPSHOT_TTL 동안 재사용)
+
+    데이터 버전은 이 프로세스의 쓰기로만 바뀌므로, 다른 세션/프로세스의 변경은 TTL이 지난 뒤
+    다시 만들 때 반영됩니다.
+
+    Args:
+        name: 위젯 키 접두사
+        key: 데이터 버전과 필터/정렬/편집 상태를 담은 튜플 (바뀌면 다시 준비)
+        build: 내보낼 DataFrame을 반환하는 함수
+        file_label: 파일 이름 앞부분 (예: "기부자_현황")
+    """
+    formats = available_formats()
+    for col, fmt in zip(st.columns(len(formats)), formats):
+        spec = EXPORT_FORMATS[fmt]
+        state_key = f"export_{name}_{fmt}"
+        with col:
+            if st.session_state.get(state_key) != key:
+                st.button(f"📦 {spec.label} 파일 준비", key=f"{state_key}_prepare",
+                          on_click=st.session_state.__setitem__, args=(state_key, key))
+            else:
+                with st.spinner(f"{spec.label} 파일을 만드는 중..."):
+                    data = export_bytes(key, fmt, build, max_age=snapshot_ttl())
+                st.download_button(
+                    label=f"📥 {spec.label}로 다운로드",
+                    data=data,
+                    file_name=f"{file_label}_{datetime.now().strftime('%Y%m%d')}{spec.extension}",
+                    mime=spec.mime,
+                    key=f"{state_key}_download"
+                )
+
+PAGE_SIZE_OPTIONS = sorted({25, 50, 100, 200, default_page_size()})
+
+def page_size_select(name: str) -> int:
+    """페이지당 행 수 선택 (기본값은 LIST_PAGE_SIZE 설정)"""
+    return st.selectbox("페이지당 행 수", PAGE_SIZE_OPTIONS,
+                        index=PAGE_SIZE_OPTIONS.index(default_page_size()), key=f"{name}_page_size")
+
+def page_cursors(name: str, view: tuple) -> list:
+    """페이지 커서 목록 (마지막 값이 현재 페이지의 시작 커서, 첫 페이지는 None)
+
+    검색/필터/정렬/페이지 크기(view)가 바뀌면 첫 페이지로 돌아갑니다.
+    """
+    state = st.session_state.setdefault(f"{name}_pager", {"view": view, "cursors": [None]})
+    if state["view"] != view:
+        state["view"] = view
+        state["cursors"] = [None]
+    return state["cursors"]
+
+def page_controls(name: str, cursors: list, next_cursor, row_count: int, total: int, page_size: int):
+    """이전/다음 페이지 버튼과 현재 범위 표시"""
+    first = (len(cursors) - 1) * page_size
+    col1, col2, col3 = st.columns([1, 3, 1])
+    with col1:
+        st.button("◀ 이전", key=f"{name}_prev_page", disabled=len(cursors) == 1,
+                  on_click=cursors.pop, use_container_width=True)
+    with col2:
+        if row_count:
+            st.caption(f"{first + 1:,}–{first + row_count:,} / 총 {total:,}개")
+        else:
+            st.caption(f"총 {total:,}개")
+    with col3:
+        st.button("다음 ▶", key=f"{name}_next_page", disabled=next_cursor is None,
+                  on_click=cursors.append, args=(next_cursor,), use_container_width=True)
+
+def donor_display_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """기부자 목록 표시용 DataFrame (donor_id 포함, 컬럼명 한글화, 날짜 포맷팅)"""
+    display_columns = ["donor_id", "name", "email", "skill", "mode", "availability", "created_at"]
+    display_df = df.reindex(columns=display_columns)
+    display_df.columns = ["ID", "이름", "이메일", "재능", "방식", "가능 시간", "등록일시"]
+    if not display_df.empty:
+        display_df["등록일시"] = pd.to_datetime(display_df["등록일시"]).dt.strftime("%Y-%m-%d %H:%M")
+    return display_df.reset_index(drop=True)
+
+def request_display_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """수요자 목록 표시용 DataFrame (request_id 포함, 컬럼명 한글화, 날짜 포맷팅)"""
+    display_columns = ["request_id", "email", "needed_skill", "description", "status", "created_at"]
+    display_df = df.reindex(columns=display_columns)
+    display_df.columns = ["ID", "이메일", "필요한 재능", "요청 내용", "상태", "등록일시"]
+    if not display_df.empty:
+        display_df["등록일시"] = pd.to_datetime(display_df["등록일시"]).dt.strftime("%Y-%m-%d %H:%M")
+    return display_df.reset_index(drop=True)
 
 # ======================
-# 탭1: 재능기부자 등록
+# 화면1: 재능기부자 등록
 # ======================
-with tab1:
+def donor_register_page():
     st.header("🧑‍🤝‍🧑 재능기부자 등록")
     st.markdown("---")
 
@@ -56,25 +155,18 @@ with tab1:
         name = st.text_input("이름/닉네임 *", placeholder="홍길동")
         email = st.text_input("이메일 *", placeholder="example@email.com")
         skill = st.text_input("재능 *", placeholder="파이썬, 수학, 영어")
-        mode = st.selectbox("방식 *", ["온라인", "오프라인", "온라인/오프라인"])
+        mode = st.selectbox("방식 *", DONOR_MODES)
         availability = st.text_input("가능 시간", placeholder="주말 오후 2시~5시")
 
         submitted = st.form_submit_button("등록하기", use_container_width=True)
 
         if submitted:
-            if not name or not email or not skill:
-                st.error("필수 항목(이름, 이메일, 재능)을 모두 입력해주세요.")
+            error = validate_donor({"name": name, "email": email, "skill": skill, "mode": mode})
+            if error:
+                st.error(error)
             else:
                 try:
-                    append_row("donors", {
-                        "donor_id": str(uuid.uuid4()),
-                        "name": name,
-                        "email": email,
-                        "skill": skill,
-                        "mode": mode,
-                        "availability": availability if availability else "",
-                        "created_at": datetime.now().isoformat()
-                    })
+                    append_row("donors", new_donor_row(name, email, skill, mode, availability))
                     st.success("✅ 재능기부자로 등록되었습니다!")
                     st.balloons()
                 except Exception as e:
@@ -82,10 +174,30 @@ with tab1:
                     st.error(f"❌ 등록 중 오류가 발생했습니다: {error_msg}")
                     st.info("💡 문제가 계속되면 README.md 파일을 참고하세요.")
 
+    # 일괄 등록 (CSV/Parquet)
+    with st.expander("📂 CSV/Parquet 일괄 등록"):
+        st.caption("필수 컬럼: name, email, skill, mode (온라인, 오프라인, 온라인/오프라인 중 하나) · 선택 컬럼: availability")
+        uploaded = st.file_uploader("파일 선택", type=["csv", "parquet"], key="donor_upload")
+        if uploaded is not None and st.button("일괄 등록하기", key="donor_import", use_container_width=True):
+            status = st.empty()
+            try:
+                result = import_file(
+                    "donors", uploaded, name=uploaded.name,
+                    progress=lambda processed, inserted, rejected: status.info(
+                        f"⏳ 처리 중... {processed}행 처리 / {inserted}행 등록 / {rejected}행 거부"
+                    )
+                )
+                status.success(f"✅ {result['inserted']}/{result['processed']}행이 등록되었습니다! (매칭 결과는 백그라운드에서 갱신됩니다)")
+                if not result["rejected"].empty:
+                    st.warning(f"⚠️ {len(result['rejected'])}행이 거부되었습니다.")
+                    st.dataframe(result["rejected"], use_container_width=True, hide_index=True)
+            except Exception as e:
+                status.error(f"❌ 일괄 등록 중 오류가 발생했습니다: {str(e)}")
+
 # ======================
-# 탭2: 재능 수요자 등록
+# 화면2: 재능 수요자 등록
 # ======================
-with tab2:
+def request_register_page():
     st.header("🙋 재능 수요자 등록")
     st.markdown("---")
 
@@ -97,18 +209,12 @@ with tab2:
         submitted = st.form_submit_button("등록하기", use_container_width=True)
 
         if submitted:
-            if not email or not needed_skill:
-                st.error("필수 항목(이메일, 필요한 재능)을 모두 입력해주세요.")
+            error = validate_request({"email": email, "needed_skill": needed_skill})
+            if error:
+                st.error(error)
             else:
                 try:
-                    append_row("requests", {
-                        "request_id": str(uuid.uuid4()),
-                        "email": email,
-                        "needed_skill": needed_skill,
-                        "description": desc if desc else "",
-                        "status": "대기",
-                        "created_at": datetime.now().isoformat()
-                    })
+                    append_row("requests", new_request_row(email, needed_skill, desc))
                     st.success("✅ 요청이 등록되었습니다!")
                     st.balloons()
                 except Exception as e:
@@ -116,361 +222,376 @@ with tab2:
                     st.error(f"❌ 등록 중 오류가 발생했습니다: {error_msg}")
                     st.info("💡 문제가 계속되면 README.md 파일을 참고하세요.")
 
+    # 일괄 등록 (CSV/Parquet)
+    with st.expander("📂 CSV/Parquet 일괄 등록"):
+        st.caption("필수 컬럼: email, needed_skill · 선택 컬럼: description")
+        uploaded = st.file_uploader("파일 선택", type=["csv", "parquet"], key="request_upload")
+        if uploaded is not None and st.button("일괄 등록하기", key="request_import", use_container_width=True):
+            status = st.empty()
+            try:
+                result = import_file(
+                    "requests", uploaded, name=uploaded.name,
+                    progress=lambda processed, inserted, rejected: status.info(
+                        f"⏳ 처리 중... {processed}행 처리 / {inserted}행 등록 / {rejected}행 거부"
+                    )
+                )
+                status.success(f"✅ {result['inserted']}/{result['processed']}행이 등록되었습니다! (매칭 결과는 백그라운드에서 갱신됩니다)")
+                if not result["rejected"].empty:
+                    st.warning(f"⚠️ {len(result['rejected'])}행이 거부되었습니다.")
+                    st.dataframe(result["rejected"], use_container_width=True, hide_index=True)
+            except Exception as e:
+                status.error(f"❌ 일괄 등록 중 오류가 발생했습니다: {str(e)}")
+
 # ======================
-# 탭3: 기부자 현황
+# 화면3: 기부자 현황
 # ======================
-with tab3:
-        try:
-            donors = get_donors()
+def donors_page():
+    try:
+        # 통계는 서버의 그룹 개수만 조회 (전체 행을 내려받지 않음)
+        stats = donor_stats()
+
+        if stats["total"] == 0:
+            st.warning("등록된 재능기부자가 없습니다.")
+        else:
+            # 통계 정보
+            st.subheader("📊 통계")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("총 기부자 수", stats["total"])
+            with col2:
+                st.metric("온라인 가능", stats["online"])
+            with col3:
+                st.metric("오프라인 가능", stats["offline"])
+
+            st.markdown("---")
+            st.subheader("📋 기부자 목록")
+
+            # 검색 기능
+            search_term = st.text_input("🔍 검색 (이름, 이메일, 재능으로 검색)", "")
+
+            # 정렬 옵션
+            sort_option = st.selectbox("정렬 기준", ["등록일시 (최신순)", "등록일시 (오래된순)", "이름 (가나다순)"])
+
+            page_size = page_size_select("donors")
+
+            # 서버에서 (정렬 컬럼, ID) 키셋으로 현재 페이지만 조회 (개수는 행을 받지 않고 계산)
+            cursors = page_cursors("donors", (search_term, sort_option, page_size))
+            total = count_donors(search_term)
+            page_df, next_cursor = page_donors(search_term, sort_option, cursors[-1], page_size)
+            display_df = donor_display_frame(page_df)
+
+            # 편집 가능한 데이터 표시 (ID와 등록일시는 편집 불가)
+            edited_df = st.data_editor(
+                display_df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "ID": st.column_config.TextColumn("ID", disabled=True),
+                    "등록일시": st.column_config.TextColumn("등록일시", disabled=True)
+                },
+                num_rows="fixed"
+            )
+            page_controls("donors", cursors, next_cursor, len(display_df), total, page_size)
+
+            # 변경사항 저장 버튼
+            if st.button("💾 변경사항 저장", use_container_width=True, type="primary", key="save_donor_changes"):
+                try:
+                    # 원본 데이터와 ID 기준으로 비교하여 실제로 바뀐 셀만 전송
+                    rows = find_changed_values(display_df, edited_df, "ID", {
+                        "ID": "donor_id",
+                        "이름": "name",
+                        "이메일": "email",
+                        "재능": "skill",
+                        "방식": "mode",
+                        "가능 시간": "availability"
+                    })
 
-            if donors.empty:
-                st.warning("등록된 재능기부자가 없습니다.")
-            else:
-                # 통계 정보
-                st.subheader("📊 통계")
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("총 기부자 수", len(donors))
-                with col2:
-                    online_count = len(donors[donors["mode"].str.contains("온라인", na=False)])
-                    st.metric("온라인 가능", online_count)
-                with col3:
-                    offline_count = len(donors[donors["mode"].str.contains("오프라인", na=False)])
-                    st.metric("오프라인 가능", offline_count)
+                    # 바뀐 셀만 묶어서 업데이트
+                    results = bulk_update("donors", rows)
+                    updated_count = sum(results.values())
+                    failed_ids = [row_id for row_id, ok in results.items() if not ok]
 
-                st.markdown("---")
-                st.subheader("📋 기부자 목록")
-
-                # 원본 데이터 준비 (donor_id 포함)
-                display_columns = ["donor_id", "name", "email", "skill", "mode", "availability", "created_at"]
-                display_df = donors[display_columns].copy()
-                
-                # 컬럼명 한글화
-                display_df.columns = ["ID", "이름", "이메일", "재능", "방식", "가능 시간", "등록일시"]
-                
-                # 날짜 포맷팅
-                if not display_df.empty:
-                    display_df["등록일시"] = pd.to_datetime(display_df["등록일시"]).dt.strftime("%Y-%m-%d %H:%M")
-                
-                # 검색 기능
-                search_term = st.text_input("🔍 검색 (이름, 이메일, 재능으로 검색)", "")
-                
-                if search_term:
-                    mask = (
-                        display_df["이름"].str.contains(search_term, case=False, na=False) |
-                        display_df["이메일"].str.contains(search_term, case=False, na=False) |
-                        display_df["재능"].str.contains(search_term, case=False, na=False)
-                    )
-                    display_df = display_df[mask]
-                
-                # 정렬 옵션
-                sort_option = st.selectbox("정렬 기준", ["등록일시 (최신순)", "등록일시 (오래된순)", "이름 (가나다순)"])
-                if sort_option == "등록일시 (최신순)":
-                    display_df = display_df.sort_values("등록일시", ascending=False)
-                elif sort_option == "등록일시 (오래된순)":
-                    display_df = display_df.sort_values("등록일시", ascending=True)
-                elif sort_option == "이름 (가나다순)":
-                    display_df = display_df.sort_values("이름", ascending=True)
-                
-                # 편집 가능한 데이터 표시 (ID와 등록일시는 편집 불가)
-                edited_df = st.data_editor(
-                    display_df,
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "ID": st.column_config.TextColumn("ID", disabled=True),
-                        "등록일시": st.column_config.TextColumn("등록일시", disabled=True)
-                    },
-                    num_rows="fixed"
-                )
-                
-                # 변경사항 저장 버튼
-                if st.button("💾 변경사항 저장", use_container_width=True, type="primary", key="save_donor_changes"):
-                    try:
-                        # 원본 데이터와 비교하여 변경된 행 찾기
-                        original_df = display_df.copy()
-                        
-                        # 변경된 행 업데이트
-                        updated_count = 0
-                        for idx, row in edited_df.iterrows():
-                            original_row = original_df.iloc[idx]
-                            
-                            # 변경사항 확인
-                            if (row["이름"] != original_row["이름"] or
-                                row["이메일"] != original_row["이메일"] or
-                                row["재능"] != original_row["재능"] or
-                                row["방식"] != original_row["방식"] or
-                                row["가능 시간"] != original_row["가능 시간"]):
-                                
-                                update_donor(
-                                    donor_id=row["ID"],
-                                    name=row["이름"],
-                                    email=row["이메일"],
-                                    skill=row["재능"],
-                                    mode=row["방식"],
-                                    availability=row["가능 시간"] if pd.notna(row["가능 시간"]) else ""
-                                )
-                                updated_count += 1
-                        
-                        if updated_count > 0:
-                            st.success(f"✅ {updated_count}개의 항목이 업데이트되었습니다!")
+                    if failed_ids:
+                        st.error(f"❌ {len(failed_ids)}개의 항목을 저장하지 못했습니다: {', '.join(failed_ids)}")
+                    if updated_count > 0:
+                        st.success(f"✅ {updated_count}개의 항목이 업데이트되었습니다!")
+                        if not failed_ids:
                             st.rerun()
-                        else:
-                            st.info("변경된 내용이 없습니다.")
-                    except Exception as e:
-                        st.error(f"❌ 저장 중 오류가 발생했습니다: {str(e)}")
-                
-                # 다운로드 버튼
-                csv = edited_df.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📥 CSV로 다운로드",
-                    data=csv,
-                    file_name=f"기부자_현황_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv"
-                )
+                    elif not failed_ids:
+                        st.info("변경된 내용이 없습니다.")
+                except Exception as e:
+                    st.error(f"❌ 저장 중 오류가 발생했습니다: {str(e)}")
 
-        except Exception as e:
-            error_msg = str(e)
-            st.error(f"❌ 데이터를 불러오는 중 오류가 발생했습니다: {error_msg}")
-            st.info("💡 문제가 계속되면 README.md 파일을 참고하세요.")
+            # 다운로드 버튼 (현재 검색/정렬의 전체 목록, 요청 시에만 생성하고 데이터 버전별로 캐시)
+            def donor_export_frame():
+                if search_term:
+                    # 검색 결과는 키셋 페이지를 끝까지 이어서 조회
+                    frames = list(iter_donors(search_term, sort_option))
+                    return donor_display_frame(pd.concat(frames, ignore_index=True) if frames else pd.DataFrame())
+                sort_column, sort_desc = SORT_OPTIONS[sort_option]
+                return donor_display_frame(get_donors().sort_values(sort_column, ascending=not sort_desc))
+
+            export_buttons(
+                "donors",
+                ("donors", get_snapshot_version("donors"), search_term, sort_option),
+                donor_export_frame,
+                "기부자_현황"
+            )
+
+    except Exception as e:
+        error_msg = str(e)
+        st.error(f"❌ 데이터를 불러오는 중 오류가 발생했습니다: {error_msg}")
+        st.info("💡 문제가 계속되면 README.md 파일을 참고하세요.")
 
 # ======================
-# 탭4: 수요자 현황
+# 화면4: 수요자 현황
 # ======================
-with tab4:
-        try:
-            requests = get_requests()
+def requests_page():
+    try:
+        # 통계는 서버의 그룹 개수만 조회 (전체 행을 내려받지 않음)
+        stats = request_stats()
+
+        if stats["total"] == 0:
+            st.warning("등록된 재능 수요가 없습니다.")
+        else:
+            # 통계 정보
+            st.subheader("📊 통계")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("총 수요 수", stats["total"])
+            with col2:
+                st.metric("대기 중", stats["waiting"])
+            with col3:
+                st.metric("처리 완료", stats["completed"])
+
+            st.markdown("---")
+            st.subheader("📋 수요자 목록")
+
+            # 상태별 필터
+            status_filter = st.selectbox("상태 필터", ["전체", "대기", "처리 완료"])
+
+            # 검색 기능
+            search_term = st.text_input("🔍 검색 (이메일, 필요한 재능으로 검색)", "")
+
+            # 정렬 옵션
+            sort_option = st.selectbox("정렬 기준", ["등록일시 (최신순)", "등록일시 (오래된순)", "상태"])
+
+            page_size = page_size_select("requests")
+
+            # 서버에서 (정렬 컬럼, ID) 키셋으로 현재 페이지만 조회 (개수는 행을 받지 않고 계산)
+            cursors = page_cursors("requests", (status_filter, search_term, sort_option, page_size))
+            total = count_requests(search_term, status_filter)
+            page_df, next_cursor = page_requests(search_term, status_filter, sort_option, cursors[-1], page_size)
+            display_df = request_display_frame(page_df)
+
+            # 편집 가능한 데이터 표시 (ID와 등록일시는 편집 불가)
+            edited_df = st.data_editor(
+                display_df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "ID": st.column_config.TextColumn("ID", disabled=True),
+                    "등록일시": st.column_config.TextColumn("등록일시", disabled=True),
+                    "상태": st.column_config.SelectboxColumn(
+                        "상태",
+                        options=REQUEST_STATUSES
+                    )
+                },
+                num_rows="fixed"
+            )
+            page_controls("requests", cursors, next_cursor, len(display_df), total, page_size)
 
-            if requests.empty:
-                st.warning("등록된 재능 수요가 없습니다.")
-            else:
-                # 통계 정보
-                st.subheader("📊 통계")
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("총 수요 수", len(requests))
-                with col2:
-                    waiting_count = len(requests[requests["status"] == "대기"])
-                    st.metric("대기 중", waiting_count)
-                with col3:
-                    completed_count = len(requests[requests["status"] != "대기"])
-                    st.metric("처리 완료", completed_count)
+            # 변경사항 저장 버튼
+            if st.button("💾 변경사항 저장", use_container_width=True, type="primary", key="save_request_changes"):
+                try:
+                    # 원본 데이터와 ID 기준으로 비교하여 실제로 바뀐 셀만 전송
+                    rows = find_changed_values(display_df, edited_df, "ID", {
+                        "ID": "request_id",
+                        "이메일": "email",
+                        "필요한 재능": "needed_skill",
+                        "요청 내용": "description",
+                        "상태": "status"
+                    })
 
-                st.markdown("---")
-                st.subheader("📋 수요자 목록")
-
-                # 원본 데이터 준비 (request_id 포함)
-                display_columns = ["request_id", "email", "needed_skill", "description", "status", "created_at"]
-                display_df = requests[display_columns].copy()
-                
-                # 컬럼명 한글화
-                display_df.columns = ["ID", "이메일", "필요한 재능", "요청 내용", "상태", "등록일시"]
-                
-                # 날짜 포맷팅
-                if not display_df.empty:
-                    display_df["등록일시"] = pd.to_datetime(display_df["등록일시"]).dt.strftime("%Y-%m-%d %H:%M")
-                
-                # 상태별 필터
-                status_filter = st.selectbox("상태 필터", ["전체", "대기", "처리 완료"])
-                if status_filter == "대기":
-                    display_df = display_df[display_df["상태"] == "대기"]
-                elif status_filter == "처리 완료":
-                    display_df = display_df[display_df["상태"] != "대기"]
-                
-                # 검색 기능
-                search_term = st.text_input("🔍 검색 (이메일, 필요한 재능으로 검색)", "")
-                
-                if search_term:
-                    mask = (
-                        display_df["이메일"].str.contains(search_term, case=False, na=False) |
-                        display_df["필요한 재능"].str.contains(search_term, case=False, na=False)
-                    )
-                    display_df = display_df[mask]
-                
-                # 정렬 옵션
-                sort_option = st.selectbox("정렬 기준", ["등록일시 (최신순)", "등록일시 (오래된순)", "상태"])
-                if sort_option == "등록일시 (최신순)":
-                    display_df = display_df.sort_values("등록일시", ascending=False)
-                elif sort_option == "등록일시 (오래된순)":
-                    display_df = display_df.sort_values("등록일시", ascending=True)
-                elif sort_option == "상태":
-                    display_df = display_df.sort_values("상태", ascending=True)
-                
-                # 편집 가능한 데이터 표시 (ID와 등록일시는 편집 불가)
-                edited_df = st.data_editor(
-                    display_df,
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "ID": st.column_config.TextColumn("ID", disabled=True),
-                        "등록일시": st.column_config.TextColumn("등록일시", disabled=True),
-                        "상태": st.column_config.SelectboxColumn(
-                            "상태",
-                            options=["대기", "처리 완료", "취소"]
-                        )
-                    },
-                    num_rows="fixed"
-                )
-                
-                # 변경사항 저장 버튼
-                if st.button("💾 변경사항 저장", use_container_width=True, type="primary", key="save_request_changes"):
-                    try:
-                        # 원본 데이터와 비교하여 변경된 행 찾기
-                        original_df = display_df.copy()
-                        
-                        # 변경된 행 업데이트
-                        updated_count = 0
-                        for idx, row in edited_df.iterrows():
-                            original_row = original_df.iloc[idx]
-                            
-                            # 변경사항 확인
-                            if (row["이메일"] != original_row["이메일"] or
-                                row["필요한 재능"] != original_row["필요한 재능"] or
-                                row["요청 내용"] != original_row["요청 내용"] or
-                                row["상태"] != original_row["상태"]):
-                                
-                                update_request(
-                                    request_id=row["ID"],
-                                    email=row["이메일"],
-                                    needed_skill=row["필요한 재능"],
-                                    description=row["요청 내용"] if pd.notna(row["요청 내용"]) else "",
-                                    status=row["상태"]
-                                )
-                                updated_count += 1
-                        
-                        if updated_count > 0:
-                            st.success(f"✅ {updated_count}개의 항목이 업데이트되었습니다!")
+                    # 바뀐 셀만 묶어서 업데이트
+                    results = bulk_update("requests", rows)
+                    updated_count = sum(results.values())
+                    failed_ids = [row_id for row_id, ok in results.items() if not ok]
+
+                    if failed_ids:
+                        st.error(f"❌ {len(failed_ids)}개의 항목을 저장하지 못했습니다: {', '.join(failed_ids)}")
+                    if updated_count > 0:
+                        st.success(f"✅ {updated_count}개의 항목이 업데이트되었습니다!")
+                        if not failed_ids:
                             st.rerun()
-                        else:
-                            st.info("변경된 내용이 없습니다.")
-                    except Exception as e:
-                        st.error(f"❌ 저장 중 오류가 발생했습니다: {str(e)}")
-                
-                # 다운로드 버튼
-                csv = edited_df.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📥 CSV로 다운로드",
-                    data=csv,
-                    file_name=f"수요자_현황_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv"
-                )
+                    elif not failed_ids:
+                        st.info("변경된 내용이 없습니다.")
+                except Exception as e:
+                    st.error(f"❌ 저장 중 오류가 발생했습니다: {str(e)}")
 
-        except Exception as e:
-            error_msg = str(e)
-            st.error(f"❌ 데이터를 불러오는 중 오류가 발생했습니다: {error_msg}")
-            st.info("💡 문제가 계속되면 README.md 파일을 참고하세요.")
+            # 다운로드 버튼 (현재 필터/검색/정렬의 전체 목록, 요청 시에만 생성하고 데이터 버전별로 캐시)
+            def request_export_frame():
+                if search_term:
+                    # 검색 결과는 키셋 페이지를 끝까지 이어서 조회
+                    frames = list(iter_requests(search_term, status_filter, sort_option))
+                    return request_display_frame(pd.concat(frames, ignore_index=True) if frames else pd.DataFrame())
+                source_df = get_requests()
+                if status_filter == "대기":
+                    source_df = source_df[source_df["status"] == "대기"]
+                elif status_filter == "처리 완료":
+                    source_df = source_df[source_df["status"] != "대기"]
+                sort_column, sort_desc = SORT_OPTIONS[sort_option]
+                return request_display_frame(source_df.sort_values(sort_column, ascending=not sort_desc))
+
+            export_buttons(
+                "requests",
+                ("requests", get_snapshot_version("requests"), status_filter, search_term, sort_option),
+                request_export_frame,
+                "수요자_현황"
+            )
+
+    except Exception as e:
+        error_msg = str(e)
+        st.error(f"❌ 데이터를 불러오는 중 오류가 발생했습니다: {error_msg}")
+        st.info("💡 문제가 계속되면 README.md 파일을 참고하세요.")
 
 # ======================
-# 탭5: 매칭 현황
+# 화면5: 매칭 현황
 # ======================
-with tab5:
-        try:
-            donors = get_donors()
-            requests = get_requests()
-
-            if donors.empty:
-                st.warning("등록된 재능기부자가 없습니다.")
-            elif requests.empty:
-                st.warning("등록된 재능 수요가 없습니다.")
-            else:
-                st.subheader("📊 등록 현황")
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("재능기부자 수", len(donors))
-                with col2:
-                    st.metric("재능 수요 수", len(requests))
-
+def match_display_frame(pairs: pd.DataFrame) -> pd.DataFrame:
+    """매칭 목록 표시용 DataFrame (해당 페이지의 기부자/수요 정보만 조회하여 결합)"""
+    donors = fetch_rows("donors", pairs["donor_id"].tolist(),
+                        ["donor_id", "name", "email", "skill", "mode", "availability"])
+    requests = fetch_rows("requests", pairs["request_id"].tolist(),
+                          ["request_id", "email", "needed_skill", "description", "status"])
+    # 서버 정렬 순서를 유지하도록 왼쪽(매칭) 기준으로 결합
+    matches_df = pairs[["donor_id", "request_id", "rank", "score"]].merge(
+        donors, on="donor_id", how="inner"
+    ).merge(
+        requests, on="request_id", how="inner", suffixes=("_donor", "_request")
+    )
+    matches_df = matches_df[[
+        "name", "email_donor", "skill", "mode", "availability",
+        "email_request", "needed_skill", "description", "status", "rank", "score"
+    ]]
+    matches_df.columns = [
+        "기부자 이름", "기부자 이메일", "기부자 재능", "방식", "가능 시간",
+        "수요자 이메일", "요청 재능", "요청 내용", "수요자 상태", "순위", "매칭 점수"
+    ]
+    return matches_df
+
+def matches_page():
+    try:
+        # 전체 행 대신 개수만 조회 (table_stats 뷰)
+        donor_total = donor_stats()["total"]
+        request_total = request_stats()["total"]
+
+        if not donor_total:
+            st.warning("등록된 재능기부자가 없습니다.")
+        elif not request_total:
+            st.warning("등록된 재능 수요가 없습니다.")
+        else:
+            st.subheader("📊 등록 현황")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("재능기부자 수", donor_total)
+            with col2:
+                st.metric("재능 수요 수", request_total)
+
+            st.markdown("---")
+            st.subheader("🎯 매칭 결과")
+
+            # 매칭 옵션
+            col1, col2 = st.columns(2)
+            with col1:
+                match_status_filter = st.selectbox(
+                    "수요자 상태 필터",
+                    ["전체", "대기", "처리 완료"],
+                    key="match_status_filter"
+                )
+            with col2:
+                show_all_matches = st.checkbox("모든 매칭 표시 (상태 무관)", value=False, key="show_all_matches")
+            status_filter = "전체" if show_all_matches else match_status_filter
+
+            # 등록/수정 시 미리 계산되어 저장된 매칭 결과 조회 (수요자별 상위 MATCH_TOP_K건)
+            if st.button("🔄 매칭 전체 재계산", key="rebuild_matches"):
+                with st.spinner("전체 매칭을 다시 계산하는 중..."):
+                    match_count = rebuild_matches()
+                st.success(f"✅ {match_count}개의 매칭이 갱신되었습니다!")
+            elif matches_pending():
+                st.caption("🔄 최근 등록/수정 내용을 매칭 결과에 반영하는 중입니다. 잠시 후 다시 확인하세요.")
+
+            max_top_k = match_top_k()
+            top_k = st.number_input("수요자별 최대 매칭 수", min_value=1, max_value=max_top_k,
+                                    value=min(5, max_top_k), key="match_top_k")
+            sort_match_option = st.selectbox(
+                "정렬 기준",
+                ["매칭 점수 (높은순)", "수요자별", "등록일시 (최신순)"],
+                key="sort_match_option"
+            )
+
+            # 현재 페이지만 서버에서 조회 (순위 ≤ k, 상태 필터, 키셋 페이지)
+            total = count_matches(status_filter, top_k)
+            if total:
+                page_size = page_size_select("matches")
+                cursors = page_cursors("matches", (status_filter, top_k, sort_match_option, page_size))
+                pairs, next_cursor = page_matches(status_filter, top_k, sort_match_option, cursors[-1], page_size)
+                page_df = match_display_frame(pairs) if not pairs.empty else pd.DataFrame()
+                st.dataframe(page_df, use_container_width=True, hide_index=True)
+                page_controls("matches", cursors, next_cursor, len(page_df), total, page_size)
+
+                # 매칭 통계 (수요자별 1위 행 수 = 매칭된 수요자 수)
                 st.markdown("---")
-                st.subheader("🎯 매칭 결과")
-                
-                # 매칭 옵션
-                col1, col2 = st.columns(2)
+                st.subheader("📈 매칭 통계")
+                matched_requests = count_matches(status_filter, top_k, rank=1)
+                col1, col2, col3 = st.columns(3)
                 with col1:
-                    match_status_filter = st.selectbox(
-                        "수요자 상태 필터",
-                        ["전체", "대기", "처리 완료"],
-                        key="match_status_filter"
-                    )
+                    st.metric("총 매칭 수", total)
                 with col2:
-                    show_all_matches = st.checkbox("모든 매칭 표시 (상태 무관)", value=False, key="show_all_matches")
-
-                matches = []
-
-                # 모든 기부자와 수요자에 대해 wild 매칭 수행
-                for _, r in requests.iterrows():
-                    # 상태 필터 적용
-                    if not show_all_matches:
-                        if match_status_filter == "대기" and r.get("status", "대기") != "대기":
-                            continue
-                        elif match_status_filter == "처리 완료" and r.get("status", "대기") == "대기":
-                            continue
-                    
-                    for _, d in donors.iterrows():
-                        # wild 매칭 수행: 일부라도 일치하면 매칭
-                        score = calculate_match_score(d["skill"], r["needed_skill"])
-                        if score > 0:
-                            matches.append({
-                                "기부자 이름": d["name"],
-                                "기부자 이메일": d["email"],
-                                "기부자 재능": d["skill"],
-                                "방식": d["mode"],
-                                "가능 시간": d.get("availability", ""),
-                                "수요자 이메일": r["email"],
-                                "요청 재능": r["needed_skill"],
-                                "요청 내용": r.get("description", ""),
-                                "수요자 상태": r.get("status", "대기"),
-                                "매칭 점수": score
-                            })
-
-                if matches:
-                    # 매칭 결과를 DataFrame으로 변환
-                    matches_df = pd.DataFrame(matches)
-                    
-                    # 정렬 옵션
-                    sort_match_option = st.selectbox(
-                        "정렬 기준",
-                        ["매칭 점수 (높은순)", "기부자 이름", "수요자 이메일"],
-                        key="sort_match_option"
-                    )
-                    
-                    if sort_match_option == "매칭 점수 (높은순)":
-                        matches_df = matches_df.sort_values("매칭 점수", ascending=False)
-                    elif sort_match_option == "기부자 이름":
-                        matches_df = matches_df.sort_values("기부자 이름", ascending=True)
-                    elif sort_match_option == "수요자 이메일":
-                        matches_df = matches_df.sort_values("수요자 이메일", ascending=True)
-                    
-                    st.dataframe(matches_df, use_container_width=True, hide_index=True)
-                    
-                    # 매칭 통계
-                    st.markdown("---")
-                    st.subheader("📈 매칭 통계")
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("총 매칭 수", len(matches))
-                    with col2:
-                        unique_donors = matches_df["기부자 이메일"].nunique()
-                        st.metric("매칭된 기부자", unique_donors)
-                    with col3:
-                        unique_requests = matches_df["수요자 이메일"].nunique()
-                        st.metric("매칭된 수요자", unique_requests)
-                    
-                    # 다운로드 버튼
-                    csv = matches_df.to_csv(index=False, encoding='utf-8-sig')
-                    st.download_button(
-                        label="📥 매칭 결과 CSV로 다운로드",
-                        data=csv,
-                        file_name=f"매칭_결과_{datetime.now().strftime('%Y%m%d')}.csv",
-                        mime="text/csv",
-                        key="download_matches"
-                    )
-                else:
-                    st.info("현재 매칭 가능한 항목이 없습니다. 재능 키워드를 확인해주세요.")
-
-        except Exception as e:
-            error_msg = str(e)
-            st.error(f"❌ 데이터를 불러오는 중 오류가 발생했습니다: {error_msg}")
-            st.info("💡 문제가 계속되면 README.md 파일을 참고하세요.")
+                    st.metric("매칭된 수요자", matched_requests)
+                with col3:
+                    st.metric("수요자당 평균 매칭", f"{total / matched_requests:.1f}" if matched_requests else "0")
+
+                # 다운로드 버튼 (요청 시에만 전체 목록을 페이지 단위로 조회하여 생성, 데이터 버전/필터/정렬별로 캐시)
+                def match_export_frame():
+                    frames = [match_display_frame(chunk)
+                              for chunk in iter_matches(status_filter, top_k, sort_match_option)]
+                    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+                export_buttons(
+                    "matches",
+                    ("matches", *(get_snapshot_version(t) for t in ("donors", "requests", "matches")),
+                     status_filter, top_k, sort_match_option),
+                    match_export_frame,
+                    "매칭_결과"
+                )
+            else:
+                st.info("현재 매칭 가능한 항목이 없습니다. 재능 키워드를 확인하거나 '🔄 매칭 전체 재계산'을 눌러주세요.")
+
+    except Exception as e:
+        error_msg = str(e)
+        st.error(f"❌ 데이터를 불러오는 중 오류가 발생했습니다: {error_msg}")
+        st.info("💡 문제가 계속되면 README.md 파일을 참고하세요.")
+
+# 화면 구성: 선택된 화면의 함수만 실행되므로 다른 화면의 조회/매칭 비용이 들지 않음
+pages = [
+    st.Page(donor_register_page, title="재능기부자 등록", icon="🤝", url_path="donor_register", default=True),
+    st.Page(request_register_page, title="재능수요자 등록", icon="🙋", url_path="request_register"),
+    st.Page(donors_page, title="기부자 현황", icon="👥", url_path="donors"),
+    st.Page(requests_page, title="수요자 현황", icon="🙋", url_path="requests"),
+    st.Page(matches_page, title="매칭 현황", icon="🔗", url_path="matches"),
+]
+st.navigation(pages).run()
+show_connection_status(connection_status)
+metrics.record_startup("first_render", time.perf_counter() - _script_started)
+
+# 데이터 최신성 표시 (갱신이 늦어지면 마지막으로 받은 데이터를 보여주고 있음을 알림)
+status = data_status(["donors", "requests", "matches"])
+oldest = max(status["stale"].values(), default=0)
+if status["circuit"] != "closed":
+    st.sidebar.warning(f"⚠️ 서버 응답이 불안정하여 마지막으로 받은 데이터를 표시 중입니다 ({oldest:.0f}초 전 기준)")
+elif status["stale"]:
+    st.sidebar.caption(f"🕒 {oldest:.0f}초 전 데이터 표시 중 (백그라운드에서 갱신)")
 
 # 사이드바 하단 정보
 st.sidebar.markdown("---")
@@ -481,3 +602,35 @@ st.sidebar.markdown("""
 3. **현황**: 기부자, 수요자, 매칭 현황을 확인하세요
 """)
 
+def perf_panel(marker):
+    """이번 실행의 구간별 소요 시간과 누적 p50/p95 (사이드바, 선택 시에만 표시)"""
+    total = time.perf_counter() - marker[1]
+    events = metrics.events_since(marker)
+    spent = {kind: sum(e["seconds"] for e in events if e["kind"] == kind)
+             for kind in ("db", "dataframe", "matching")}
+    other = max(total - sum(spent.values()), 0.0)
+    st.sidebar.caption(
+        f"이번 실행 {total * 1000:.0f}ms = DB {spent['db'] * 1000:.0f}ms + "
+        f"DataFrame {spent['dataframe'] * 1000:.0f}ms + 매칭 {spent['matching'] * 1000:.0f}ms + "
+        f"화면/기타 {other * 1000:.0f}ms"
+    )
+    rows = metrics.breakdown(events)
+    if rows:
+        breakdown_df = pd.DataFrame(rows)
+        breakdown_df["ms"] = (breakdown_df.pop("seconds") * 1000).round(1)
+        st.sidebar.dataframe(breakdown_df, hide_index=True, use_container_width=True)
+    with st.sidebar.expander("누적 통계 (p50/p95)"):
+        summary = metrics.summary()
+        if summary:
+            summary_df = pd.DataFrame(summary)
+            for column in ("p50", "p95", "seconds"):
+                summary_df[column] = (summary_df[column] * 1000).round(1)
+            summary_df = summary_df.rename(columns={"p50": "p50_ms", "p95": "p95_ms", "seconds": "total_ms"})
+            st.dataframe(summary_df, hide_index=True, use_container_width=True)
+        st.download_button("📥 JSON", metrics.to_json(), file_name="talent_metrics.json",
+                           mime="application/json", key="perf_json")
+        st.download_button("📥 Prometheus", metrics.to_prometheus(), file_name="talent_metrics.prom",
+                           mime="text/plain", key="perf_prom")
+
+if st.sidebar.toggle("⏱️ 성능 패널", key="perf_panel", disabled=not metrics.enabled()):
+    perf_panel(perf_marker)
@@ -0,0 +1,263 @@
+"""매칭/조회/저장 경로 벤치마크
+
+datagen.py의 합성 데이터로 주요 경로의 실행 시간을 측정하고 결과를 JSON 파일로 저장합니다.
+DB가 필요한 항목은 네트워크 대신 메모리 SQLite 백엔드(local_backend)를 사용하므로
+실행할 때마다 같은 조건으로 비교할 수 있습니다.
+
+사용법:
+    python benchmarks.py --sizes 1000,10000 --output bench.json
+    python benchmarks.py --sizes 1000,10000 --baseline bench.json --output bench_new.json
+    python benchmarks.py --imports database,exporter
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import matching
+from datagen import generate_donors, generate_requests
+
+# app.py 기부자 현황 화면의 {화면 컬럼: DB 컬럼} (find_changed_values에 넘기는 것과 같음)
+DONOR_EDIT_COLUMNS = {
+    "ID": "donor_id",
+    "이름": "name",
+    "이메일": "email",
+    "재능": "skill",
+    "방식": "mode",
+    "가능 시간": "availability",
+}
+
+
+def _measure(run, repeat, setup=None):
+    """run()을 repeat번 실행한 시간(초) 목록 (setup은 매 실행 전에 호출, 측정에서 제외)"""
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _clear_match_caches():
+    matching.normalize_skill.cache_clear()
+    matching.skill_terms.cache_clear()
+    matching.request_text.cache_clear()
+
+
+def bench_calculate_match_score(donors, requests, repeat):
+    """기부자×수요자 쌍별 calculate_match_score (정규화 캐시 비움/유지)"""
+    pair_count = min(len(donors) * len(requests), 20000)
+    rng = np.random.default_rng(0)
+    skills = donors["skill"].to_numpy()[rng.integers(0, len(donors), pair_count)]
+    needed = requests["needed_skill"].to_numpy()[rng.integers(0, len(requests), pair_count)]
+
+    def run():
+        for donor_skill, request_skill in zip(skills, needed):
+            matching.calculate_match_score(donor_skill, request_skill)
+
+    return {
+        "calculate_match_score.cold": (_measure(run, repeat, setup=_clear_match_caches), pair_count),
+        "calculate_match_score.warm": (_measure(run, repeat), pair_count),
+    }
+
+
+def bench_matching(donors, requests, repeat):
+    """매칭 현황 계산 경로: match_frames → SkillIndex → score_pairs, 그리고 top_k_frames"""
+    pairs = matching.match_frames(donors, requests)
+    index = matching.SkillIndex.from_frame(donors)
+    return {
+        "match_frames": (_measure(lambda: matching.match_frames(donors, requests), repeat,
+                                  setup=_clear_match_caches), len(pairs)),
+        "skill_index.build": (_measure(lambda: matching.SkillIndex.from_frame(donors), repeat), len(donors)),
+        "score_pairs": (_measure(lambda: matching.score_pairs(pairs, requests, index), repeat), len(pairs)),
+        "top_k_frames.k5": (_measure(lambda: matching.top_k_frames(donors, requests, 5), repeat), len(requests)),
+    }
+
+
+def _use_memory_backend(database):
+    """database 모듈이 메모리 SQLite 백엔드를 사용하도록 설정"""
+    os.environ["DATABASE_BACKEND"] = "sqlite"
+    os.environ["SQLITE_PATH"] = ":memory:"
+    database.reset_supabase_client()
+    database.invalidate_snapshot()
+    return database.get_supabase_client()
+
+
+def bench_database(donors, requests, repeat):
+    """load_table DataFrame 생성과 편집 저장(바뀐 셀 비교 + bulk_update) 경로"""
+    import database
+
+    client = _use_memory_backend(database)
+    rows = donors.to_dict("records")
+    client.table("donors").insert(rows).execute()
+    client.table("requests").insert(requests.to_dict("records")).execute()
+
+    page_size = database._get_setting("SUPABASE_PAGE_SIZE", 1000)
+    page = rows[:page_size]
+
+    # 기부자 현황 화면처럼 화면 컬럼 이름으로 바꾼 표를 편집하고 바뀐 셀만 비교
+    original = database.load_table("donors").rename(
+        columns={v: k for k, v in DONOR_EDIT_COLUMNS.items()})[list(DONOR_EDIT_COLUMNS)]
+    edited = original.copy()
+    changed_pos = np.random.default_rng(0).choice(len(edited), max(1, len(edited) // 100), replace=False)
+    edited.loc[changed_pos, "가능 시간"] = "벤치마크 수정"
+    updates = database.find_changed_values(original, edited, "ID", DONOR_EDIT_COLUMNS)
+
+    return {
+        "load_table.cold": (_measure(lambda: database.load_table("donors"), repeat,
+                                     setup=lambda: database.invalidate_snapshot("donors")), len(rows)),
+        "load_table.cached": (_measure(lambda: database.load_table("donors"), repeat), len(rows)),
+        "dataframe_from_page": (_measure(lambda: pd.DataFrame(page), repeat), len(page)),
+        "find_changed_values": (_measure(lambda: database.find_changed_values(
+            original, edited, "ID", DONOR_EDIT_COLUMNS), repeat), len(edited)),
+        # 저장 후 백그라운드 매칭 갱신(_refresh_matches)이 끝날 때까지 포함
+        "bulk_update": (_measure(lambda: (database.bulk_update("donors", updates), database.wait_for_matches()),
+                                 repeat), len(updates)),
+    }
+
+
+BENCHMARKS = {
+    "match_score": bench_calculate_match_score,
+    "matching": bench_matching,
+    "database": bench_database,
+}
+
+
+def run_benchmarks(sizes, request_count=200, repeat=3, only=None, progress=None):
+    """크기별 벤치마크 실행
+
+    Args:
+        sizes: 기부자 수 목록 (예: [1000, 10000])
+        request_count: 수요자 수 (모든 크기에서 동일)
+        repeat: 항목별 반복 횟수
+        only: 실행할 BENCHMARKS 키 목록 (None이면 전체)
+        progress: 항목이 끝날 때마다 호출되는 함수 (결과 dict)
+
+    Returns:
+        list: {"name", "size", "rows", "times", "min", "median"} 결과 목록
+    """
+    results = []
+    requests = generate_requests(request_count)
+    for size in sizes:
+        donors = generate_donors(size)
+        for key, bench in BENCHMARKS.items():
+            if only and key not in only:
+                continue
+            for name, (times, rows) in bench(donors, requests, repeat).items():
+                result = {
+                    "name": name,
+                    "size": size,
+                    "rows": int(rows),
+                    "times": times,
+                    "min": min(times),
+                    "median": statistics.median(times),
+                }
+                results.append(result)
+                if progress:
+                    progress(result)
+    return results
+
+
+def compare_results(results, baseline, threshold=1.2):
+    """이전 결과와 중앙값 비교 (threshold배 이상 느려진 항목을 회귀로 표시)
+
+    Returns:
+        list: (이름, 크기, 이전 중앙값, 현재 중앙값, 비율, 회귀 여부)
+    """
+    previous = {(r["name"], r["size"]): r["median"] for r in baseline}
+    rows = []
+    for result in results:
+        before = previous.get((result["name"], result["size"]))
+        if before:
+            ratio = result["median"] / before
+            rows.append((result["name"], result["size"], before, result["median"], ratio, ratio >= threshold))
+    return rows
+
+
+def import_report(modules, top=15):
+    """새 프로세스에서 `python -X importtime`으로 모듈 import 시간을 측정
+
+    Returns:
+        list: 누적 시간이 긴 순서의 (모듈, 자체 시간(초), 누적 시간(초)), 최대 top개
+    """
+    code = "; ".join(f"import {module}" for module in modules)
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                               capture_output=True, text=True,
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6))
+    return sorted(rows, key=lambda row: row[2], reverse=True)[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="매칭/조회/저장 경로 벤치마크")
+    parser.add_argument("--sizes", default="1000,10000", help="쉼표로 구분한 기부자 수 (기본 1000,10000)")
+    parser.add_argument("--requests", type=int, default=200, help="수요자 수 (기본 200)")
+    parser.add_argument("--repeat", type=int, default=3, help="항목별 반복 횟수 (기본 3)")
+    parser.add_argument("--only", help=f"실행할 항목 ({', '.join(BENCHMARKS)}; 쉼표 구분)")
+    parser.add_argument("--output", default="bench_results.json", help="결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=1.2, help="회귀로 볼 중앙값 비율 (기본 1.2)")
+    parser.add_argument("--imports", nargs="?", const="database,exporter,importer,matching",
+                        help="벤치마크 대신 모듈 import 시간 측정 (쉼표 구분, 기본 database,exporter,importer,matching)")
+    parser.add_argument("--top", type=int, default=15, help="--imports에서 표시할 모듈 수 (기본 15)")
+    args = parser.parse_args(argv)
+
+    if args.imports:
+        modules = [module.strip() for module in args.imports.split(",") if module.strip()]
+        print(f"{'모듈':<40} {'자체':>10} {'누적':>10}")
+        for name, self_seconds, cumulative in import_report(modules, args.top):
+            print(f"{name:<40} {self_seconds * 1000:8.1f}ms {cumulative * 1000:8.1f}ms")
+        return 0
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    only = [key.strip() for key in args.only.split(",")] if args.only else None
+
+    def report(result):
+        print(f"{result['name']:<30} n={result['size']:<8} rows={result['rows']:<9} "
+              f"median={result['median'] * 1000:10.2f}ms", file=sys.stderr)
+
+    results = run_benchmarks(sizes, args.requests, args.repeat, only, progress=report)
+    payload = {
+        "created_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "requests": args.requests,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = 0
+        for name, size, before, after, ratio, regressed in compare_results(results, baseline, args.threshold):
+            regressions += regressed
+            print(f"{'회귀' if regressed else '    '} {name:<30} n={size:<8} "
+                  f"{before * 1000:10.2f}ms → {after * 1000:10.2f}ms (x{ratio:.2f})")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
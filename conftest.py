@@ -0,0 +1,34 @@
+"""pytest 공용 fixture"""
+import pandas as pd
+import pytest
+
+import database
+from datagen import generate_donors, generate_requests
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """메모리 SQLite 백엔드(local_backend.LocalClient)에 연결된 database 모듈 (테스트마다 빈 DB)"""
+    monkeypatch.setenv("DATABASE_BACKEND", "sqlite")
+    monkeypatch.setenv("SQLITE_PATH", ":memory:")
+    monkeypatch.setenv("PREFETCH_TABLES", "")
+    monkeypatch.delenv("SNAPSHOT_CACHE_DIR", raising=False)
+    database.reset_supabase_client()
+    database.invalidate_snapshot()
+    yield database
+    database.wait_for_matches()
+    database.reset_supabase_client()
+    database.invalidate_snapshot()
+
+
+@pytest.fixture
+def seeded_db(db):
+    """합성 기부자 300명 / 수요 120건이 들어 있는 db (등록일시가 같은 행이 섞이도록 초 단위를 버림)"""
+    donors = generate_donors(300, seed=5)
+    requests = generate_requests(120, seed=6)
+    for df in (donors, requests):
+        df["created_at"] = pd.to_datetime(df["created_at"]).dt.floor("D").dt.strftime("%Y-%m-%dT%H:%M:%S")
+    client = db.get_supabase_client()
+    client.table("donors").insert(donors.to_dict("records")).execute()
+    client.table("requests").insert(requests.to_dict("records")).execute()
+    return donors, requests
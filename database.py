@@ -1,77 +1,796 @@
+import atexit
+import os
+import random
+import threading
+import time
+from collections import namedtuple
+import numpy as np
 import pandas as pd
-from supabase import create_client, Client
+from datetime import datetime
 import streamlit as st
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from typing import TYPE_CHECKING, Iterator, Optional
+from records import DONOR_MODES, REQUEST_STATUSES
+import metrics
 
-def get_supabase_client() -> Optional[Client]:
-    """Supabase 클라이언트 생성"""
+# supabase와 matching은 처음 사용할 때 import (앱 첫 화면 표시 전에 불러오지 않음)
+if TYPE_CHECKING:
+    from supabase import Client
+    from matching import SkillIndex
+
+# 테이블 스냅샷 캐시 (프로세스 전역, 모든 세션이 공유)
+_snapshot_lock = threading.RLock()
+_snapshots = {}          # (table_name, columns) -> _Snapshot
+_snapshot_versions = {}  # table_name -> int
+_fetch_locks = {}        # (table_name, columns) -> threading.Lock
+_revalidating = set()    # 백그라운드 갱신 중인 (table_name, columns)
+
+# refreshed_at: 마지막 갱신(증분 포함) 시각, full_loaded_at: 마지막 전체 조회 시각
+_Snapshot = namedtuple("_Snapshot", ["refreshed_at", "full_loaded_at", "df"])
+
+# 증분 동기화 기준 컬럼 (우선순위 순)
+WATERMARK_COLUMNS = ["updated_at", "created_at"]
+
+# 테이블별 기본 키 컬럼
+TABLE_ID_COLUMNS = {
+    "donors": "donor_id",
+    "requests": "request_id",
+    "matches": "match_id",
+}
+
+# 스냅샷 컬럼 타입: 값 종류가 적은 컬럼은 category (기본 선택지 + 실제 값), 등록일시는 datetime64
+CATEGORY_COLUMNS = {
+    "mode": DONOR_MODES,
+    "status": REQUEST_STATUSES,
+}
+DATETIME_COLUMNS = ["created_at"]
+
+def _text_dtype():
+    """Arrow 기반 문자열 dtype (결측값은 NaN, pyarrow가 없으면 None → object 유지)"""
     try:
-        # Streamlit secrets에서 Supabase 설정 가져오기
-        url = st.secrets["SUPABASE_URL"]
-        key = st.secrets["SUPABASE_KEY"]
-        
-        if not url or not key:
-            return None
-        
-        # URL이 기본값인지 확인
-        if "your-project-id" in url or "your-anon-key" in key:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    try:
+        return pd.StringDtype("pyarrow", na_value=np.nan)  # pandas >= 2.3
+    except TypeError:
+        try:
+            return pd.StringDtype("pyarrow_numpy")  # pandas 2.1 ~ 2.2
+        except (TypeError, ValueError):
             return None
-        
-        return create_client(url, key)
-    except (KeyError, AttributeError):
-        # secrets에 키가 없거나 secrets가 없는 경우
+
+_TEXT_DTYPE = _text_dtype()
+
+def _compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """조회 결과를 메모리가 적은 타입으로 변환 (category / datetime64 / Arrow 문자열)
+
+    이미 변환된 컬럼은 그대로 두므로 병합/추가 후 다시 호출해도 비용이 적습니다.
+    변환할 수 없는 값이 섞인 컬럼은 원래 타입을 유지합니다.
+    """
+    for column in df.columns:
+        series = df[column]
+        if column in CATEGORY_COLUMNS:
+            observed = [str(v) for v in series.dropna().unique()]
+            known = list(series.cat.categories) if isinstance(series.dtype, pd.CategoricalDtype) else []
+            if not known or any(v not in known for v in observed):
+                categories = list(dict.fromkeys([*CATEGORY_COLUMNS[column], *known, *observed]))
+                df[column] = series.astype(object).astype(pd.CategoricalDtype(categories))
+        elif column in DATETIME_COLUMNS:
+            if not pd.api.types.is_datetime64_any_dtype(series):
+                try:
+                    df[column] = pd.to_datetime(series, format="ISO8601")
+                except (ValueError, TypeError):
+                    pass
+        elif (_TEXT_DTYPE is not None and series.dtype == object and
+                pd.api.types.infer_dtype(series, skipna=True) == "string"):
+            df[column] = series.astype(_TEXT_DTYPE)
+    return df
+
+def _json_value(value):
+    """스냅샷 값을 요청 본문(JSON)에 넣을 수 있는 값으로 변환"""
+    if value is None or (not isinstance(value, (list, dict)) and pd.isna(value)):
         return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _get_setting(name: str, default):
+    """설정값 조회 (Streamlit secrets → 환경 변수 → 기본값 순)"""
+    try:
+        value = st.secrets[name]
     except Exception:
-        # 기타 오류
+        value = os.environ.get(name, default)
+    try:
+        return type(default)(value)
+    except (TypeError, ValueError):
+        return default
+
+def _create_pooled_client(url: str, key: str) -> "Client":
+    """keep-alive 연결 풀을 사용하는 Supabase 클라이언트 생성
+
+    SUPABASE_POOL_SIZE(기본 10), SUPABASE_TIMEOUT(초, 기본 10) 설정을 사용합니다.
+    """
+    from supabase import ClientOptions, create_client
+
+    pool_size = _get_setting("SUPABASE_POOL_SIZE", 10)
+    timeout = _get_setting("SUPABASE_TIMEOUT", 10.0)
+    try:
+        import httpx
+        http_client = httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+        options = ClientOptions(postgrest_client_timeout=timeout, httpx_client=http_client)
+    except (ImportError, TypeError):
+        # httpx_client 옵션이 없는 supabase 버전: 클라이언트 내부 세션을 재사용
+        options = ClientOptions(postgrest_client_timeout=timeout)
+    return create_client(url, key, options=options)
+
+# 프로세스 전역 Supabase 클라이언트 (모든 세션이 공유)
+_client_lock = threading.Lock()
+_client: Optional["Client"] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_health = {"checked_at": None, "ok": False}
+
+def is_local_backend() -> bool:
+    """내장 SQLite 백엔드 사용 여부 (DATABASE_BACKEND 설정, 기본 "supabase")"""
+    return _get_setting("DATABASE_BACKEND", "supabase").strip().lower() == "sqlite"
+
+def get_supabase_client() -> Optional["Client"]:
+    """프로세스 전역 Supabase 클라이언트 반환 (최초 호출 시 한 번만 생성)
+
+    DATABASE_BACKEND = "sqlite"이면 같은 쿼리 인터페이스를 가진 내장 SQLite 클라이언트
+    (local_backend.LocalClient, 파일 경로는 SQLITE_PATH 설정, 기본 talent.db)를 반환합니다.
+    """
+    global _client
+    if _client is not None:
+        return _client
+
+    with _client_lock:
+        if _client is not None:
+            return _client
+        if is_local_backend():
+            from local_backend import LocalClient
+            _client = LocalClient(_get_setting("SQLITE_PATH", "talent.db"))
+            # PostgreSQL 함수(supabase_setup.sql)와 같은 결과를 파이썬으로 계산
+            _client.register_function("match_pairs", _local_match_pairs)
+            return _client
+        try:
+            # Streamlit secrets(없으면 환경 변수)에서 Supabase 설정 가져오기
+            url = _get_setting("SUPABASE_URL", "")
+            key = _get_setting("SUPABASE_KEY", "")
+            
+            if not url or not key:
+                return None
+            
+            # URL이 기본값인지 확인
+            if "your-project-id" in url or "your-anon-key" in key:
+                return None
+            
+            _client = _create_pooled_client(url, key)
+            return _client
+        except (KeyError, AttributeError):
+            # secrets에 키가 없거나 secrets가 없는 경우
+            return None
+        except Exception:
+            # 기타 오류
+            return None
+
+def reset_supabase_client():
+    """전역 Supabase 클라이언트 폐기 (설정 변경 후 재연결용)"""
+    global _client, _match_index
+    with _client_lock:
+        _client = None
+        _health["checked_at"] = None
+    _match_index = None
+    _breaker.reset()
+
+class CircuitOpenError(Exception):
+    """회로 차단기가 열려 있어 요청을 보내지 않은 경우"""
+
+class _CircuitBreaker:
+    """일시적 오류가 CIRCUIT_FAILURES번(기본 5) 연속되면 CIRCUIT_COOLDOWN초(기본 30초) 동안 요청 차단
+
+    대기 시간이 지나면 요청 하나만 시험 삼아 보내고(half-open), 성공하면 다시 정상 상태가 됩니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def state(self) -> str:
+        """"closed"(정상), "open"(차단), "half-open"(시험 요청 가능)"""
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if time.monotonic() - self.opened_at < _get_setting("CIRCUIT_COOLDOWN", 30.0):
+                return "open"
+            return "half-open"
+
+    def before_call(self):
+        with self._lock:
+            if self.opened_at is None:
+                return
+            remaining = _get_setting("CIRCUIT_COOLDOWN", 30.0) - (time.monotonic() - self.opened_at)
+            if remaining > 0 or self._probing:
+                raise CircuitOpenError(
+                    f"서버 오류가 이어져 요청을 잠시 중단했습니다 ({max(remaining, 0):.0f}초 후 다시 시도)")
+            self._probing = True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= _get_setting("CIRCUIT_FAILURES", 5):
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+    def reset(self):
+        self.record_success()
+
+_breaker = _CircuitBreaker()
+
+# 다시 보내도 결과가 같은 작업 (insert는 중복 추가될 수 있으므로 재시도하지 않음, rpc는 읽기 전용 함수만 호출)
+_RETRYABLE_OPERATIONS = {"select", "page", "count", "stats", "update", "upsert", "delete", "rpc"}
+_TRANSIENT_MARKERS = ("timeout", "timed out", "temporarily", "connection", "connecterror",
+                      "readerror", "remoteprotocolerror", "502", "503", "504", "too many requests", "429")
+
+def _is_transient(error: Exception) -> bool:
+    """네트워크 단절/시간 초과/일시적 서버 오류(5xx, 429) 여부"""
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in _TRANSIENT_MARKERS)
+
+def _backoff_delay(attempt: int) -> float:
+    """재시도 대기 시간 (지수 증가 + full jitter, RETRY_BASE_DELAY/RETRY_MAX_DELAY 설정)"""
+    cap = min(_get_setting("RETRY_MAX_DELAY", 2.0), _get_setting("RETRY_BASE_DELAY", 0.2) * 2 ** attempt)
+    return random.uniform(0, cap)
+
+def _execute(query, operation: str, table_name: str):
+    """쿼리 실행 및 계측 (작업, 테이블, 지연 시간, 행 수, 응답 데이터 크기를 metrics에 기록)
+
+    일시적 오류는 멱등 작업에 한해 RETRY_ATTEMPTS번(기본 3)까지 jitter backoff로 다시 시도하며,
+    오류가 이어지면 회로 차단기가 열려 CircuitOpenError를 바로 발생시킵니다.
+    """
+    attempts = max(1, _get_setting("RETRY_ATTEMPTS", 3)) if operation in _RETRYABLE_OPERATIONS else 1
+    for attempt in range(attempts):
+        _breaker.before_call()
+        start = time.perf_counter()
+        try:
+            response = query.execute()
+        except Exception as e:
+            metrics.record("db", operation, table_name, time.perf_counter() - start, error=True)
+            if not _is_transient(e):
+                # 서버가 응답한 오류(권한, 제약 조건 등)는 연결 상태와 무관
+                _breaker.record_success()
+                raise
+            _breaker.record_failure()
+            if attempt == attempts - 1:
+                raise
+            time.sleep(_backoff_delay(attempt))
+            continue
+        _breaker.record_success()
+        seconds = time.perf_counter() - start
+        if metrics.enabled():
+            data = response.data or []
+            metrics.record("db", operation, table_name, seconds, len(data), metrics.payload_bytes(data))
+        return response
+
+def _mark_healthy():
+    """요청 성공 시 연결 상태 캐시 갱신"""
+    _health["checked_at"] = time.monotonic()
+    _health["ok"] = True
+
+def check_connection() -> Optional[bool]:
+    """Supabase 연결 상태 확인 (SUPABASE_HEALTH_TTL초 동안 결과 캐시, 기본 30초)
+
+    Returns:
+        None: 설정 없음, True: 연결됨, False: 연결 실패
+    """
+    client = get_supabase_client()
+    if not client:
         return None
 
+    checked_at = _health["checked_at"]
+    if checked_at is not None and time.monotonic() - checked_at < _get_setting("SUPABASE_HEALTH_TTL", 30.0):
+        return _health["ok"]
+
+    try:
+        _execute(client.table("donors").select("donor_id").limit(1), "select", "donors")
+        _mark_healthy()
+    except Exception:
+        _health["checked_at"] = time.monotonic()
+        _health["ok"] = False
+    return _health["ok"]
+
 def init_database():
     """데이터베이스 초기화 (Supabase는 이미 생성되어 있어야 함)"""
-    # Supabase는 클라우드 데이터베이스이므로 여기서는 연결만 확인
+    # Supabase는 클라우드 데이터베이스이므로 여기서는 클라이언트만 준비
     client = get_supabase_client()
     if client:
         return True
     return False
 
-def load_table(table_name: str) -> pd.DataFrame:
-    """테이블 데이터를 DataFrame으로 로드"""
-    # 설정 확인
+def get_snapshot_version(table_name: str) -> int:
+    """테이블 스냅샷 버전 (데이터가 변경될 때마다 증가)"""
+    with _snapshot_lock:
+        return _snapshot_versions.get(table_name, 0)
+
+def invalidate_snapshot(table_name: Optional[str] = None):
+    """테이블 스냅샷 캐시 무효화 (table_name이 없으면 전체)"""
+    with _snapshot_lock:
+        names = [table_name] if table_name else list({name for name, _ in _snapshots})
+        for name in names:
+            for cache_key in [k for k in _snapshots if k[0] == name]:
+                del _snapshots[cache_key]
+            _snapshot_versions[name] = _snapshot_versions.get(name, 0) + 1
+
+def _store_snapshot(table_name: str, columns: Optional[tuple], df: pd.DataFrame):
+    """스냅샷 저장 및 버전 증가"""
+    with _snapshot_lock:
+        now = time.monotonic()
+        _snapshots[(table_name, columns)] = _Snapshot(now, now, df)
+        _snapshot_versions[table_name] = _snapshot_versions.get(table_name, 0) + 1
+
+def _append_snapshot(table_name: str, rows: list):
+    """추가된 행을 캐시된 스냅샷에 바로 반영 (write-through)"""
+    with _snapshot_lock:
+        cache_keys = [k for k in _snapshots if k[0] == table_name]
+        if not cache_keys or not rows:
+            invalidate_snapshot(table_name)
+            return
+        new_rows = _compact_frame(pd.DataFrame(rows))
+        for cache_key in cache_keys:
+            df = _snapshots[cache_key].df
+            if cache_key[1] is not None:
+                new_rows_projected = new_rows.reindex(columns=list(df.columns))
+            else:
+                new_rows_projected = new_rows
+            df = _compact_frame(pd.concat([df, new_rows_projected], ignore_index=True))
+            _snapshots[cache_key] = _snapshots[cache_key]._replace(df=df)
+        _snapshot_versions[table_name] = _snapshot_versions.get(table_name, 0) + 1
+
+def _snapshot_value(df: pd.DataFrame, column: str, value):
+    """스냅샷 컬럼 타입에 맞게 값 준비 (category에 없는 값은 범주 추가, 등록일시는 Timestamp로)"""
+    if column not in df.columns or value is None:
+        return value
+    dtype = df[column].dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        if value not in dtype.categories:
+            df[column] = df[column].cat.add_categories([value])
+    elif pd.api.types.is_datetime64_any_dtype(dtype) and isinstance(value, str):
+        return pd.Timestamp(value)
+    return value
+
+def _patch_snapshot(table_name: str, updates: dict):
+    """수정된 행들을 캐시된 스냅샷에 바로 반영 (write-through)
+
+    Args:
+        table_name: 테이블 이름
+        updates: {기본 키 값: {컬럼: 값}} 형태의 변경 내용
+    """
+    id_column = TABLE_ID_COLUMNS.get(table_name)
+    with _snapshot_lock:
+        cache_keys = [k for k in _snapshots if k[0] == table_name]
+        if (not cache_keys or id_column is None or
+                any(id_column not in _snapshots[k].df.columns for k in cache_keys)):
+            invalidate_snapshot(table_name)
+            return
+        for cache_key in cache_keys:
+            df = _snapshots[cache_key].df.copy()
+            positions = pd.Index(df[id_column]).get_indexer(list(updates))
+            for pos, values in zip(positions, updates.values()):
+                if pos < 0:
+                    continue
+                for column, value in values.items():
+                    if cache_key[1] is None or column in df.columns:
+                        df.at[df.index[pos], column] = _snapshot_value(df, column, value)
+            _snapshots[cache_key] = _snapshots[cache_key]._replace(df=df)
+        _snapshot_versions[table_name] = _snapshot_versions.get(table_name, 0) + 1
+
+def _select_columns(table_name: str, columns: Optional[list]) -> Optional[tuple]:
+    """조회할 컬럼 목록 정규화 (기본 키 컬럼은 페이지 조회를 위해 항상 포함)"""
+    if not columns:
+        return None
+    id_column = TABLE_ID_COLUMNS.get(table_name)
+    selected = list(dict.fromkeys(columns))
+    if id_column and id_column not in selected:
+        selected.insert(0, id_column)
+    return tuple(selected)
+
+def iter_table_chunks(table_name: str, columns: Optional[list] = None,
+                      page_size: Optional[int] = None,
+                      filters: Optional[list] = None) -> Iterator[pd.DataFrame]:
+    """테이블을 페이지 단위 DataFrame으로 순차 조회 (캐시 사용 안 함)
+
+    기본 키가 알려진 테이블은 기본 키 기준 keyset 페이지네이션(`id > 마지막 id`)을,
+    그 외에는 range 요청을 사용합니다. 빈 페이지가 올 때까지 이어서 조회하므로 page_size가
+    서버의 최대 행 수(PostgREST max-rows, Supabase 기본 1000)보다 커서 페이지가 잘려도
+    빠지는 행이 없습니다.
+
+    Args:
+        table_name: 테이블 이름
+        columns: 조회할 컬럼 목록 (None이면 전체 컬럼)
+        page_size: 페이지당 행 수 (None이면 SUPABASE_PAGE_SIZE 설정, 기본 1000)
+        filters: (연산자, 컬럼, 값) 튜플 리스트 (예: [("gte", "updated_at", "2024-01-01")])
+
+    Yields:
+        pd.DataFrame: 페이지별 DataFrame
+    """
+    client = get_supabase_client()
+    if not client:
+        raise Exception("Supabase 클라이언트를 생성할 수 없습니다.")
+
+    page_size = page_size or _get_setting("SUPABASE_PAGE_SIZE", 1000)
+    selected = _select_columns(table_name, columns)
+    select_clause = ",".join(selected) if selected else "*"
+    id_column = TABLE_ID_COLUMNS.get(table_name)
+
+    last_id = None
+    offset = 0
+    while True:
+        query = client.table(table_name).select(select_clause)
+        for op, column, value in filters or ():
+            query = getattr(query, op)(column, value)
+        if id_column:
+            query = query.order(id_column)
+            if last_id is not None:
+                query = query.gt(id_column, last_id)
+            query = query.limit(page_size)
+        else:
+            query = query.range(offset, offset + page_size - 1)
+        rows = _execute(query, "select", table_name).data or []
+        _mark_healthy()
+        # 서버가 최대 행 수로 페이지를 자를 수 있으므로 빈 페이지가 와야 끝
+        if not rows:
+            break
+        with metrics.timed("dataframe", "build", table_name) as stats:
+            stats["rows"] = len(rows)
+            df = pd.DataFrame(rows)
+        yield df
+        offset += len(rows)
+        if id_column:
+            last_id = rows[-1][id_column]
+
+def _watermark(df: pd.DataFrame) -> Optional[tuple]:
+    """스냅샷의 증분 동기화 기준 (컬럼, 최댓값) 반환 (기준 컬럼이 없으면 None)"""
+    for column in WATERMARK_COLUMNS:
+        if column in df.columns:
+            values = df[column].dropna()
+            if not values.empty:
+                # datetime64로 변환된 컬럼은 저장된 형식(ISO 8601 문자열)으로 되돌려 비교
+                return column, _json_value(values.max())
+    return None
+
+def _merge_delta(table_name: str, df: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """증분 조회 결과를 기본 키 기준으로 스냅샷에 병합"""
+    id_column = TABLE_ID_COLUMNS[table_name]
+    kept = df[~df[id_column].isin(delta[id_column])]
+    return _compact_frame(pd.concat([kept, delta.reindex(columns=df.columns)], ignore_index=True))
+
+def load_table(table_name: str, columns: Optional[list] = None,
+               page_size: Optional[int] = None) -> pd.DataFrame:
+    """테이블 데이터를 DataFrame으로 로드
+
+    세션 간에 공유되는 스냅샷 캐시를 먼저 확인하고, TTL(SNAPSHOT_TTL 설정, 기본 60초)이
+    지난 경우에만 Supabase에서 페이지 단위로 다시 조회합니다.
+    이미 스냅샷이 있으면 `updated_at`(없으면 `created_at`) 최댓값 이후의 행만 조회하여
+    기본 키 기준으로 병합하고, 삭제 반영을 위해 SNAPSHOT_FULL_REFRESH초(기본 3600초)마다
+    전체를 다시 조회합니다.
+    반환된 DataFrame은 캐시의 복사본입니다.
+    SNAPSHOT_CACHE_DIR이 설정되어 있으면 캐시가 빈 상태(재시작 직후)에서는 디스크에 저장된
+    스냅샷을 먼저 반환합니다.
+
+    Args:
+        table_name: 테이블 이름
+        columns: 조회할 컬럼 목록 (None이면 전체 컬럼, 기본 키는 항상 포함)
+        page_size: 페이지당 행 수 (None이면 SUPABASE_PAGE_SIZE 설정)
+    """
+    selected = _select_columns(table_name, columns)
+    with _snapshot_lock:
+        cached = _snapshots.get((table_name, selected))
+    if cached is None and selected is None:
+        # 프로세스 시작 직후: 디스크에 저장된 스냅샷이 있으면 바로 사용하고 백그라운드에서 갱신
+        warm = _load_warm_snapshot(table_name)
+        if warm is not None:
+            _revalidate(table_name, selected, page_size)
+            return warm.copy()
+    if cached is not None:
+        age = time.monotonic() - cached.refreshed_at
+        if age < _get_setting("SNAPSHOT_TTL", 60.0):
+            return cached.df.copy()
+        if age < _get_setting("SNAPSHOT_MAX_STALE", 86400.0):
+            # stale-while-revalidate: 마지막 스냅샷을 바로 반환하고 백그라운드에서 갱신
+            _revalidate(table_name, selected, page_size)
+            return cached.df.copy()
+    return _refresh_snapshot(table_name, selected, page_size).copy()
+
+def _revalidate(table_name: str, selected: Optional[tuple], page_size: Optional[int] = None):
+    """스냅샷 백그라운드 갱신 예약 (같은 스냅샷은 한 번에 하나만)"""
+    cache_key = (table_name, selected)
+    with _snapshot_lock:
+        if cache_key in _revalidating:
+            return
+        _revalidating.add(cache_key)
+
+    def refresh():
+        try:
+            _refresh_snapshot(table_name, selected, page_size, quiet=True)
+        finally:
+            with _snapshot_lock:
+                _revalidating.discard(cache_key)
+
+    _load_executor().submit(refresh)
+
+def snapshot_age(table_name: str) -> Optional[float]:
+    """테이블 스냅샷이 마지막으로 갱신된 뒤 지난 시간(초) (여러 컬럼 조합 중 가장 오래된 값, 없으면 None)"""
+    now = time.monotonic()
+    with _snapshot_lock:
+        ages = [now - snap.refreshed_at for (name, _), snap in _snapshots.items() if name == table_name]
+    return max(ages) if ages else None
+
+def data_status(table_names: list) -> dict:
+    """화면 표시용 데이터 상태
+
+    Returns:
+        dict: {"circuit": 회로 차단기 상태, "stale": {테이블: 경과 초} (TTL이 지난 스냅샷만)}
+    """
+    ttl = _get_setting("SNAPSHOT_TTL", 60.0)
+    stale = {}
+    for name in table_names:
+        age = snapshot_age(name)
+        if age is not None and age >= ttl:
+            stale[name] = age
+    return {"circuit": _breaker.state(), "stale": stale}
+
+def _fetch_lock(cache_key: tuple) -> threading.Lock:
+    """스냅샷별 조회 잠금 (같은 테이블을 동시에 여러 번 조회하지 않도록)"""
+    with _snapshot_lock:
+        return _fetch_locks.setdefault(cache_key, threading.Lock())
+
+def _refresh_snapshot(table_name: str, selected: Optional[tuple],
+                      page_size: Optional[int] = None, quiet: bool = False) -> pd.DataFrame:
+    """스냅샷을 증분 또는 전체 조회로 갱신하여 반환 (다른 스레드가 갱신 중이면 그 결과를 사용)
+
+    quiet=True(백그라운드 갱신)이면 오류 메시지를 표시하지 않습니다.
+    """
+    cache_key = (table_name, selected)
+    with _fetch_lock(cache_key):
+        ttl = _get_setting("SNAPSHOT_TTL", 60.0)
+        full_refresh = _get_setting("SNAPSHOT_FULL_REFRESH", 3600.0)
+        with _snapshot_lock:
+            cached = _snapshots.get(cache_key)
+        now = time.monotonic()
+        if cached is not None and now - cached.refreshed_at < ttl:
+            return cached.df
+
+        mark = _watermark(cached.df) if cached is not None else None
+        if (mark is not None and table_name in TABLE_ID_COLUMNS and
+                now - cached.full_loaded_at < full_refresh):
+            # 기준 시각과 같은 값의 행도 다시 받아 병합 (기본 키 기준이므로 중복되지 않음)
+            delta = _fetch_table(table_name, selected, page_size, filters=[("gte", mark[0], mark[1])], quiet=quiet)
+            if delta is None:
+                return cached.df
+            with _snapshot_lock:
+                current = _snapshots.get(cache_key, cached)
+                df = _merge_delta(table_name, current.df, delta) if not delta.empty else current.df
+                _snapshots[cache_key] = current._replace(refreshed_at=now, df=df)
+                if not delta.empty:
+                    _snapshot_versions[table_name] = _snapshot_versions.get(table_name, 0) + 1
+            if not delta.empty and selected is None:
+                _schedule_persist(table_name)
+            return df
+
+        df = _fetch_table(table_name, selected, page_size, quiet=quiet)
+        if df is None:
+            return cached.df if cached is not None else pd.DataFrame()
+        _store_snapshot(table_name, selected, df)
+        if selected is None:
+            _schedule_persist(table_name)
+        return df
+
+# 디스크 스냅샷 (warm cache): 테이블 → 마지막 저장 시각
+_persisted_at = {}
+
+def _snapshot_path(table_name: str) -> str:
+    """디스크 스냅샷 파일 경로 (SNAPSHOT_CACHE_DIR 설정이 없으면 빈 문자열 → 사용 안 함)"""
+    directory = _get_setting("SNAPSHOT_CACHE_DIR", "")
+    return os.path.join(directory, f"{table_name}.parquet") if directory else ""
+
+def _load_warm_snapshot(table_name: str) -> Optional[pd.DataFrame]:
+    """디스크에 저장된 전체 컬럼 스냅샷으로 빈 캐시를 채움 (없거나 읽을 수 없으면 None)
+
+    SNAPSHOT_MAX_STALE보다 오래된 파일은 사용하지 않습니다. 마지막 전체 조회 시각을 알 수
+    없으므로 TTL이 지난 것으로 표시하여 다음 갱신(백그라운드)은 전체 조회가 됩니다.
+    """
+    path = _snapshot_path(table_name)
+    if not path or not os.path.exists(path):
+        return None
+    age = time.time() - os.path.getmtime(path)
+    if age >= _get_setting("SNAPSHOT_MAX_STALE", 86400.0):
+        return None
     try:
-        url = st.secrets["SUPABASE_URL"]
-        key = st.secrets["SUPABASE_KEY"]
-        
-        # 기본값 확인
-        if "your-project-id" in url or "your-anon-key" in key or not url or not key:
-            st.error("⚠️ Supabase 설정이 필요합니다!\n\n.streamlit/secrets.toml 파일에 실제 Supabase 정보를 입력해주세요.\n\n설정 방법은 SUPABASE_SETUP.md 파일을 참고하세요.")
-            return pd.DataFrame()
-    except (KeyError, AttributeError):
-        st.error("⚠️ Supabase 설정이 필요합니다!\n\n.streamlit/secrets.toml 파일에 SUPABASE_URL과 SUPABASE_KEY를 설정해주세요.")
-        return pd.DataFrame()
+        with metrics.timed("dataframe", "warm", table_name) as stats:
+            df = _compact_frame(pd.read_parquet(path))
+            stats["rows"] = len(df)
+            stats["nbytes"] = os.path.getsize(path)
+    except Exception:
+        # 손상된 파일, pyarrow 없음 등: 일반 조회로 진행
+        return None
+
+    refreshed_at = time.monotonic() - max(age, _get_setting("SNAPSHOT_TTL", 60.0))
+    full_loaded_at = refreshed_at - _get_setting("SNAPSHOT_FULL_REFRESH", 3600.0)
+    with _snapshot_lock:
+        current = _snapshots.get((table_name, None))
+        if current is not None:
+            return current.df
+        _snapshots[(table_name, None)] = _Snapshot(refreshed_at, full_loaded_at, df)
+        _snapshot_versions[table_name] = _snapshot_versions.get(table_name, 0) + 1
+    return df
+
+def persist_snapshots(table_names: Optional[list] = None) -> list:
+    """전체 컬럼 스냅샷을 SNAPSHOT_CACHE_DIR에 Parquet 파일로 저장 (다음 시작 시 warm cache)
+
+    종료 시 자동으로 호출되며, 스냅샷이 갱신될 때도 SNAPSHOT_PERSIST_INTERVAL초(기본 300)마다 저장합니다.
+
+    Returns:
+        list: 저장한 테이블 이름
+    """
+    with _snapshot_lock:
+        frames = {name: snap.df for (name, selected), snap in _snapshots.items()
+                  if selected is None and (table_names is None or name in table_names)}
+    saved = []
+    for table_name, df in frames.items():
+        path = _snapshot_path(table_name)
+        if not path:
+            break
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # 다른 프로세스/스레드가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        df.to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+        with _snapshot_lock:
+            _persisted_at[table_name] = time.monotonic()
+        saved.append(table_name)
+    return saved
+
+def _schedule_persist(table_name: str):
+    """스냅샷 갱신 후 디스크 저장 예약 (SNAPSHOT_PERSIST_INTERVAL초에 한 번)"""
+    if not _snapshot_path(table_name):
+        return
+    now = time.monotonic()
+    with _snapshot_lock:
+        last = _persisted_at.get(table_name)
+        if last is not None and now - last < _get_setting("SNAPSHOT_PERSIST_INTERVAL", 300.0):
+            return
+        _persisted_at[table_name] = now
+
+    def persist():
+        try:
+            persist_snapshots([table_name])
+        except Exception:
+            pass  # warm cache는 선택 기능이므로 저장 실패는 무시
+
+    _load_executor().submit(persist)
+
+def _persist_on_exit():
+    try:
+        persist_snapshots()
+    except Exception:
+        pass
+
+atexit.register(_persist_on_exit)
+
+def _load_executor() -> ThreadPoolExecutor:
+    """테이블 동시 조회용 스레드 풀 (LOAD_WORKERS 설정, 기본 4)"""
+    global _executor
+    with _client_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_get_setting("LOAD_WORKERS", 4),
+                                           thread_name_prefix="talent-load")
+        return _executor
+
+def load_tables(table_names: list, columns: Optional[dict] = None) -> dict:
+    """여러 테이블을 스레드 풀에서 동시에 로드 (대기 시간 ≈ 가장 느린 테이블 한 번)
+
+    캐시가 유효한 테이블은 바로 반환하고, 나머지만 동시에 조회합니다.
+    조회 오류 메시지는 호출한 화면에 표시됩니다.
+
+    Args:
+        table_names: 테이블 이름 목록
+        columns: {테이블 이름: 컬럼 목록} (없는 테이블은 전체 컬럼)
+
+    Returns:
+        dict: {테이블 이름: DataFrame}
+    """
+    columns = columns or {}
+    ctx = get_script_run_ctx()
+    owner = metrics.current_owner()
+
+    def load(table_name):
+        # 작업 스레드에서도 오류 표시와 실행별 계측이 호출한 세션에 연결되도록 함
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        try:
+            with metrics.bind_owner(owner):
+                return load_table(table_name, columns.get(table_name))
+        finally:
+            if ctx is not None:
+                add_script_run_ctx(threading.current_thread(), None)
+
+    futures = {name: _load_executor().submit(load, name) for name in dict.fromkeys(table_names)}
+    return {name: future.result() for name, future in futures.items()}
+
+def prefetch_tables(table_names: Optional[list] = None) -> list:
+    """스냅샷 캐시를 미리 채우도록 백그라운드에서 테이블 조회 시작 (기다리지 않음)
+
+    Args:
+        table_names: 테이블 이름 목록 (None이면 PREFETCH_TABLES 설정,
+            기본 "donors,requests" - 화면이 스냅샷으로 읽는 테이블, 빈 문자열이면 하지 않음)
+
+    Returns:
+        list: 각 테이블의 Future
+    """
+    if table_names is None:
+        setting = _get_setting("PREFETCH_TABLES", "donors,requests")
+        table_names = [name.strip() for name in setting.split(",") if name.strip()]
+    if not table_names:
+        return []
+
+    def prefetch(table_name):
+        # 클라이언트 생성(supabase import 포함)도 작업 스레드에서 처리하여 첫 화면 표시를 막지 않음
+        if get_supabase_client():
+            return load_table(table_name)
+        return None
+
+    return [_load_executor().submit(prefetch, name) for name in table_names]
+
+def _fetch_table(table_name: str, columns: Optional[tuple] = None,
+                 page_size: Optional[int] = None,
+                 filters: Optional[list] = None, quiet: bool = False) -> Optional[pd.DataFrame]:
+    """Supabase에서 테이블을 조회 (오류 시 메시지 표시 후 None 반환, quiet이면 표시하지 않음)"""
+    # 설정 확인 (Streamlit secrets → 환경 변수, 내장 SQLite 백엔드는 Supabase 설정이 필요 없음)
+    url = "" if is_local_backend() else _get_setting("SUPABASE_URL", "")
+    key = "" if is_local_backend() else _get_setting("SUPABASE_KEY", "")
+    if not is_local_backend() and ("your-project-id" in url or "your-anon-key" in key or not url or not key):
+        st.error("⚠️ Supabase 설정이 필요합니다!\n\n.streamlit/secrets.toml 파일(또는 환경 변수)에 SUPABASE_URL과 SUPABASE_KEY를 입력해주세요.\n\n설정 방법은 SUPABASE_SETUP.md 파일을 참고하세요.")
+        return None
     
     client = get_supabase_client()
     if not client:
         st.error("⚠️ Supabase 클라이언트를 생성할 수 없습니다!\n\n.streamlit/secrets.toml 파일의 SUPABASE_URL과 SUPABASE_KEY를 확인해주세요.")
-        return pd.DataFrame()
+        return None
     
     try:
-        response = client.table(table_name).select("*").execute()
-        if response.data:
-            return pd.DataFrame(response.data)
-        else:
-            return pd.DataFrame()
+        chunks = list(iter_table_chunks(table_name, columns, page_size, filters))
+        if not chunks:
+            return pd.DataFrame(columns=list(columns) if columns else None)
+        return _compact_frame(pd.concat(chunks, ignore_index=True))
     except Exception as e:
         error_msg = str(e)
-        if "getaddrinfo failed" in error_msg.lower() or "failed to resolve" in error_msg.lower():
-            try:
-                url = st.secrets["SUPABASE_URL"]
+        if quiet:
+            pass
+        elif isinstance(e, CircuitOpenError):
+            st.warning(f"⚠️ {error_msg}")
+        elif "getaddrinfo failed" in error_msg.lower() or "failed to resolve" in error_msg.lower():
+            if url:
                 st.error(f"⚠️ Supabase 서버에 연결할 수 없습니다!\n\n원인:\n- SUPABASE_URL이 올바르지 않을 수 있습니다 (현재: {url[:60] if len(url) > 60 else url})\n- 인터넷 연결을 확인해주세요\n- Supabase 프로젝트가 활성 상태인지 확인해주세요\n\n설정 확인:\n1. Supabase 대시보드 → Settings → API Keys\n2. 브라우저 주소창에서 Project URL 확인\n3. .streamlit/secrets.toml 파일에 올바른 URL 입력")
-            except:
+            else:
                 st.error(f"⚠️ Supabase 서버에 연결할 수 없습니다!\n\n.streamlit/secrets.toml 파일의 SUPABASE_URL을 확인해주세요.")
         elif "JWT" in error_msg or "unauthorized" in error_msg.lower() or "401" in error_msg:
             st.error(f"⚠️ 인증 오류가 발생했습니다!\n\nSUPABASE_KEY가 올바른지 확인해주세요:\n- Settings → API Keys → Legacy anon, service_role API keys\n- anon public 키를 복사하여 사용")
         else:
             st.error(f"❌ 테이블 조회 오류 ({table_name}): {error_msg}")
-        return pd.DataFrame()
+        return None
 
 def append_row(table_name: str, row_data: dict):
     """테이블에 행 추가
@@ -80,23 +799,20 @@ def append_row(table_name: str, row_data: dict):
         table_name: 테이블 이름 (Donors, Requests, Matches)
         row_data: 딕셔너리 형태의 데이터
     """
-    # 설정 확인
-    try:
-        url = st.secrets["SUPABASE_URL"]
-        key = st.secrets["SUPABASE_KEY"]
-        
-        # 기본값 확인
-        if "your-project-id" in url or "your-anon-key" in key or not url or not key:
-            raise Exception("⚠️ Supabase 설정이 필요합니다!\n\n.streamlit/secrets.toml 파일에 실제 Supabase 정보를 입력해주세요:\n- SUPABASE_URL: Supabase 프로젝트 URL\n- SUPABASE_KEY: anon public 키\n\n설정 방법은 SUPABASE_SETUP.md 파일을 참고하세요.")
-    except (KeyError, AttributeError):
-        raise Exception("⚠️ Supabase 설정이 필요합니다!\n\n.streamlit/secrets.toml 파일에 SUPABASE_URL과 SUPABASE_KEY를 설정해주세요.\n\n설정 방법은 SUPABASE_SETUP.md 파일을 참고하세요.")
+    # 설정 확인 (Streamlit secrets → 환경 변수, 내장 SQLite 백엔드는 Supabase 설정이 필요 없음)
+    url = "" if is_local_backend() else _get_setting("SUPABASE_URL", "")
+    key = "" if is_local_backend() else _get_setting("SUPABASE_KEY", "")
+    if not is_local_backend() and ("your-project-id" in url or "your-anon-key" in key or not url or not key):
+        raise Exception("⚠️ Supabase 설정이 필요합니다!\n\n.streamlit/secrets.toml 파일(또는 환경 변수)에 실제 Supabase 정보를 입력해주세요:\n- SUPABASE_URL: Supabase 프로젝트 URL\n- SUPABASE_KEY: anon public 키\n\n설정 방법은 SUPABASE_SETUP.md 파일을 참고하세요.")
     
     client = get_supabase_client()
     if not client:
         raise Exception("⚠️ Supabase 클라이언트를 생성할 수 없습니다!\n\n.streamlit/secrets.toml 파일의 SUPABASE_URL과 SUPABASE_KEY를 확인해주세요.\n- SUPABASE_URL이 올바른 형식인지 확인 (예: https://xxxxx.supabase.co)\n- SUPABASE_KEY가 올바른 anon public 키인지 확인")
     
     try:
-        response = client.table(table_name).insert(row_data).execute()
+        response = _execute(client.table(table_name).insert(row_data), "insert", table_name)
+        _append_snapshot(table_name, response.data or [row_data])
+        _refresh_matches(table_name, [row_data])
         return response.data
     except Exception as e:
         error_msg = str(e)
@@ -109,6 +825,46 @@ def append_row(table_name: str, row_data: dict):
         else:
             raise Exception(f"데이터 추가 오류: {error_msg}")
 
+def insert_rows(table_name: str, rows: list) -> dict:
+    """여러 행을 multi-row insert로 한 번에 추가
+
+    BULK_CHUNK_SIZE(기본 500)개 단위로 나누어 요청하며, 실패한 묶음은 행 단위로 다시 시도하여
+    어떤 행이 거부되었는지 알 수 있게 합니다.
+
+    Args:
+        table_name: 테이블 이름 (donors, requests)
+        rows: 딕셔너리 형태의 행 리스트
+
+    Returns:
+        dict: {"inserted": 추가된 행 수, "failed": [(행, 오류 메시지), ...]}
+    """
+    if not rows:
+        return {"inserted": 0, "failed": []}
+    client = get_supabase_client()
+    if not client:
+        raise Exception("Supabase 클라이언트를 생성할 수 없습니다.")
+
+    chunk_size = _get_setting("BULK_CHUNK_SIZE", 500)
+    inserted = []
+    failed = []
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        try:
+            response = _execute(client.table(table_name).insert(chunk), "insert", table_name)
+            inserted.extend(response.data or chunk)
+        except Exception:
+            for row in chunk:
+                try:
+                    response = _execute(client.table(table_name).insert(row), "insert", table_name)
+                    inserted.extend(response.data or [row])
+                except Exception as e:
+                    failed.append((row, str(e)))
+
+    _append_snapshot(table_name, inserted)
+    # 매칭 갱신은 기다리지 않음 (완료 대기: wait_for_matches)
+    _refresh_matches(table_name, inserted)
+    return {"inserted": len(inserted), "failed": failed}
+
 def get_donors() -> pd.DataFrame:
     """모든 재능기부자 조회"""
     return load_table("donors")
@@ -121,6 +877,335 @@ def get_matches() -> pd.DataFrame:
     """모든 매칭 조회"""
     return load_table("matches")
 
+# 화면 정렬 옵션 → (정렬 컬럼, 내림차순 여부)
+SORT_OPTIONS = {
+    "등록일시 (최신순)": ("created_at", True),
+    "등록일시 (오래된순)": ("created_at", False),
+    "이름 (가나다순)": ("name", False),
+    "상태": ("status", False),
+    "매칭 점수 (높은순)": ("score", True),
+    "수요자별": ("request_id", False),
+}
+
+# 검색/페이지/개수 결과 캐시: 조건 → (조회 시각, 결과)
+# 이 프로세스의 쓰기는 스냅샷 버전으로 바로 무효화하고, 다른 곳의 변경은 SNAPSHOT_TTL 후 반영
+_query_cache = {}
+_QUERY_CACHE_SIZE = 128
+
+def _postgrest_value(value) -> str:
+    """PostgREST or 필터에 넣을 값 (큰따옴표로 감싸고 역슬래시/큰따옴표 이스케이프)"""
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+def _ilike_pattern(search_term: str) -> str:
+    """PostgREST or 필터에 넣을 ilike 패턴 (부분 일치, 특수문자 이스케이프)"""
+    # LIKE 와일드카드 이스케이프 후, PostgREST 큰따옴표 값 규칙에 맞게 다시 이스케이프
+    like_escaped = search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return _postgrest_value(f"*{like_escaped}*")
+
+def _filtered_query(query, search_columns: list, search_term: str, filters: Optional[list]):
+    """검색어(ilike 부분 일치)와 (연산자, 컬럼, 값) 필터 적용"""
+    if search_term:
+        pattern = _ilike_pattern(search_term)
+        query = query.or_(",".join(f"{column}.ilike.{pattern}" for column in search_columns))
+    for op, column, value in filters or ():
+        query = getattr(query, op)(column, value)
+    return query
+
+def _cached_query(cache_key: tuple, fetch):
+    """조회 결과를 (조건, 스냅샷 버전) 기준으로 SNAPSHOT_TTL초(기본 60초) 동안 캐시
+
+    fetch는 캐시에 없거나 TTL이 지났을 때만 호출합니다. 스냅샷 버전은 이 프로세스의 쓰기와
+    스냅샷 갱신에서만 바뀌므로, 다른 프로세스/외부에서 추가된 행은 TTL로 반영합니다.
+    """
+    ttl = _get_setting("SNAPSHOT_TTL", 60.0)
+    with _snapshot_lock:
+        cached = _query_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+    result = fetch()
+    with _snapshot_lock:
+        _query_cache.pop(cache_key, None)
+        if len(_query_cache) >= _QUERY_CACHE_SIZE:
+            _query_cache.pop(next(iter(_query_cache)))
+        _query_cache[cache_key] = (time.monotonic(), result)
+    return result
+
+def _query_client():
+    client = get_supabase_client()
+    if not client:
+        raise Exception("Supabase 클라이언트를 생성할 수 없습니다.")
+    return client
+
+def _keyset_rows(table_name: str, id_column: str, search_columns: list, search_term: str,
+                 filters: Optional[list], sort_option: Optional[str], after: Optional[tuple],
+                 limit: int) -> list:
+    """(정렬 컬럼, ID) 순서에서 after 다음 행을 최대 limit개 조회 (원래 값 그대로의 행 리스트)"""
+    sort_column, desc = SORT_OPTIONS.get(sort_option, SORT_OPTIONS["등록일시 (최신순)"])
+    query = _filtered_query(_query_client().table(table_name).select("*"),
+                            search_columns, search_term, filters)
+    if after is not None:
+        op = "lt" if desc else "gt"
+        value, row_id = (_postgrest_value(v) for v in after)
+        query = query.or_(f"{sort_column}.{op}.{value},"
+                          f"and({sort_column}.eq.{value},{id_column}.{op}.{row_id})")
+    query = query.order(sort_column, desc=desc).order(id_column, desc=desc)
+    rows = _execute(query.limit(limit), "page", table_name).data or []
+    _mark_healthy()
+    return rows
+
+def _keyset_cursor(rows: list, sort_option: Optional[str], id_column: str) -> tuple:
+    """마지막 행의 키셋 커서 (변환 전 원래 값, 서버 비교에 그대로 사용)"""
+    sort_column = SORT_OPTIONS.get(sort_option, SORT_OPTIONS["등록일시 (최신순)"])[0]
+    return rows[-1][sort_column], rows[-1][id_column]
+
+def query_page(table_name: str, id_column: str, search_columns: list, search_term: str = "",
+               filters: Optional[list] = None, sort_option: Optional[str] = None,
+               after: Optional[tuple] = None, page_size: Optional[int] = None) -> tuple:
+    """키셋 페이지 조회: (정렬 컬럼, ID) 순서에서 after 다음 page_size행만 서버에서 가져옴
+
+    OFFSET과 달리 뒤쪽 페이지도 인덱스로 바로 찾으며, 결과는 (조건, 스냅샷 버전) 기준으로
+    SNAPSHOT_TTL 동안 캐시됩니다.
+
+    Args:
+        table_name: 테이블 이름
+        id_column: 동률을 가르는 기본 키 컬럼 (예: "donor_id")
+        search_columns: 검색어를 부분 일치(ilike)로 찾을 컬럼 목록
+        search_term: 검색어 (빈 문자열이면 검색 조건 없음)
+        filters: (연산자, 컬럼, 값) 튜플 리스트 (예: [("eq", "status", "대기")])
+        sort_option: SORT_OPTIONS의 키 (없으면 등록일시 최신순)
+        after: 이전 페이지가 반환한 커서 (None이면 첫 페이지)
+        page_size: 페이지당 행 수 (None이면 LIST_PAGE_SIZE 설정, 기본 50)
+
+    Returns:
+        tuple: (페이지 DataFrame, 다음 페이지 커서 또는 None)
+    """
+    page_size = page_size or default_page_size()
+
+    def fetch():
+        # 한 행을 더 받아 다음 페이지가 있는지 확인
+        rows = _keyset_rows(table_name, id_column, search_columns, search_term, filters,
+                            sort_option, after, page_size + 1)
+        cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            cursor = _keyset_cursor(rows, sort_option, id_column)
+        return _compact_frame(pd.DataFrame(rows)), cursor
+
+    cache_key = ("page", table_name, id_column, tuple(search_columns), search_term, tuple(filters or ()),
+                 sort_option, after, page_size, get_snapshot_version(table_name))
+    df, cursor = _cached_query(cache_key, fetch)
+    return df.copy(), cursor
+
+def iter_query_pages(table_name: str, id_column: str, search_columns: list, search_term: str = "",
+                     filters: Optional[list] = None, sort_option: Optional[str] = None,
+                     page_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """query_page 조건의 전체 행을 키셋 순서대로 페이지 단위로 조회 (내보내기 등, 캐시 사용 안 함)
+
+    목록 화면과 같은 순서로, 마지막 행의 키셋에서 빈 페이지가 올 때까지 이어서 조회하므로
+    서버의 최대 행 수(Supabase 기본 1000)가 page_size보다 작아 페이지가 잘려도 빠지는 행이 없습니다.
+    """
+    page_size = page_size or _get_setting("SUPABASE_PAGE_SIZE", 1000)
+    after = None
+    while True:
+        rows = _keyset_rows(table_name, id_column, search_columns, search_term, filters,
+                            sort_option, after, page_size)
+        if not rows:
+            break
+        yield _compact_frame(pd.DataFrame(rows))
+        after = _keyset_cursor(rows, sort_option, id_column)
+
+def fetch_rows(table_name: str, ids: list, columns: Optional[list] = None) -> pd.DataFrame:
+    """기본 키 목록에 해당하는 행만 조회 (BULK_CHUNK_SIZE개씩 in 필터, 결과 캐시)
+
+    매칭 목록 한 페이지에 표시할 기부자/수요 정보처럼 일부 행만 필요할 때 사용합니다.
+    """
+    id_column = TABLE_ID_COLUMNS[table_name]
+    ids = sorted(set(ids))
+    selected = _select_columns(table_name, columns)
+    chunk_size = _get_setting("BULK_CHUNK_SIZE", 500)
+
+    def fetch():
+        rows = []
+        for start in range(0, len(ids), chunk_size):
+            query = _query_client().table(table_name).select(",".join(selected) if selected else "*")
+            rows.extend(_execute(query.in_(id_column, ids[start:start + chunk_size]),
+                                 "select", table_name).data or [])
+        _mark_healthy()
+        return _compact_frame(pd.DataFrame(rows, columns=list(selected) if selected and not rows else None))
+
+    cache_key = ("rows", table_name, tuple(ids), selected, get_snapshot_version(table_name))
+    return _cached_query(cache_key, fetch).copy()
+
+def count_rows(table_name: str, search_columns: list = (), search_term: str = "",
+               filters: Optional[list] = None) -> int:
+    """조건에 맞는 행 수 (행을 내려받지 않고 서버에서 개수만 계산, 결과 캐시)"""
+    def fetch():
+        query = _filtered_query(_query_client().table(table_name).select("*", count="exact", head=True),
+                                search_columns, search_term, filters)
+        response = _execute(query, "count", table_name)
+        _mark_healthy()
+        return response.count or 0
+
+    cache_key = ("count", table_name, tuple(search_columns), search_term, tuple(filters or ()),
+                 get_snapshot_version(table_name))
+    return _cached_query(cache_key, fetch)
+
+def snapshot_ttl() -> float:
+    """캐시된 조회 결과를 재사용하는 최대 시간(초) (SNAPSHOT_TTL 설정, 기본 60초)"""
+    return _get_setting("SNAPSHOT_TTL", 60.0)
+
+def default_page_size() -> int:
+    """목록 화면의 기본 페이지당 행 수 (LIST_PAGE_SIZE 설정, 기본 50)"""
+    return _get_setting("LIST_PAGE_SIZE", 50)
+
+DONOR_SEARCH_COLUMNS = ["name", "email", "skill"]
+REQUEST_SEARCH_COLUMNS = ["email", "needed_skill"]
+
+def _request_filters(status_filter: str) -> list:
+    """수요 상태 필터 ("처리 완료"는 '대기'가 아닌 모든 상태)"""
+    if status_filter == "대기":
+        return [("eq", "status", "대기")]
+    if status_filter == "처리 완료":
+        return [("neq", "status", "대기")]
+    return []
+
+def page_donors(search_term: str = "", sort_option: Optional[str] = None,
+                after: Optional[tuple] = None, page_size: Optional[int] = None) -> tuple:
+    """재능기부자 목록 한 페이지와 다음 페이지 커서"""
+    return query_page("donors", "donor_id", DONOR_SEARCH_COLUMNS, search_term,
+                      sort_option=sort_option, after=after, page_size=page_size)
+
+def page_requests(search_term: str = "", status_filter: str = "전체", sort_option: Optional[str] = None,
+                  after: Optional[tuple] = None, page_size: Optional[int] = None) -> tuple:
+    """재능 수요 목록 한 페이지와 다음 페이지 커서"""
+    return query_page("requests", "request_id", REQUEST_SEARCH_COLUMNS, search_term,
+                      _request_filters(status_filter), sort_option, after, page_size)
+
+def iter_donors(search_term: str = "", sort_option: Optional[str] = None) -> Iterator[pd.DataFrame]:
+    """page_donors 조건의 전체 기부자를 페이지 단위로 조회 (내보내기용)"""
+    return iter_query_pages("donors", "donor_id", DONOR_SEARCH_COLUMNS, search_term, sort_option=sort_option)
+
+def iter_requests(search_term: str = "", status_filter: str = "전체",
+                  sort_option: Optional[str] = None) -> Iterator[pd.DataFrame]:
+    """page_requests 조건의 전체 수요를 페이지 단위로 조회 (내보내기용)"""
+    return iter_query_pages("requests", "request_id", REQUEST_SEARCH_COLUMNS, search_term,
+                            _request_filters(status_filter), sort_option)
+
+def count_donors(search_term: str = "") -> int:
+    return count_rows("donors", DONOR_SEARCH_COLUMNS, search_term)
+
+def count_requests(search_term: str = "", status_filter: str = "전체") -> int:
+    return count_rows("requests", REQUEST_SEARCH_COLUMNS, search_term, _request_filters(status_filter))
+
+def _match_filters(status_filter: str, top_k: int) -> list:
+    """매칭 목록 조건: 수요자별 순위 k 이내 + 수요 상태 (matches.status는 수요 상태를 따름)"""
+    return [("lte", "rank", top_k)] + _request_filters(status_filter)
+
+def page_matches(status_filter: str = "전체", top_k: Optional[int] = None, sort_option: Optional[str] = None,
+                 after: Optional[tuple] = None, page_size: Optional[int] = None) -> tuple:
+    """매칭 목록 한 페이지와 다음 페이지 커서 (수요자별 상위 top_k건, 기본 MATCH_TOP_K)"""
+    return query_page("matches", "match_id", [], "", _match_filters(status_filter, top_k or match_top_k()),
+                      sort_option, after, page_size)
+
+def iter_matches(status_filter: str = "전체", top_k: Optional[int] = None,
+                 sort_option: Optional[str] = None) -> Iterator[pd.DataFrame]:
+    """page_matches 조건의 전체 매칭을 페이지 단위로 조회 (내보내기용)"""
+    return iter_query_pages("matches", "match_id", [], "", _match_filters(status_filter, top_k or match_top_k()),
+                            sort_option)
+
+def count_matches(status_filter: str = "전체", top_k: Optional[int] = None, rank: Optional[int] = None) -> int:
+    """조건에 맞는 매칭 수 (rank=1이면 매칭된 수요 수)"""
+    filters = _match_filters(status_filter, top_k or match_top_k())
+    if rank is not None:
+        filters.append(("eq", "rank", rank))
+    return count_rows("matches", filters=filters)
+
+# 통계로 그룹 개수를 세는 컬럼 (supabase_setup.sql의 table_stats 뷰와 같음)
+STATS_COLUMNS = {"donors": "mode", "requests": "status"}
+
+# 테이블별 그룹 개수 캐시: 테이블 → (스냅샷 버전, 갱신 시각, {값: 개수})
+_stats_cache = {}
+
+def _value_counts(df: pd.DataFrame, column: str) -> dict:
+    return {str(value): int(count) for value, count in df[column].value_counts().items() if count}
+
+def _snapshot_counts(table_name: str, column: str) -> Optional[dict]:
+    """TTL 안의 스냅샷이 메모리에 있으면 그 스냅샷에서 그룹 개수 계산 (없으면 None)"""
+    ttl = _get_setting("SNAPSHOT_TTL", 60.0)
+    now = time.monotonic()
+    with _snapshot_lock:
+        frames = [snap.df for (name, selected), snap in _snapshots.items()
+                  if name == table_name and (selected is None or column in selected)
+                  and now - snap.refreshed_at < ttl]
+    return _value_counts(frames[0], column) if frames else None
+
+def table_stats(table_names: Optional[list] = None) -> dict:
+    """테이블별 그룹 개수 (donors는 mode별, requests는 status별)
+
+    행을 내려받지 않고 table_stats 뷰(그룹당 한 행)만 조회합니다. 이미 메모리에 유효한
+    스냅샷이 있으면 조회 없이 스냅샷에서 셉니다. 결과는 스냅샷 버전이 같고 SNAPSHOT_TTL
+    (기본 60초)이 지나지 않은 동안 재사용되므로 등록/수정은 바로 반영됩니다.
+
+    Args:
+        table_names: STATS_COLUMNS의 테이블 목록 (None이면 전체)
+
+    Returns:
+        dict: {테이블: {값: 개수}} (예: {"requests": {"대기": 12, "처리 완료": 3}})
+    """
+    ttl = _get_setting("SNAPSHOT_TTL", 60.0)
+    result, missing = {}, {}
+    for table_name in table_names or list(STATS_COLUMNS):
+        version = get_snapshot_version(table_name)
+        with _snapshot_lock:
+            cached = _stats_cache.get(table_name)
+        if cached and cached[0] == version and time.monotonic() - cached[1] < ttl:
+            result[table_name] = cached[2]
+            continue
+        counts = _snapshot_counts(table_name, STATS_COLUMNS[table_name])
+        if counts is None:
+            missing[table_name] = version
+        else:
+            result[table_name] = counts
+            with _snapshot_lock:
+                _stats_cache[table_name] = (version, time.monotonic(), counts)
+
+    if missing:
+        try:
+            query = _query_client().table("table_stats").select("*").in_("table_name", list(missing))
+            rows = _execute(query, "stats", "table_stats").data or []
+            _mark_healthy()
+            fetched = {name: {} for name in missing}
+            for row in rows:
+                fetched[row["table_name"]][str(row["value"])] = int(row["count"])
+        except CircuitOpenError:
+            raise
+        except Exception:
+            # table_stats 뷰가 아직 없는 데이터베이스: 전체 테이블로 계산
+            fetched = {name: _value_counts(load_table(name, [STATS_COLUMNS[name]]), STATS_COLUMNS[name])
+                       for name in missing}
+        for table_name, version in missing.items():
+            counts = fetched[table_name]
+            result[table_name] = counts
+            with _snapshot_lock:
+                _stats_cache[table_name] = (version, time.monotonic(), counts)
+    return result
+
+def donor_stats() -> dict:
+    """기부자 현황 통계: 전체, 온라인 가능("온라인" 포함 방식), 오프라인 가능("오프라인" 포함 방식)"""
+    modes = table_stats(["donors"])["donors"]
+    return {
+        "total": sum(modes.values()),
+        "online": sum(count for mode, count in modes.items() if "온라인" in mode),
+        "offline": sum(count for mode, count in modes.items() if "오프라인" in mode),
+    }
+
+def request_stats() -> dict:
+    """수요자 현황 통계: 전체, 대기 중, 처리 완료('대기'가 아닌 모든 상태)"""
+    statuses = table_stats(["requests"])["requests"]
+    total = sum(statuses.values())
+    waiting = statuses.get("대기", 0)
+    return {"total": total, "waiting": waiting, "completed": total - waiting}
+
 def update_donor(donor_id: str, name: str, email: str, skill: str, mode: str, availability: str):
     """재능기부자 정보 업데이트"""
     client = get_supabase_client()
@@ -135,7 +1220,9 @@ def update_donor(donor_id: str, name: str, email: str, skill: str, mode: str, av
             "mode": mode,
             "availability": availability
         }
-        response = client.table("donors").update(update_data).eq("donor_id", donor_id).execute()
+        response = _execute(client.table("donors").update(update_data).eq("donor_id", donor_id), "update", "donors")
+        _patch_snapshot("donors", {donor_id: update_data})
+        _refresh_matches("donors", [{"donor_id": donor_id, **update_data}])
         return response.data
     except Exception as e:
         raise Exception(f"데이터 업데이트 오류: {str(e)}")
@@ -153,7 +1240,465 @@ def update_request(request_id: str, email: str, needed_skill: str, description:
             "description": description,
             "status": status
         }
-        response = client.table("requests").update(update_data).eq("request_id", request_id).execute()
+        response = _execute(client.table("requests").update(update_data).eq("request_id", request_id), "update", "requests")
+        _patch_snapshot("requests", {request_id: update_data})
+        _refresh_matches("requests", [{"request_id": request_id, **update_data}])
         return response.data
     except Exception as e:
         raise Exception(f"데이터 업데이트 오류: {str(e)}")
+
+def _uncategorize(df: pd.DataFrame) -> pd.DataFrame:
+    """category 컬럼을 일반 값으로 변환 (범주 목록이 다른 컬럼끼리도 값 기준으로 비교하기 위해)"""
+    columns = {c: object for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)}
+    return df.astype(columns) if columns else df
+
+def _changed_cells(original_df: pd.DataFrame, edited_df: pd.DataFrame,
+                   id_column: str, compare_columns: list) -> pd.DataFrame:
+    """편집 후 행별·컬럼별 변경 여부 (ID를 인덱스로 하는 bool DataFrame, 벡터 연산)"""
+    edited = _uncategorize(edited_df.set_index(id_column)[compare_columns])
+    original = _uncategorize(original_df.set_index(id_column)[compare_columns]).reindex(edited.index)
+    return edited.ne(original) & ~(edited.isna() & original.isna())
+
+def find_changed_values(original_df: pd.DataFrame, edited_df: pd.DataFrame,
+                        id_column: str, columns: dict) -> list:
+    """편집 전후 DataFrame을 비교하여 실제로 바뀐 셀만 bulk_update용 행으로 반환
+
+    Args:
+        original_df: 편집 전 DataFrame
+        edited_df: 편집 후 DataFrame
+        id_column: 행을 식별하는 컬럼
+        columns: {화면 컬럼: DB 컬럼} (id_column 포함, 나머지는 비교 대상)
+
+    Returns:
+        list: [{기본 키: 값, 바뀐 DB 컬럼: 새 값, ...}] (빈 값은 "")
+    """
+    if edited_df.empty:
+        return []
+    compare_columns = [c for c in columns if c != id_column]
+    differs = _changed_cells(original_df, edited_df, id_column, compare_columns)
+    differs = differs[differs.any(axis=1)]
+    edited = edited_df.set_index(id_column)
+    rows = []
+    for row_id, flags in zip(differs.index, differs.to_dict("records")):
+        row = {columns[id_column]: row_id}
+        for column, changed in flags.items():
+            if changed:
+                value = _json_value(edited.at[row_id, column])
+                row[columns[column]] = "" if value is None else value
+        rows.append(row)
+    return rows
+
+def bulk_update(table_name: str, rows: list) -> dict:
+    """여러 행의 변경된 컬럼만 update로 저장
+
+    변경 내용(컬럼과 값)이 같은 행끼리 묶어 BULK_CHUNK_SIZE(기본 500)개 단위의
+    `update(...).in_(기본 키, ...)` 요청으로 보내고, 실패한 묶음은 행 단위로 다시 시도하여
+    어떤 행이 실패했는지 알 수 있게 합니다. 전달되지 않은 컬럼은 서버 값을 그대로 두며,
+    캐시된 스냅샷 값으로 채우지 않습니다 (다른 곳에서 바꾼 값을 덮어쓰지 않도록).
+
+    Args:
+        table_name: 테이블 이름 (donors, requests)
+        rows: 기본 키와 변경할 컬럼만 담은 딕셔너리 리스트
+
+    Returns:
+        dict: {기본 키 값: 성공 여부} (서버에 없는 행은 실패)
+    """
+    if not rows:
+        return {}
+    client = get_supabase_client()
+    if not client:
+        raise Exception("Supabase 클라이언트를 생성할 수 없습니다.")
+
+    id_column = TABLE_ID_COLUMNS[table_name]
+    chunk_size = _get_setting("BULK_CHUNK_SIZE", 500)
+    groups = {}  # (변경 컬럼, 값) 튜플 -> 기본 키 목록
+    for row in rows:
+        changes = tuple(sorted((k, v) for k, v in row.items() if k != id_column))
+        groups.setdefault(changes, []).append(row[id_column])
+
+    results = {}
+    updated_rows = []  # 서버가 돌려준 수정 후 전체 행 (매칭 갱신용)
+    for changes, ids in groups.items():
+        values = dict(changes)
+        if not values:
+            results.update({row_id: True for row_id in ids})
+            continue
+        for start in range(0, len(ids), chunk_size):
+            chunk_ids = ids[start:start + chunk_size]
+            try:
+                response = _execute(client.table(table_name).update(values).in_(id_column, chunk_ids),
+                                    "update", table_name)
+                data = response.data or []
+            except Exception:
+                data = []
+                for row_id in chunk_ids:
+                    try:
+                        response = _execute(client.table(table_name).update(values).eq(id_column, row_id),
+                                            "update", table_name)
+                        data.extend(response.data or [])
+                    except Exception:
+                        pass
+            found = {row[id_column] for row in data}
+            results.update({row_id: row_id in found for row_id in chunk_ids})
+            updated_rows.extend(data)
+
+    _patch_snapshot(table_name, {
+        row[id_column]: {k: v for k, v in row.items() if k != id_column}
+        for row in rows if results.get(row[id_column])
+    })
+    _refresh_matches(table_name, updated_rows)
+    return results
+
+def match_top_k() -> int:
+    """matches 테이블에 저장하는 수요자별 최대 기부자 수 (MATCH_TOP_K 설정, 기본 20)"""
+    return max(1, int(_get_setting("MATCH_TOP_K", 20)))
+
+def _match_rows(pairs: pd.DataFrame, statuses: pd.Series) -> list:
+    """매칭 쌍을 matches 테이블 행으로 변환 (rank는 수요자별 점수 순위, status는 수요 상태를 따름)"""
+    if pairs.empty:
+        return []
+    created_at = datetime.now().isoformat()
+    pairs = pairs.sort_values("score", ascending=False, kind="stable")
+    pairs = pairs.assign(
+        match_id=pairs["donor_id"].astype(str) + ":" + pairs["request_id"].astype(str),
+        rank=pairs.groupby("request_id", sort=False).cumcount() + 1,
+        status=pairs["request_id"].map(statuses).fillna("대기"),
+        created_at=created_at,
+    )
+    return pairs[["match_id", "donor_id", "request_id", "score", "rank", "status", "created_at"]].to_dict("records")
+
+def _sync_matches(client, id_column: Optional[str], ids: list, match_rows: list):
+    """matches 테이블에 새 매칭을 upsert하고, 해당 ID의 기존 매칭 중 사라진 쌍을 삭제
+
+    Args:
+        client: Supabase 클라이언트
+        id_column: 범위를 한정할 컬럼 (donor_id/request_id, None이면 전체 테이블)
+        ids: id_column 값 목록
+        match_rows: 새로 계산된 매칭 행
+    """
+    chunk_size = _get_setting("BULK_CHUNK_SIZE", 500)
+
+    # 기존 매칭 ID 조회
+    existing = set()
+    if id_column is None:
+        for chunk in iter_table_chunks("matches", ["match_id"]):
+            existing.update(chunk["match_id"])
+    else:
+        for start in range(0, len(ids), chunk_size):
+            chunk_ids = ids[start:start + chunk_size]
+            for chunk in iter_table_chunks("matches", ["match_id"], filters=[("in_", id_column, chunk_ids)]):
+                existing.update(chunk["match_id"])
+
+    for start in range(0, len(match_rows), chunk_size):
+        _execute(client.table("matches").upsert(match_rows[start:start + chunk_size], on_conflict="match_id"),
+                 "upsert", "matches")
+
+    stale = sorted(existing - {row["match_id"] for row in match_rows})
+    for start in range(0, len(stale), chunk_size):
+        _execute(client.table("matches").delete().in_("match_id", stale[start:start + chunk_size]),
+                 "delete", "matches")
+
+    invalidate_snapshot("matches")
+
+def _score_matches(index: "SkillIndex", requests_df: pd.DataFrame, operation: str) -> pd.DataFrame:
+    """수요자별 점수 상위 match_top_k()명 계산 (평가한 쌍 수, 매칭 수, 시간을 metrics에 기록)
+
+    결과 크기는 k × 수요자 수로 제한됩니다 (matching.top_k_frames).
+
+    Args:
+        index: 전체 기부자 SkillIndex (희소도 계산 기준)
+        requests_df: request_id, needed_skill 컬럼을 가진 수요 DataFrame
+        operation: 계측 작업 이름 (refresh, rebuild)
+    """
+    from matching import top_k_frames
+
+    with metrics.timed("matching", operation, "matches") as stats:
+        pairs = top_k_frames(None, requests_df, match_top_k(), index)
+        stats["pairs"] = len(index) * len(requests_df)
+        stats["matches"] = stats["rows"] = len(pairs)
+    return pairs
+
+class _MatchIndex:
+    """매칭 갱신용 기부자/수요 색인 (프로세스 전역, _matches_lock 안에서만 사용)
+
+    처음 한 번 서버에서 전체를 읽어 만들고, 이후에는 마지막으로 본 updated_at(없으면 created_at)
+    이후에 바뀐 행만 받아 SkillIndex에 반영합니다. 화면용 스냅샷(오래된 값을 돌려줄 수 있는
+    stale-while-revalidate/디스크 캐시)은 사용하지 않습니다.
+    """
+
+    def __init__(self):
+        from matching import SkillIndex
+
+        self.donors = SkillIndex()
+        # 수요 재능 색인: lookup(기부자 재능) → 그 기부자와 wild 매칭되는 수요 ID
+        self.requests = SkillIndex()
+        self.request_rows = {}  # request_id → (needed_skill, status)
+        self.marks = {}         # 테이블 → 증분 조회 기준 (컬럼, 값)
+        self.loaded_at = time.monotonic()
+
+    def apply(self, table_name: str, df: pd.DataFrame):
+        """서버에서 받은 행을 색인에 반영 (같은 ID는 덮어씀)"""
+        if df.empty:
+            return
+        if table_name == "donors":
+            for donor_id, skill in zip(df["donor_id"].tolist(), df["skill"].tolist()):
+                self.donors.add(donor_id, skill)
+        else:
+            statuses = df["status"].tolist() if "status" in df else ["대기"] * len(df)
+            for request_id, needed, status in zip(df["request_id"].tolist(), df["needed_skill"].tolist(), statuses):
+                self.requests.add(request_id, needed)
+                self.request_rows[request_id] = (needed, status)
+
+    def sync(self, table_name: str, filters: Optional[list] = None):
+        """조건에 맞는 행을 서버에서 받아 반영하고, 끝까지 받은 경우에만 증분 기준을 올림"""
+        mark = self.marks.get(table_name)
+        for chunk in iter_table_chunks(table_name, filters=filters):
+            self.apply(table_name, chunk)
+            chunk_mark = _watermark(chunk)
+            if chunk_mark is not None and (mark is None or chunk_mark[1] > mark[1]):
+                mark = chunk_mark
+        if mark is not None:
+            self.marks[table_name] = mark
+
+    def requests_frame(self, request_ids: list) -> pd.DataFrame:
+        rows = [(request_id, *self.request_rows[request_id])
+                for request_id in request_ids if request_id in self.request_rows]
+        return pd.DataFrame(rows, columns=["request_id", "needed_skill", "status"])
+
+_match_index: Optional[_MatchIndex] = None
+
+def _fresh_match_index(table_name: Optional[str] = None, ids: tuple = (), reload: bool = False) -> _MatchIndex:
+    """서버 기준 최신 매칭 색인 (_matches_lock 안에서 호출)
+
+    SNAPSHOT_FULL_REFRESH초(기본 3600초)마다 또는 reload=True이면 전체를 다시 읽고(삭제 반영),
+    그 사이에는 증분 기준 이후에 바뀐 행만 받습니다. 방금 저장한 행(table_name, ids)은
+    기준 시각과 관계없이 ID로 다시 읽어 반영합니다.
+    """
+    global _match_index
+    index = _match_index
+    if (reload or index is None or
+            time.monotonic() - index.loaded_at >= _get_setting("SNAPSHOT_FULL_REFRESH", 3600.0)):
+        index = _MatchIndex()
+        for name in ("donors", "requests"):
+            index.sync(name)
+        _match_index = index
+    else:
+        for name in ("donors", "requests"):
+            mark = index.marks.get(name)
+            # 기준 시각과 같은 값의 행도 다시 받음 (ID 기준으로 덮어쓰므로 중복되지 않음)
+            index.sync(name, [("gte", mark[0], mark[1])] if mark else None)
+    if table_name and ids:
+        id_column = TABLE_ID_COLUMNS[table_name]
+        chunk_size = _get_setting("BULK_CHUNK_SIZE", 500)
+        for start in range(0, len(ids), chunk_size):
+            for chunk in iter_table_chunks(table_name, filters=[("in_", id_column, list(ids[start:start + chunk_size]))]):
+                index.apply(table_name, chunk)
+    return index
+
+def _requests_for_donors(index: _MatchIndex, donor_ids: list) -> set:
+    """기부자들의 변경으로 상위 k명이 달라질 수 있는 수요 ID (비용은 변경된 기부자 수에 비례)
+
+    지금 재능으로 매칭되는 수요와 이미 matches에 저장된 수요(이전 재능으로 매칭되던 수요)를 합칩니다.
+    Supabase에서는 서버 함수 match_pairs로 찾고(함수가 없으면 수요 재능 색인 사용),
+    내장 SQLite 백엔드는 같은 규칙의 수요 재능 색인으로 바로 찾습니다.
+    """
+    chunk_size = _get_setting("BULK_CHUNK_SIZE", 500)
+    chunks = [donor_ids[start:start + chunk_size] for start in range(0, len(donor_ids), chunk_size)]
+
+    affected = None
+    if not is_local_backend():
+        page_size = _get_setting("SUPABASE_PAGE_SIZE", 1000)
+        try:
+            affected = set()
+            for chunk in chunks:
+                offset = 0
+                # 서버의 최대 행 수 제한으로 페이지가 잘려도 빈 페이지가 올 때까지 이어서 조회
+                while True:
+                    pairs = server_match_pairs(limit=page_size, offset=offset, donor_ids=chunk)
+                    if pairs.empty:
+                        break
+                    affected.update(pairs["request_id"])
+                    offset += len(pairs)
+        except CircuitOpenError:
+            raise
+        except Exception:
+            # match_pairs 함수가 아직 없는 데이터베이스
+            affected = None
+    if affected is None:
+        skills = {index.donors.skill(donor_id) for donor_id in donor_ids}
+        affected = set()
+        for skill in skills:
+            if isinstance(skill, str):
+                affected.update(index.requests.lookup(skill))
+
+    for chunk in chunks:
+        for rows in iter_table_chunks("matches", ["request_id"], filters=[("in_", "donor_id", chunk)]):
+            affected.update(rows["request_id"])
+    return affected
+
+# 매칭 갱신은 한 번에 하나씩 (백그라운드 갱신과 전체 재계산이 서로 덮어쓰지 않도록)
+_matches_lock = threading.Lock()
+_pending_matches = {}  # 백그라운드 갱신 대기 중인 테이블 → 행 리스트
+_pending_lock = threading.Lock()
+_match_worker = None   # 대기 행을 처리 중인 작업 (Future)
+
+def _update_matches(table_name: str, rows: list):
+    """변경된 기부자/수요의 영향을 받는 수요만 상위 k명을 다시 계산하여 matches 테이블에 반영
+
+    기부자 색인은 캐시하여 바뀐 행만 반영하고, 점수 계산 전에 서버에서 바뀐 행을 받아
+    최신 상태로 맞춥니다 (_fresh_match_index).
+    """
+    client = get_supabase_client()
+    if not client:
+        return
+    id_column = TABLE_ID_COLUMNS[table_name]
+    ids = tuple(dict.fromkeys(row[id_column] for row in rows if row.get(id_column) is not None))
+    with _matches_lock:
+        index = _fresh_match_index(table_name, ids)
+        if table_name == "donors":
+            target_ids = sorted(_requests_for_donors(index, list(ids)))
+        else:
+            target_ids = list(ids)
+        targets = index.requests_frame(target_ids)
+        if targets.empty:
+            return
+        pairs = _score_matches(index.donors, targets, "refresh")
+        statuses = targets.set_index("request_id")["status"]
+        _sync_matches(client, "request_id", targets["request_id"].tolist(), _match_rows(pairs, statuses))
+
+def _drain_match_refreshes():
+    """대기 중인 백그라운드 매칭 갱신을 테이블별로 모아서 처리"""
+    global _match_worker
+    while True:
+        with _pending_lock:
+            if not _pending_matches:
+                _match_worker = None
+                return
+            table_name, rows = _pending_matches.popitem()
+        try:
+            _update_matches(table_name, rows)
+        except Exception:
+            # 실패는 metrics에 기록되며, 다음 갱신이나 rebuild_matches에서 복구됨
+            invalidate_snapshot("matches")
+
+def _refresh_matches(table_name: str, rows: list):
+    """추가/수정된 기부자 또는 수요의 영향을 받는 수요만 상위 k명을 다시 계산하도록 예약
+
+    모든 쓰기 경로(등록, 수정, 일괄 등록/수정)에서 호출되며, 작업 스레드에서 처리하고 바로
+    반환하므로 저장이 매칭 계산을 기다리지 않습니다 (완료 대기: wait_for_matches).
+    저장 크기는 수요자당 최대 MATCH_TOP_K(기본 20)건이며, 갱신이 실패해도 원래 저장은 유지됩니다.
+    점수의 희소도 가중치는 다른 행에도 영향을 주므로 주기적으로 rebuild_matches로 전체를 갱신하세요.
+    """
+    global _match_worker
+    if table_name not in ("donors", "requests") or not rows:
+        return
+    with _pending_lock:
+        _pending_matches.setdefault(table_name, []).extend(rows)
+        if _match_worker is None:
+            _match_worker = _load_executor().submit(_drain_match_refreshes)
+
+def matches_pending() -> bool:
+    """백그라운드 매칭 갱신이 대기 중이거나 진행 중인지 여부"""
+    with _pending_lock:
+        return _match_worker is not None
+
+def wait_for_matches(timeout: Optional[float] = None) -> bool:
+    """백그라운드 매칭 갱신이 모두 끝날 때까지 대기
+
+    Returns:
+        bool: 완료 여부 (timeout초 안에 끝나지 않으면 False)
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        with _pending_lock:
+            worker = _match_worker
+        if worker is None:
+            return True
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            return False
+        try:
+            worker.result(timeout=remaining)
+        except TimeoutError:
+            return False
+
+def store_matches(pairs: pd.DataFrame, requests_df: pd.DataFrame) -> int:
+    """계산된 전체 매칭으로 matches 테이블을 교체 (upsert 후 사라진 매칭 삭제)
+
+    Args:
+        pairs: donor_id, request_id, score 컬럼을 가진 전체 매칭 DataFrame (수요자별 상위 k명)
+        requests_df: request_id, status 컬럼을 가진 수요 DataFrame (매칭 상태 기준)
+
+    Returns:
+        int: 저장된 매칭 수
+    """
+    client = get_supabase_client()
+    if not client:
+        raise Exception("Supabase 클라이언트를 생성할 수 없습니다.")
+    statuses = requests_df.set_index("request_id")["status"] if not requests_df.empty else pd.Series(dtype=object)
+    match_rows = _match_rows(pairs, statuses)
+    _sync_matches(client, None, [], match_rows)
+    return len(match_rows)
+
+def rebuild_matches() -> int:
+    """모든 수요의 상위 k명 매칭을 다시 계산하여 matches 테이블 전체를 갱신
+
+    서버에서 기부자/수요 전체를 다시 읽어 매칭 색인도 새로 만듭니다 (희소도 가중치 갱신).
+
+    Returns:
+        int: 매칭 수
+    """
+    with _matches_lock:
+        index = _fresh_match_index(reload=True)
+        requests_df = index.requests_frame(list(index.request_rows))
+        pairs = _score_matches(index.donors, requests_df, "rebuild")
+        return store_matches(pairs, requests_df)
+
+def _status_params(status_filter: str) -> dict:
+    """상태 필터 → match_pairs 함수 인자 ("처리 완료"는 '대기'가 아닌 모든 상태)"""
+    if status_filter == "대기":
+        return {"p_status": "대기", "p_exclude_status": False}
+    if status_filter == "처리 완료":
+        return {"p_status": "대기", "p_exclude_status": True}
+    return {"p_status": None, "p_exclude_status": False}
+
+def server_match_pairs(status_filter: str = "전체", limit: int = 1000, offset: int = 0,
+                       donor_ids: Optional[list] = None) -> pd.DataFrame:
+    """서버의 SQL 함수 match_pairs로 매칭 쌍 조회 (두 테이블을 내려받지 않음)
+
+    calculate_match_score와 같은 규칙으로 매칭된 쌍만 score 1로 반환하며,
+    단계별 점수가 필요하면 score_pairs로 다시 계산합니다.
+
+    Args:
+        status_filter: "전체", "대기", "처리 완료" (수요 상태 기준)
+        limit: 최대 쌍 수
+        offset: 건너뛸 쌍 수 (수요 ID → 기부자 ID 순)
+        donor_ids: 이 기부자들의 쌍만 (None이면 전체)
+
+    Returns:
+        pd.DataFrame: donor_id, request_id, score 컬럼
+    """
+    client = get_supabase_client()
+    if not client:
+        raise Exception("Supabase 클라이언트를 생성할 수 없습니다.")
+    params = {**_status_params(status_filter), "p_limit": int(limit), "p_offset": int(offset)}
+    if donor_ids is not None:
+        params["p_donor_ids"] = list(donor_ids)
+    response = _execute(client.rpc("match_pairs", params), "rpc", "match_pairs")
+    return pd.DataFrame(response.data or [], columns=["donor_id", "request_id", "score"])
+
+def _local_match_pairs(client, p_status: Optional[str] = None, p_exclude_status: bool = False,
+                       p_limit: int = 1000, p_offset: int = 0, p_donor_ids: Optional[list] = None) -> list:
+    """로컬 백엔드용 match_pairs (match_frames로 계산, 정렬/페이지 규칙은 SQL 함수와 동일)"""
+    from matching import match_frames
+
+    donors_df = pd.DataFrame(client.table("donors").select("donor_id,skill").execute().data,
+                             columns=["donor_id", "skill"])
+    requests_df = pd.DataFrame(client.table("requests").select("request_id,needed_skill,status").execute().data,
+                               columns=["request_id", "needed_skill", "status"])
+    if p_status is not None:
+        requests_df = requests_df[(requests_df["status"] == p_status) != p_exclude_status]
+    if p_donor_ids is not None:
+        donors_df = donors_df[donors_df["donor_id"].isin(p_donor_ids)]
+    pairs = match_frames(donors_df, requests_df).sort_values(["request_id", "donor_id"])
+    return pairs.iloc[p_offset:p_offset + p_limit].to_dict("records")
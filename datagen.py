@@ -0,0 +1,155 @@
+"""벤치마크/부하 테스트용 합성 재능기부자·수요자 데이터 생성
+
+supabase_setup.sql과 같은 컬럼의 DataFrame을 만듭니다. 재능은 한국어/영어가 섞인
+쉼표 구분 문자열이고, 재능 인기도는 Zipf 분포를 따르므로 일부 재능에 매칭이 몰립니다.
+같은 seed는 항상 같은 데이터를 만듭니다.
+
+사용법:
+    python datagen.py donors 10000 donors.csv
+    python datagen.py requests 100000 requests.parquet --seed 7
+"""
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from records import DONOR_MODES, REQUEST_STATUSES
+
+# (한국어, 영어) 재능 표기 (앞쪽일수록 인기 있음)
+SKILL_VOCAB = [
+    ("파이썬", "Python"), ("영어", "English"), ("수학", "Math"), ("코딩", "Coding"),
+    ("디자인", "Design"), ("피아노", "Piano"), ("데이터 분석", "Data Analysis"),
+    ("자바", "Java"), ("자바스크립트", "JavaScript"), ("웹 개발", "Web Development"),
+    ("사진 촬영", "Photography"), ("영상 편집", "Video Editing"), ("기타 연주", "Guitar"),
+    ("요리", "Cooking"), ("중국어", "Chinese"), ("일본어", "Japanese"), ("글쓰기", "Writing"),
+    ("마케팅", "Marketing"), ("회계", "Accounting"), ("법률 상담", "Legal Advice"),
+    ("심리 상담", "Counseling"), ("운동 코칭", "Fitness Coaching"), ("그림", "Drawing"),
+    ("바이올린", "Violin"), ("엑셀", "Excel"), ("포토샵", "Photoshop"), ("머신러닝", "Machine Learning"),
+    ("논술", "Essay Writing"), ("과학 실험", "Science Experiments"), ("역사", "History"),
+    ("독서 지도", "Reading"), ("스페인어", "Spanish"), ("프랑스어", "French"), ("뜨개질", "Knitting"),
+    ("목공", "Woodworking"), ("정원 가꾸기", "Gardening"), ("컴퓨터 수리", "PC Repair"),
+    ("스마트폰 활용", "Smartphone Basics"), ("세무", "Tax"), ("창업 멘토링", "Startup Mentoring"),
+]
+
+# 수요자 요청 문구 템플릿
+REQUEST_TEMPLATES = [
+    "{}", "{} 과외", "{} 배우고 싶어요", "{} 기초", "{} 멘토링 부탁드립니다",
+    "{} 도와주실 분", "need help with {}", "{} tutoring", "learn {}", "{} 입문 (초보)",
+]
+
+FIRST_NAMES = ["민준", "서연", "도윤", "하은", "지호", "수아", "예준", "지유", "Alex", "Sam", "Jordan", "Taylor"]
+LAST_NAMES = ["김", "이", "박", "최", "정", "강", "조", "윤"]
+AVAILABILITY = ["주말 오전", "주말 오후", "평일 저녁", "평일 오전", "협의 가능", ""]
+
+
+def _skill_weights(zipf_exponent):
+    """재능 인기도 (순위^-지수에 비례, 합계 1)"""
+    weights = 1.0 / np.arange(1, len(SKILL_VOCAB) + 1) ** zipf_exponent
+    return weights / weights.sum()
+
+
+def _skill_labels(rng, indices):
+    """재능 번호 → 한국어/영어 표기 (대소문자도 섞음)"""
+    variants = np.array([[ko, en, en.upper()] for ko, en in SKILL_VOCAB], dtype=object)
+    english = rng.random(len(indices)) < 0.35
+    upper = english & (rng.random(len(indices)) < 0.3)
+    return variants[indices, english.astype(int) + upper].tolist()
+
+
+def _ids(rng, n):
+    """재현 가능한 UUID4 문자열 목록"""
+    raw = rng.integers(0, 256, size=(n, 16), dtype=np.uint8)
+    raw[:, 6] = raw[:, 6] & 0x0F | 0x40  # version 4
+    raw[:, 8] = raw[:, 8] & 0x3F | 0x80  # RFC 4122 variant
+    hexed = raw.tobytes().hex()
+    return [f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+            for h in (hexed[i:i + 32] for i in range(0, len(hexed), 32))]
+
+
+def _created_at(rng, n, days):
+    """최근 days일 안의 등록 시각 (오래된 순)"""
+    offsets = np.sort(rng.integers(0, days * 86400, size=n)).astype("timedelta64[s]")
+    return np.datetime_as_string(np.datetime64("2024-01-01T00:00:00") + offsets, unit="s").tolist()
+
+
+def generate_donors(n, seed=0, zipf_exponent=1.1, max_skills=4):
+    """합성 재능기부자 DataFrame 생성
+
+    Args:
+        n: 행 수
+        seed: 난수 seed
+        zipf_exponent: 재능 인기도 편중 정도 (클수록 상위 재능에 집중)
+        max_skills: 기부자별 최대 재능 수
+    """
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(1, max_skills + 1, size=n)
+    labels = _skill_labels(rng, rng.choice(len(SKILL_VOCAB), size=counts.sum(), p=_skill_weights(zipf_exponent)))
+    bounds = np.concatenate([[0], np.cumsum(counts)])
+    skills = [", ".join(dict.fromkeys(labels[bounds[i]:bounds[i + 1]])) for i in range(n)]
+    names = [f"{LAST_NAMES[a]}{FIRST_NAMES[b]}" for a, b in
+             zip(rng.integers(0, len(LAST_NAMES), n), rng.integers(0, len(FIRST_NAMES), n))]
+    return pd.DataFrame({
+        "donor_id": _ids(rng, n),
+        "name": names,
+        "email": [f"donor{i}@example.com" for i in range(n)],
+        "skill": skills,
+        "mode": rng.choice(DONOR_MODES, size=n, p=[0.5, 0.2, 0.3]),
+        "availability": rng.choice(AVAILABILITY, size=n),
+        "created_at": _created_at(rng, n, 365),
+    })
+
+
+def generate_requests(n, seed=1, zipf_exponent=1.1):
+    """합성 재능 수요 DataFrame 생성
+
+    needed_skill은 한 가지(가끔 두 가지) 재능을 다양한 요청 문구에 넣어 만듭니다.
+
+    Args:
+        n: 행 수
+        seed: 난수 seed
+        zipf_exponent: 재능 인기도 편중 정도
+    """
+    rng = np.random.default_rng(seed)
+    weights = _skill_weights(zipf_exponent)
+    first = _skill_labels(rng, rng.choice(len(SKILL_VOCAB), size=n, p=weights))
+    second = _skill_labels(rng, rng.choice(len(SKILL_VOCAB), size=n, p=weights))
+    pair = rng.random(n) < 0.15
+    templates = rng.integers(0, len(REQUEST_TEMPLATES), size=n)
+    needed = [
+        REQUEST_TEMPLATES[t].format(f"{a}, {b}" if both else a)
+        for t, a, b, both in zip(templates, first, second, pair)
+    ]
+    return pd.DataFrame({
+        "request_id": _ids(rng, n),
+        "email": [f"request{i}@example.com" for i in range(n)],
+        "needed_skill": needed,
+        "description": [f"{skill} 관련 도움이 필요합니다." for skill in first],
+        "status": rng.choice(REQUEST_STATUSES, size=n, p=[0.7, 0.25, 0.05]),
+        "created_at": _created_at(rng, n, 180),
+    })
+
+
+GENERATORS = {"donors": generate_donors, "requests": generate_requests}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 재능기부자/수요자 데이터 생성")
+    parser.add_argument("table", choices=sorted(GENERATORS), help="생성할 테이블")
+    parser.add_argument("rows", type=int, help="행 수 (예: 1000 ~ 1000000)")
+    parser.add_argument("path", help="저장할 CSV 또는 Parquet 파일 경로")
+    parser.add_argument("--seed", type=int, default=None, help="난수 seed (기본: 테이블별 고정값)")
+    args = parser.parse_args(argv)
+
+    kwargs = {} if args.seed is None else {"seed": args.seed}
+    df = GENERATORS[args.table](args.rows, **kwargs)
+    if args.path.lower().endswith(".parquet"):
+        df.to_parquet(args.path, index=False)
+    else:
+        df.to_csv(args.path, index=False, encoding="utf-8-sig")
+    print(f"{args.table} {len(df)}행 저장: {args.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""현황/매칭 결과 CSV·Parquet 내보내기
+
+파일은 사용자가 요청할 때만 만들고, 같은 데이터 버전과 필터 조건(키)이면 만들어 둔 결과를
+max_age초 동안 재사용합니다 (다른 프로세스의 변경은 데이터 버전에 나타나지 않으므로). CSV는 행 묶음 단위로 인코딩해 전체 문자열 사본 없이 쓰고,
+Parquet은 zstd로 압축합니다 (pyarrow 패키지 필요).
+"""
+import importlib.util
+import io
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Callable, Iterator, Optional
+
+import pandas as pd
+
+import metrics
+
+ExportFormat = namedtuple("ExportFormat", ["label", "extension", "mime"])
+
+EXPORT_FORMATS = {
+    "csv": ExportFormat("CSV", ".csv", "text/csv"),
+    "parquet": ExportFormat("Parquet", ".parquet", "application/vnd.apache.parquet"),
+}
+
+CSV_CHUNK_SIZE = 10000
+CACHE_SIZE = 8  # 최근 내보내기 결과 보관 개수
+
+_cache = OrderedDict()  # (key, fmt) -> (만든 시각, bytes)
+_cache_lock = threading.Lock()
+
+def available_formats() -> list:
+    """사용 가능한 내보내기 형식 (pyarrow가 없으면 CSV만)"""
+    if importlib.util.find_spec("pyarrow") is None:
+        return ["csv"]
+    return list(EXPORT_FORMATS)
+
+def iter_csv_chunks(df: pd.DataFrame, chunk_size: int = CSV_CHUNK_SIZE) -> Iterator[bytes]:
+    """DataFrame을 CSV 바이트 묶음으로 순차 변환 (첫 묶음에 Excel용 BOM과 헤더 포함)"""
+    yield df.iloc[0:0].to_csv(index=False).encode("utf-8-sig")
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size].to_csv(index=False, header=False).encode("utf-8")
+
+def to_csv_bytes(df: pd.DataFrame, chunk_size: int = CSV_CHUNK_SIZE) -> bytes:
+    buffer = io.BytesIO()
+    for chunk in iter_csv_chunks(df, chunk_size):
+        buffer.write(chunk)
+    return buffer.getvalue()
+
+def to_parquet_bytes(df: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False, compression="zstd")
+    return buffer.getvalue()
+
+_WRITERS = {"csv": to_csv_bytes, "parquet": to_parquet_bytes}
+
+def export_bytes(key: tuple, fmt: str, build: Callable[[], pd.DataFrame],
+                 max_age: Optional[float] = None) -> bytes:
+    """내보내기 파일 내용 (캐시에 없거나 max_age가 지났을 때만 build()로 DataFrame을 만들어 변환)
+
+    Args:
+        key: 데이터 버전과 필터 조건을 담은 튜플 (첫 값은 계측에 쓰는 이름, 예: "donors")
+        fmt: EXPORT_FORMATS의 키 ("csv" 또는 "parquet")
+        build: 내보낼 DataFrame을 반환하는 함수
+        max_age: 만들어 둔 파일을 재사용할 최대 시간(초) (None이면 제한 없음)
+    """
+    cache_key = (key, fmt)
+    with _cache_lock:
+        cached = _cache.get(cache_key)
+        if cached is not None and (max_age is None or time.monotonic() - cached[0] < max_age):
+            _cache.move_to_end(cache_key)
+            return cached[1]
+
+    with metrics.timed("export", fmt, key[0]) as stats:
+        df = build()
+        data = _WRITERS[fmt](df)
+        stats["rows"] = len(df)
+        stats["nbytes"] = len(data)
+
+    with _cache_lock:
+        _cache.pop(cache_key, None)
+        _cache[cache_key] = (time.monotonic(), data)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return data
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
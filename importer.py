@@ -0,0 +1,127 @@
+"""재능기부자/수요자 CSV·Parquet 일괄 가져오기
+
+사용법:
+    python importer.py donors volunteers.csv
+    python importer.py requests requests.parquet --chunk-size 2000 --rejects rejected.csv
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+from typing import Callable, Iterator, Optional
+
+import pandas as pd
+
+from database import insert_rows, wait_for_matches
+from records import validate_donor, validate_request, new_donor_row, new_request_row
+
+# 테이블별 (가져올 컬럼, 검증 함수, 행 생성 함수)
+IMPORT_SPECS = {
+    "donors": (
+        ["name", "email", "skill", "mode", "availability"],
+        validate_donor,
+        lambda row, created_at: new_donor_row(
+            row["name"], row["email"], row["skill"], row["mode"], row["availability"], created_at
+        ),
+    ),
+    "requests": (
+        ["email", "needed_skill", "description"],
+        validate_request,
+        lambda row, created_at: new_request_row(
+            row["email"], row["needed_skill"], row["description"], created_at
+        ),
+    ),
+}
+
+def _is_parquet(name: str) -> bool:
+    return os.path.splitext(name)[1].lower() in (".parquet", ".pq")
+
+def iter_file_chunks(source, chunk_size: int = 1000, name: Optional[str] = None) -> Iterator[pd.DataFrame]:
+    """CSV 또는 Parquet 파일을 문자열 DataFrame 묶음으로 순차 읽기
+
+    Args:
+        source: 파일 경로 또는 파일 객체 (Streamlit 업로드 파일 포함)
+        chunk_size: 묶음당 행 수
+        name: 파일 이름 (source가 파일 객체일 때 형식 판별용)
+    """
+    name = name or getattr(source, "name", None) or str(source)
+    if _is_parquet(name):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise Exception("Parquet 파일을 읽으려면 pyarrow 패키지가 필요합니다 (pip install pyarrow)")
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas().astype("string").fillna("").astype(object)
+    else:
+        yield from pd.read_csv(source, dtype=str, keep_default_na=False,
+                               chunksize=chunk_size, encoding="utf-8-sig")
+
+def import_file(table_name: str, source, chunk_size: int = 1000, name: Optional[str] = None,
+                progress: Optional[Callable[[int, int, int], None]] = None) -> dict:
+    """파일을 묶음 단위로 검증 후 일괄 추가
+
+    등록 폼과 같은 규칙(records.validate_*)으로 검증하고, ID와 created_at을 생성하여
+    묶음마다 multi-row insert로 추가합니다.
+
+    Args:
+        table_name: donors 또는 requests
+        source: 파일 경로 또는 파일 객체
+        chunk_size: 묶음당 행 수
+        name: 파일 이름 (source가 파일 객체일 때 형식 판별용)
+        progress: 묶음마다 (처리한 행 수, 추가된 행 수, 거부된 행 수)로 호출되는 함수
+
+    Returns:
+        dict: {"processed", "inserted", "rejected": 거부된 행 DataFrame (reason 컬럼 포함)}
+    """
+    if table_name not in IMPORT_SPECS:
+        raise ValueError(f"지원하지 않는 테이블입니다: {table_name}")
+    columns, validate, build_row = IMPORT_SPECS[table_name]
+
+    processed = 0
+    inserted = 0
+    rejected = []
+    for chunk in iter_file_chunks(source, chunk_size, name):
+        chunk = chunk.reindex(columns=columns, fill_value="")
+        created_at = datetime.now().isoformat()
+        rows = []
+        for row in chunk.to_dict("records"):
+            error = validate(row)
+            if error:
+                rejected.append({**row, "reason": error})
+            else:
+                rows.append(build_row(row, created_at))
+
+        result = insert_rows(table_name, rows)
+        inserted += result["inserted"]
+        rejected.extend({**row, "reason": error} for row, error in result["failed"])
+        processed += len(chunk)
+        if progress:
+            progress(processed, inserted, len(rejected))
+
+    return {
+        "processed": processed,
+        "inserted": inserted,
+        "rejected": pd.DataFrame(rejected),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="재능기부자/수요자 CSV·Parquet 일괄 가져오기")
+    parser.add_argument("table", choices=sorted(IMPORT_SPECS), help="가져올 테이블")
+    parser.add_argument("path", help="CSV 또는 Parquet 파일 경로")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="묶음당 행 수 (기본 1000)")
+    parser.add_argument("--rejects", help="거부된 행을 저장할 CSV 경로")
+    args = parser.parse_args(argv)
+
+    def report(processed, inserted, rejected):
+        print(f"처리 {processed}행 / 추가 {inserted}행 / 거부 {rejected}행", file=sys.stderr)
+
+    result = import_file(args.table, args.path, args.chunk_size, progress=report)
+    # 매칭 갱신은 백그라운드에서 진행되므로 끝날 때까지 기다린 뒤 종료
+    wait_for_matches()
+    if args.rejects and not result["rejected"].empty:
+        result["rejected"].to_csv(args.rejects, index=False, encoding="utf-8-sig")
+    print(f"완료: {result['inserted']}/{result['processed']}행 추가, {len(result['rejected'])}행 거부")
+    return 0 if result["rejected"].empty else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
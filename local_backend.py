@@ -0,0 +1,376 @@
+"""내장 SQLite 백엔드
+
+Supabase 클라이언트가 쓰는 PostgREST 쿼리 빌더 중 database.py가 사용하는 부분
+(`table().select/insert/upsert/update/delete`, eq/neq/gt/gte/lt/lte/in_/ilike/or_(and() 중첩) 필터,
+order/limit/range, count="exact", execute)을 표준 라이브러리 sqlite3로 구현합니다.
+테이블, 뷰, 인덱스는 supabase_setup.sql에서 그대로 읽어 생성하므로 스키마가 항상 같습니다.
+SQL 함수(`rpc`)는 PostgreSQL 전용이므로 register_function으로 등록한 파이썬 함수가 대신 처리합니다.
+
+DATABASE_BACKEND = "sqlite" 설정 시 database.get_supabase_client()가 이 클라이언트를 반환하며,
+네트워크 없이 로컬 개발, 성능 측정, 부하 테스트를 재현할 수 있습니다.
+"""
+import os
+import re
+import sqlite3
+import threading
+from collections import namedtuple
+from datetime import datetime, timezone
+from typing import Optional
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "supabase_setup.sql")
+
+# execute() 결과 (supabase-py의 APIResponse와 같은 data/count 속성)
+_Response = namedtuple("_Response", ["data", "count"], defaults=[None])
+
+_CREATE_TABLE_RE = re.compile(r"CREATE TABLE IF NOT EXISTS \w+ \(.*?\n\);", re.DOTALL)
+_ADD_COLUMN_RE = re.compile(r"ALTER TABLE (\w+) ADD COLUMN IF NOT EXISTS (\w+) (\w+)")
+_CREATE_VIEW_RE = re.compile(r"CREATE OR REPLACE VIEW (\w+) AS\n(.*?);", re.DOTALL)
+# USING GIN 등 PostgreSQL 전용 인덱스는 제외
+_CREATE_INDEX_RE = re.compile(r"CREATE (?:UNIQUE )?INDEX IF NOT EXISTS \w+ ON \w+ \([\w, ]+\);")
+
+def _now() -> str:
+    """updated_at 값 (PostgreSQL timestamptz와 같은 ISO 8601 형식)"""
+    return datetime.now(timezone.utc).isoformat()
+
+def _sql_value(value):
+    """sqlite3에 바인딩할 수 있는 값으로 변환 (numpy 스칼라, 날짜 등)"""
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+def _split_or_conditions(text: str) -> list:
+    """PostgREST or 필터 문자열을 조건별로 분리 (큰따옴표/괄호 안의 쉼표는 무시)"""
+    parts, current, quoted, escaped, depth = [], [], False, False, 0
+    for ch in text:
+        if escaped:
+            current.append(ch)
+            escaped = False
+        elif ch == "\\":
+            current.append(ch)
+            escaped = True
+        elif ch == '"':
+            current.append(ch)
+            quoted = not quoted
+        elif ch == "," and not quoted and depth == 0:
+            parts.append("".join(current))
+            current = []
+        else:
+            if not quoted:
+                depth += {"(": 1, ")": -1}.get(ch, 0)
+            current.append(ch)
+    parts.append("".join(current))
+    return [part for part in parts if part]
+
+def _unquote(value: str) -> str:
+    """PostgREST 큰따옴표 값의 이스케이프 해제"""
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return re.sub(r"\\(.)", r"\1", value[1:-1])
+    return value
+
+class _Query:
+    """단일 테이블에 대한 PostgREST 스타일 쿼리 빌더"""
+
+    _COMPARISONS = {"eq": "=", "neq": "<>", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+    def __init__(self, client: "LocalClient", table_name: str):
+        self._client = client
+        self._table = table_name
+        self._columns = client.columns(table_name)
+        self._action = "select"
+        self._select = "*"
+        self._count = None
+        self._head = False
+        self._payload = None
+        self._on_conflict = None
+        self._where = []
+        self._params = []
+        self._order = []
+        self._limit = None
+        self._offset = None
+
+    def _column(self, name: str) -> str:
+        if name not in self._columns:
+            raise Exception(f'column {self._table}.{name} does not exist')
+        return f'"{name}"'
+
+    # 동작
+    def select(self, *columns: str, count: Optional[str] = None, head: bool = False):
+        self._action = "select"
+        self._select = ",".join(columns) or "*"
+        self._count = count
+        self._head = head
+        return self
+
+    def insert(self, rows):
+        self._action = "insert"
+        self._payload = rows
+        return self
+
+    def upsert(self, rows, on_conflict: Optional[str] = None):
+        self._action = "upsert"
+        self._payload = rows
+        self._on_conflict = on_conflict
+        return self
+
+    def update(self, values: dict):
+        self._action = "update"
+        self._payload = values
+        return self
+
+    def delete(self):
+        self._action = "delete"
+        return self
+
+    # 필터
+    def _compare(self, op: str, column: str, value):
+        self._where.append(f"{self._column(column)} {self._COMPARISONS[op]} ?")
+        self._params.append(_sql_value(value))
+        return self
+
+    def eq(self, column, value):
+        return self._compare("eq", column, value)
+
+    def neq(self, column, value):
+        return self._compare("neq", column, value)
+
+    def gt(self, column, value):
+        return self._compare("gt", column, value)
+
+    def gte(self, column, value):
+        return self._compare("gte", column, value)
+
+    def lt(self, column, value):
+        return self._compare("lt", column, value)
+
+    def lte(self, column, value):
+        return self._compare("lte", column, value)
+
+    def in_(self, column, values):
+        values = list(values)
+        if not values:
+            self._where.append("0")
+            return self
+        self._where.append(f"{self._column(column)} IN ({','.join('?' * len(values))})")
+        self._params.extend(_sql_value(v) for v in values)
+        return self
+
+    def _ilike_clause(self, column: str, pattern: str) -> str:
+        self._params.append(pattern.replace("*", "%"))
+        # SQLite LIKE는 기본적으로 대소문자를 구분하지 않음 (ASCII)
+        return f"{self._column(column)} LIKE ? ESCAPE '\\'"
+
+    def ilike(self, column, pattern):
+        self._where.append(self._ilike_clause(column, pattern))
+        return self
+
+    def _condition(self, condition: str) -> str:
+        """or/and 필터의 조건 하나를 SQL로 변환 (and(...)/or(...) 중첩 지원)"""
+        for group, joiner in (("and(", " AND "), ("or(", " OR ")):
+            if condition.startswith(group) and condition.endswith(")"):
+                inner = _split_or_conditions(condition[len(group):-1])
+                return "(" + joiner.join(self._condition(c) for c in inner) + ")"
+        column, op, value = condition.split(".", 2)
+        value = _unquote(value)
+        if op == "ilike":
+            return self._ilike_clause(column, value)
+        if op in self._COMPARISONS:
+            self._params.append(value)
+            return f"{self._column(column)} {self._COMPARISONS[op]} ?"
+        raise Exception(f"unsupported or_ operator: {op}")
+
+    def or_(self, filters: str):
+        clauses = [self._condition(condition) for condition in _split_or_conditions(filters)]
+        self._where.append("(" + " OR ".join(clauses) + ")")
+        return self
+
+    # 정렬/개수
+    def order(self, column, desc: bool = False):
+        # PostgreSQL 기본값과 같게: 오름차순은 NULL 마지막, 내림차순은 NULL 처음
+        self._order.append(f"{self._column(column)} {'DESC NULLS FIRST' if desc else 'ASC NULLS LAST'}")
+        return self
+
+    def limit(self, count: int):
+        self._limit = int(count)
+        return self
+
+    def range(self, start: int, end: int):
+        self._offset = int(start)
+        self._limit = int(end) - int(start) + 1
+        return self
+
+    # 실행
+    def _where_sql(self) -> str:
+        return f" WHERE {' AND '.join(self._where)}" if self._where else ""
+
+    def _select_sql(self) -> str:
+        if self._select.strip() == "*":
+            columns = "*"
+        else:
+            columns = ",".join(self._column(c.strip()) for c in self._select.split(","))
+        sql = f'SELECT {columns} FROM "{self._table}"{self._where_sql()}'
+        if self._order:
+            sql += " ORDER BY " + ", ".join(self._order)
+        if self._limit is not None or self._offset is not None:
+            sql += f" LIMIT {self._limit if self._limit is not None else -1}"
+            if self._offset:
+                sql += f" OFFSET {self._offset}"
+        return sql
+
+    def _stamp(self, row: dict) -> dict:
+        row = {k: _sql_value(v) for k, v in row.items()}
+        if "updated_at" in self._columns:
+            row["updated_at"] = _now()
+        return row
+
+    def _write_rows(self, conn) -> list:
+        rows = self._payload if isinstance(self._payload, list) else [self._payload]
+        rows = [self._stamp(row) for row in rows]
+        written = []
+        for row in rows:
+            columns = [self._column(c) for c in row]
+            sql = (f'INSERT INTO "{self._table}" ({",".join(columns)}) '
+                   f'VALUES ({",".join("?" * len(columns))})')
+            if self._action == "upsert":
+                conflict = self._column(self._on_conflict or self._client.primary_key(self._table))
+                updates = ",".join(f"{c}=excluded.{c}" for c in columns if c != conflict)
+                sql += f" ON CONFLICT({conflict}) " + (f"DO UPDATE SET {updates}" if updates else "DO NOTHING")
+            conn.execute(sql, list(row.values()))
+            written.append(row)
+        return written
+
+    def execute(self) -> _Response:
+        with self._client.transaction() as conn:
+            if self._action == "select":
+                count = None
+                if self._count:
+                    # 개수는 limit/range와 관계없이 조건에 맞는 전체 행 수
+                    count = conn.execute(f'SELECT COUNT(*) FROM "{self._table}"{self._where_sql()}',
+                                         self._params).fetchone()[0]
+                if self._head:
+                    return _Response([], count)
+                cursor = conn.execute(self._select_sql(), self._params)
+                return _Response([dict(r) for r in cursor.fetchall()], count)
+            if self._action in ("insert", "upsert"):
+                return _Response(self._write_rows(conn))
+            if self._action == "update":
+                values = self._stamp(self._payload)
+                assignments = ",".join(f"{self._column(c)} = ?" for c in values)
+                conn.execute(f'UPDATE "{self._table}" SET {assignments}{self._where_sql()}',
+                             list(values.values()) + self._params)
+                cursor = conn.execute(f'SELECT * FROM "{self._table}"{self._where_sql()}', self._params)
+                return _Response([dict(r) for r in cursor.fetchall()])
+            if self._action == "delete":
+                cursor = conn.execute(f'SELECT * FROM "{self._table}"{self._where_sql()}', self._params)
+                deleted = [dict(r) for r in cursor.fetchall()]
+                conn.execute(f'DELETE FROM "{self._table}"{self._where_sql()}', self._params)
+                return _Response(deleted)
+        raise Exception(f"unsupported action: {self._action}")
+
+class _RpcCall:
+    """rpc() 호출 (execute() 시 등록된 함수 실행)"""
+
+    def __init__(self, client: "LocalClient", name: str, params: Optional[dict]):
+        self._client = client
+        self._name = name
+        self._params = params or {}
+
+    def execute(self) -> _Response:
+        func = self._client._functions.get(self._name)
+        if func is None:
+            raise Exception(f"function {self._name} does not exist")
+        return _Response(func(self._client, **self._params))
+
+class LocalClient:
+    """Supabase Client 대신 쓰는 내장 SQLite 클라이언트 (스레드 간 공유 가능)
+
+    Args:
+        path: 데이터베이스 파일 경로 (":memory:"이면 메모리 DB)
+        schema_path: 테이블 생성 SQL 파일 (기본 supabase_setup.sql)
+    """
+
+    def __init__(self, path: str = "talent.db", schema_path: str = SCHEMA_PATH):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+        self._table_columns = {}
+        self._functions = {}
+        self._create_schema(schema_path)
+
+    def _create_schema(self, schema_path: str):
+        """supabase_setup.sql의 테이블/컬럼/뷰/B-tree 인덱스를 SQLite에 생성"""
+        with open(schema_path, encoding="utf-8") as f:
+            script = f.read()
+        with self.transaction() as conn:
+            for statement in _CREATE_TABLE_RE.findall(script):
+                conn.execute(statement)
+            # ADD COLUMN IF NOT EXISTS가 없으므로 컬럼이 없을 때만 추가 (값은 쓰기 시 채움)
+            for table_name, column, column_type in _ADD_COLUMN_RE.findall(script):
+                existing = {r["name"] for r in conn.execute(f'PRAGMA table_info("{table_name}")')}
+                if column not in existing:
+                    # 숫자 컬럼은 비교/정렬이 숫자로 되도록 INTEGER/REAL, 그 외는 TEXT
+                    affinity = next((t for t in ("INTEGER", "REAL") if column_type.upper().startswith(t[:3])), "TEXT")
+                    conn.execute(f'ALTER TABLE "{table_name}" ADD COLUMN "{column}" {affinity}')
+            for statement in _CREATE_INDEX_RE.findall(script):
+                conn.execute(statement)
+            # OR REPLACE가 없으므로 다시 생성
+            for view_name, body in _CREATE_VIEW_RE.findall(script):
+                conn.execute(f'DROP VIEW IF EXISTS "{view_name}"')
+                conn.execute(f'CREATE VIEW "{view_name}" AS {body}')
+            for (table_name,) in conn.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view')"):
+                info = conn.execute(f'PRAGMA table_info("{table_name}")').fetchall()
+                self._table_columns[table_name] = {r["name"]: bool(r["pk"]) for r in info}
+
+    def transaction(self):
+        """잠금을 잡고 연결을 트랜잭션으로 사용하는 컨텍스트 매니저"""
+        return _Transaction(self)
+
+    def columns(self, table_name: str) -> dict:
+        if table_name not in self._table_columns:
+            raise Exception(f'relation "{table_name}" does not exist')
+        return self._table_columns[table_name]
+
+    def primary_key(self, table_name: str) -> str:
+        return next(c for c, pk in self.columns(table_name).items() if pk)
+
+    def table(self, table_name: str) -> _Query:
+        return _Query(self, table_name)
+
+    def register_function(self, name: str, func):
+        """rpc(name, params)로 호출할 함수 등록 (func(client, **params) → 행 dict 리스트)"""
+        self._functions[name] = func
+
+    def rpc(self, name: str, params: Optional[dict] = None) -> _RpcCall:
+        return _RpcCall(self, name, params)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+class _Transaction:
+    def __init__(self, client: LocalClient):
+        self._client = client
+
+    def __enter__(self):
+        self._client._lock.acquire()
+        self._client._conn.execute("BEGIN")
+        return self._client._conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._client._conn.commit()
+            else:
+                self._client._conn.rollback()
+        finally:
+            self._client._lock.release()
+        return False
@@ -1,3 +1,68 @@
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import deque
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+# 동의어 사전: 대표 표기 → 다른 표기 (단어 단위로 대표 표기로 바뀜)
+SKILL_SYNONYMS = {
+    "파이썬": ["python"],
+    "자바": ["java"],
+    "자바스크립트": ["javascript", "js"],
+    "영어": ["english"],
+    "수학": ["math", "mathematics"],
+    "코딩": ["coding", "programming", "프로그래밍"],
+    "디자인": ["design"],
+    "피아노": ["piano"],
+    "데이터": ["data"],
+}
+
+_SYNONYM_LOOKUP = {
+    alias.lower(): canonical
+    for canonical, aliases in SKILL_SYNONYMS.items()
+    for alias in aliases
+}
+
+# 단어 구분용으로 공백 처리할 문장 부호 (c++, c#, node.js 등을 위해 +, #, .은 유지)
+_PUNCTUATION = re.compile(r"[()\[\]{}<>/\\|·•・'\"!?;:~`]")
+
+# 정규화 결과 LRU 캐시 크기 (원본 문자열 기준)
+NORMALIZE_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_skill(text):
+    """재능 문자열 정규화 (유니코드 NFKC, 소문자, 문장 부호 → 공백, 동의어 → 대표 표기)
+
+    쉼표는 그대로 유지됩니다. 결과는 원본 문자열 기준으로 캐시됩니다.
+    """
+    if not text or not isinstance(text, str):
+        return ""
+    text = _PUNCTUATION.sub(" ", unicodedata.normalize("NFKC", text).lower())
+    return ",".join(
+        " ".join(_SYNONYM_LOOKUP.get(word, word) for word in part.split())
+        for part in text.split(",")
+    )
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def skill_terms(skill):
+    """기부자 재능 문자열 → 정규화된 재능 항목 튜플 (쉼표 기준, 빈 항목 제외)"""
+    return tuple(term for term in (t.strip() for t in normalize_skill(skill).split(",")) if term)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def request_text(request_skill):
+    """수요자 재능 문자열 → 정규화된 검색 문자열 (쉼표도 공백으로 처리)"""
+    return " ".join(normalize_skill(request_skill).replace(",", " ").split())
+
+
 def calculate_match_score(donor_skill, request_skill):
     """
     재능기부자와 수요자의 재능 매칭 점수 계산 (Wild 매칭)
@@ -12,19 +77,20 @@ def calculate_match_score(donor_skill, request_skill):
     if not donor_skill or not request_skill:
         return 0
     
-    donor_skills = [s.strip().lower() for s in donor_skill.split(",")]
-    request_skill_lower = request_skill.lower()
+    # 정규화 결과는 원본 문자열 기준으로 캐시되므로 같은 재능은 한 번만 처리됨
+    donor_skills = skill_terms(donor_skill)
+    request_skill_lower = request_text(request_skill)
+    if not request_skill_lower:
+        return 0
     
     # 양방향 wild 매칭: 기부자 재능이 수요자 재능에 포함되거나, 수요자 재능이 기부자 재능에 포함되는 경우
     for skill in donor_skills:
-        if skill and (skill in request_skill_lower or request_skill_lower in skill):
+        if skill in request_skill_lower or request_skill_lower in skill:
             return 1
     
     # 단어 단위 매칭: 각 단어가 부분적으로 일치하는지 확인
     request_words = request_skill_lower.split()
     for skill in donor_skills:
-        if not skill:
-            continue
         skill_words = skill.split()
         # 기부자 재능의 단어가 수요자 재능에 포함되거나, 수요자 재능의 단어가 기부자 재능에 포함되는 경우
         for skill_word in skill_words:
@@ -33,3 +99,645 @@ def calculate_match_score(donor_skill, request_skill):
     
     return 0
 
+
+def _skill_words(skill):
+    """재능 문자열의 정규화된 단어 집합 (쉼표/공백 기준)"""
+    return {word for term in skill_terms(skill) for word in term.split()}
+
+
+def _containment(a, b):
+    """한 단어가 다른 단어에 포함되면 길이 비율(0~1), 아니면 0"""
+    if a in b or b in a:
+        return min(len(a), len(b)) / max(len(a), len(b))
+    return 0.0
+
+
+class _AhoCorasick:
+    """여러 키를 하나의 오토마톤으로 묶어 텍스트를 한 번 훑으며 포함된 키를 모두 찾는 매처"""
+
+    def __init__(self, keys):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for key in keys:
+            self._insert(key)
+        self._link()
+
+    def _insert(self, key):
+        node = 0
+        for ch in key:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(key)
+
+    def _link(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text):
+        """text에 부분 문자열로 포함된 키 집합"""
+        found = set()
+        node = 0
+        for ch in text:
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            if self._out[node]:
+                found.update(self._out[node])
+        return found
+
+
+class _SubstringIndex:
+    """키 문자열 → posting(정수 위치 집합) 색인
+
+    정렬된 접미사 배열(suffix array)과 Aho-Corasick 오토마톤을 함께 유지하여
+    - 쿼리가 키의 부분 문자열인 경우 (query in key): 이진 탐색
+    - 키가 쿼리의 부분 문자열인 경우 (key in query): 쿼리를 오토마톤으로 한 번만 훑기
+    를 모두 전체 키 순회 없이 처리합니다.
+    """
+
+    def __init__(self):
+        self.postings = {}
+        self._suffixes = []
+        self._automaton = None
+        self._dirty = False
+
+    @classmethod
+    def from_series(cls, keys):
+        """키 Series(인덱스 = 위치)로부터 색인을 한 번에 생성"""
+        index = cls()
+        index.postings = {key: set(pos.tolist()) for key, pos in keys.groupby(keys).groups.items()}
+        index._dirty = True
+        return index
+
+    def add(self, key, pos):
+        postings = self.postings.get(key)
+        if postings is None:
+            # 새 키가 생길 때만 접미사 배열/오토마톤을 다시 만듦
+            self.postings[key] = {pos}
+            self._dirty = True
+        else:
+            postings.add(pos)
+
+    def discard(self, key, pos):
+        postings = self.postings.get(key)
+        if postings is None:
+            return
+        postings.discard(pos)
+        if not postings:
+            del self.postings[key]
+            self._dirty = True
+
+    def _build(self):
+        self._suffixes = sorted(
+            (key[i:], key) for key in self.postings for i in range(len(key))
+        )
+        self._automaton = _AhoCorasick(self.postings)
+        self._dirty = False
+
+    def keys_containing(self, query):
+        """query를 부분 문자열로 포함하는 키 집합"""
+        if self._dirty:
+            self._build()
+        keys = set()
+        i = bisect_left(self._suffixes, (query,))
+        while i < len(self._suffixes) and self._suffixes[i][0].startswith(query):
+            keys.add(self._suffixes[i][1])
+            i += 1
+        return keys
+
+    def keys_contained_in(self, query):
+        """query의 부분 문자열인 키 집합"""
+        if self._dirty:
+            self._build()
+        return self._automaton.find(query)
+
+    def lookup(self, query):
+        """query와 양방향 부분 일치하는 키들의 posting 합집합"""
+        hits = set()
+        for key in self.keys_containing(query) | self.keys_contained_in(query):
+            hits |= self.postings[key]
+        return hits
+
+
+def _normalize_values(values, normalize):
+    """문자열 값을 중복 제거 후 정규화 함수로 변환한 Series (빈 결과 제외, 인덱스 유지)"""
+    values = values.astype(object)
+    values = values[values.map(lambda v: isinstance(v, str) and v != "")]
+    if values.empty:
+        return pd.Series([], dtype=object)
+    normalized = values.map({value: normalize(value) for value in values.unique()})
+    return normalized[normalized.map(len) > 0]
+
+
+def match_frames(donors_df, requests_df):
+    """재능기부자 × 수요자 Wild 매칭을 DataFrame 단위로 일괄 계산
+
+    재능 정규화는 중복 제거된 문자열 단위로만(캐시 사용) 수행하고 토큰 전개는 pandas 연산으로 처리하며,
+    부분 일치 검사는 중복 제거된 재능 항목/단어 및 요청 문자열 단위로만 수행합니다.
+    결과는 모든 쌍에 `calculate_match_score`를 호출한 것과 동일합니다.
+
+    Args:
+        donors_df: donor_id, skill 컬럼을 가진 기부자 DataFrame
+        requests_df: request_id, needed_skill 컬럼을 가진 수요 DataFrame
+
+    Returns:
+        pd.DataFrame: donor_id, request_id, score 컬럼 (수요자 순서 → 기부자 순서로 정렬)
+    """
+    columns = ["donor_id", "request_id", "score"]
+    if donors_df.empty or requests_df.empty:
+        return pd.DataFrame(columns=columns)
+
+    donors = donors_df.reset_index(drop=True)
+    requests = requests_df.reset_index(drop=True)
+
+    # 기부자 재능 → 재능 항목 / 단어 (인덱스 = 기부자 위치)
+    terms = _normalize_values(donors["skill"], skill_terms).explode()
+    words = terms.str.split().explode().dropna()
+    term_index = _SubstringIndex.from_series(terms)
+    word_index = _SubstringIndex.from_series(words)
+
+    # 중복 제거된 요청 문자열 단위로 매칭되는 기부자 위치 계산
+    request_skills = _normalize_values(requests["needed_skill"], request_text)
+    word_hits = {}
+    query_hits = {}
+    for query in request_skills.unique():
+        hits = term_index.lookup(query)
+        for req_word in query.split():
+            if req_word not in word_hits:
+                word_hits[req_word] = word_index.lookup(req_word)
+            hits |= word_hits[req_word]
+        query_hits[query] = np.array(sorted(hits), dtype=np.int64)
+
+    hit_arrays = request_skills.map(query_hits)
+    if hit_arrays.empty:
+        return pd.DataFrame(columns=columns)
+    lengths = hit_arrays.map(len).to_numpy()
+    donor_pos = np.concatenate(hit_arrays.to_list())
+    request_pos = np.repeat(hit_arrays.index.to_numpy(), lengths)
+
+    return pd.DataFrame({
+        "donor_id": donors["donor_id"].to_numpy()[donor_pos],
+        "request_id": requests["request_id"].to_numpy()[request_pos],
+        "score": np.ones(len(donor_pos), dtype=np.int64),
+    })
+
+
+# wild 매칭은 성립하지만 단어 단위로 겹치는 부분이 없을 때의 최소 점수
+MIN_MATCH_SCORE = 0.01
+
+
+class SkillIndex:
+    """재능기부자 재능 역색인 (Wild 매칭 후보 조회용)
+
+    기부자별 재능 문자열을 한 번만 토큰화하여 재능 항목/단어 → 기부자 posting을 유지합니다.
+    `lookup` 결과는 모든 기부자에 대해 `calculate_match_score`를 호출한 것과 동일합니다.
+    `top_k`는 단어 일치 정도와 재능 희소도를 반영한 단계별 점수(0~1)로 상위 기부자를 고릅니다.
+
+    Args:
+        donors: (donor_id, skill) 쌍의 iterable (선택)
+    """
+
+    def __init__(self, donors=None):
+        self._ids = []
+        self._positions = {}
+        self._skills = []
+        self._donor_words = []
+        self._rarity_cache = {}
+        self._terms = _SubstringIndex()
+        self._words = _SubstringIndex()
+        for donor_id, skill in donors or ():
+            self.add(donor_id, skill)
+
+    @classmethod
+    def from_frame(cls, donors_df, id_col="donor_id", skill_col="skill"):
+        """기부자 DataFrame으로부터 색인 생성"""
+        if donors_df.empty:
+            return cls()
+        return cls(zip(donors_df[id_col], donors_df[skill_col]))
+
+    def __len__(self):
+        return len(self._ids)
+
+    def add(self, donor_id, skill):
+        """기부자 한 명의 재능을 색인에 추가 (이미 있는 ID면 재능만 바꾸고 추가된 순서는 유지)"""
+        pos = self._positions.get(donor_id)
+        if pos is None:
+            pos = len(self._ids)
+            self._ids.append(donor_id)
+            self._positions[donor_id] = pos
+            self._skills.append(skill)
+            self._donor_words.append(frozenset(_skill_words(skill)))
+        else:
+            if self._skills[pos] == skill:
+                return
+            for term in skill_terms(self._skills[pos]):
+                self._terms.discard(term, pos)
+                for word in term.split():
+                    self._words.discard(word, pos)
+            self._skills[pos] = skill
+            self._donor_words[pos] = frozenset(_skill_words(skill))
+        self._rarity_cache.clear()
+        for term in skill_terms(skill):
+            self._terms.add(term, pos)
+            for word in term.split():
+                self._words.add(word, pos)
+
+    def skill(self, donor_id):
+        """색인에 저장된 기부자 재능 (없으면 None)"""
+        pos = self._positions.get(donor_id)
+        return None if pos is None else self._skills[pos]
+
+    def _lookup_positions(self, request_skill):
+        """수요자 재능과 매칭되는 기부자 위치 리스트 (추가된 순서)"""
+        request_skill_lower = request_text(request_skill)
+        if not request_skill_lower:
+            return []
+
+        # 재능 항목 단위 양방향 매칭
+        hits = self._terms.lookup(request_skill_lower)
+        # 단어 단위 양방향 매칭
+        for req_word in request_skill_lower.split():
+            hits |= self._words.lookup(req_word)
+
+        return sorted(hits)
+
+    def lookup(self, request_skill):
+        """수요자 재능과 매칭되는 기부자 ID 리스트 (추가된 순서)
+
+        Args:
+            request_skill: 수요자가 필요한 재능
+
+        Returns:
+            list: 매칭 점수가 1인 기부자 ID 리스트
+        """
+        return [self._ids[pos] for pos in self._lookup_positions(request_skill)]
+
+    def _rarity(self, word):
+        """단어 희소도 가중치 (해당 단어를 가진 기부자가 적을수록 큼, 0~1)"""
+        rarity = self._rarity_cache.get(word)
+        if rarity is None:
+            n = len(self._ids)
+            df = len(self._words.postings.get(word, ()))
+            rarity = math.log((n + 1) / (df + 1)) / math.log(n + 1) if n else 0.0
+            self._rarity_cache[word] = rarity
+        return rarity
+
+    def _graded_score(self, pos, request_words, cache=None):
+        """위치 pos 기부자의 단계별 점수 (wild 매칭이 성립한다고 가정)
+
+        cache가 주어지면 같은 단어 구성을 가진 기부자의 점수를 재사용합니다.
+        """
+        donor_words = self._donor_words[pos]
+        if cache is not None and donor_words in cache:
+            return cache[donor_words]
+        total = 0.0
+        for req_word in request_words:
+            best = 0.0
+            for word in donor_words:
+                similarity = _containment(req_word, word)
+                if similarity:
+                    # 일치 정도 × 기부자 단어의 희소도 (흔한 재능일수록 낮은 점수)
+                    best = max(best, similarity * (0.5 + 0.5 * self._rarity(word)))
+            total += best
+        score = total / len(request_words) if request_words else 0.0
+        score = round(max(score, MIN_MATCH_SCORE), 4)
+        if cache is not None:
+            cache[donor_words] = score
+        return score
+
+    def score(self, donor_id, request_skill):
+        """기부자 한 명과 수요자 재능의 단계별 매칭 점수 (0 또는 MIN_MATCH_SCORE~1)"""
+        pos = self._positions.get(donor_id)
+        if pos is None or not calculate_match_score(self._skills[pos], request_skill):
+            return 0.0
+        return self._graded_score(pos, _skill_words(request_skill))
+
+    def _word_contributions(self, request_words):
+        """수요 단어별 (기여도, 관련 기부자 단어) 리스트 (기여도 내림차순)
+
+        기여도는 `_graded_score`에서 그 단어가 수요 단어 하나에 줄 수 있는 점수입니다.
+        """
+        contributions = []
+        for req_word in request_words:
+            related = self._words.keys_containing(req_word) | self._words.keys_contained_in(req_word)
+            contributions.append(sorted(
+                ((_containment(req_word, word) * (0.5 + 0.5 * self._rarity(word)), word) for word in related),
+                reverse=True,
+            ))
+        return contributions
+
+    def _bounded_top_k(self, request_skill, request_words, k):
+        """기여도가 큰 기부자 단어의 posting부터 훑으며 상위 k명을 찾고, 남은 후보의 점수 상한이
+        k번째 점수보다 낮아지면 멈춤 (threshold algorithm)
+
+        흔한 재능이라도 모든 후보를 채점하지 않으므로 비용이 후보 수가 아니라 k에 가깝습니다.
+        결과는 모든 후보를 채점한 것과 같습니다 (동점은 추가된 순서).
+        """
+        contributions = self._word_contributions(request_words)
+        heads = [0] * len(contributions)
+        entries = sorted(
+            ((c, i, word) for i, entry in enumerate(contributions) for c, word in entry),
+            key=lambda e: -e[0],
+        )
+
+        def limit():
+            # 아직 보지 못한 기부자가 받을 수 있는 최고 점수 (반올림 전 오차를 넉넉히 포함)
+            upper = sum(entry[h][0] for entry, h in zip(contributions, heads) if h < len(entry))
+            upper = upper / len(request_words) * (1 + 1e-9) + 1e-12
+            return round(max(upper, MIN_MATCH_SCORE), 4)
+
+        cache = {}
+        seen = set()
+        best = []  # (score, -pos) 최소 힙
+
+        def offer(pos):
+            item = (self._graded_score(pos, request_words, cache), -pos)
+            if len(best) < k:
+                heapq.heappush(best, item)
+            elif item > best[0]:
+                heapq.heapreplace(best, item)
+
+        for c, i, word in entries:
+            current = limit()
+            heads[i] += 1
+            rest = limit()
+            for pos in sorted(self._words.postings[word] - seen):
+                seen.add(pos)
+                offer(pos)
+                if len(best) == k:
+                    kth, kth_pos = best[0][0], -best[0][1]
+                    # 이 posting의 남은 기부자(위치가 더 뒤)와 다른 기부자 모두 k번째를 넘을 수 없음
+                    if (kth > current or (kth == current and kth_pos <= pos)) and kth > rest:
+                        return sorted(best, reverse=True)
+            if len(best) == k and best[0][0] > rest:
+                return sorted(best, reverse=True)
+
+        # 남은 후보는 단어 단위로 겹치지 않아 최소 점수: 추가된 순서대로 채움
+        for pos in self._lookup_positions(request_skill):
+            if pos in seen:
+                continue
+            if len(best) == k and best[0] > (MIN_MATCH_SCORE, -pos):
+                break
+            offer(pos)
+        return sorted(best, reverse=True)
+
+    def top_k(self, request_skill, k=None):
+        """수요자 재능에 대해 점수가 높은 기부자 k명
+
+        k가 주어지면 점수 상한으로 후보를 잘라 k명을 찾으므로 흔한 재능도 모든 후보를 채점하지 않습니다.
+
+        Args:
+            request_skill: 수요자가 필요한 재능
+            k: 반환할 최대 기부자 수 (None이면 매칭되는 전체)
+
+        Returns:
+            list: (donor_id, score) 튜플 리스트 (점수 내림차순, 동점은 추가된 순서)
+        """
+        request_words = _skill_words(request_skill)
+        if k is not None:
+            if k <= 0 or not request_words:
+                return []
+            best = self._bounded_top_k(request_skill, request_words, k)
+        else:
+            cache = {}
+            best = sorted(((self._graded_score(pos, request_words, cache), -pos)
+                           for pos in self._lookup_positions(request_skill)), reverse=True)
+        return [(self._ids[-neg_pos], score) for score, neg_pos in best]
+
+
+def top_k_matches(request_skill, k, index):
+    """수요자 한 명에 대해 점수가 높은 기부자 k명 (SkillIndex.top_k 참고)"""
+    return index.top_k(request_skill, k)
+
+
+def top_k_frames(donors_df, requests_df, k=None, index=None):
+    """수요자별로 점수가 높은 기부자 k명을 일괄 계산
+
+    결과 크기는 k × 수요자 수로 제한됩니다.
+
+    Args:
+        donors_df: donor_id, skill 컬럼을 가진 기부자 DataFrame
+        requests_df: request_id, needed_skill 컬럼을 가진 수요 DataFrame
+        k: 수요자별 최대 기부자 수 (None이면 매칭되는 전체)
+        index: 미리 만든 SkillIndex (없으면 donors_df로 생성, 있으면 donors_df는 None이어도 됨)
+
+    Returns:
+        pd.DataFrame: donor_id, request_id, score 컬럼 (수요자 순서 → 점수 내림차순)
+    """
+    columns = ["donor_id", "request_id", "score"]
+    if index is None:
+        if donors_df is None or donors_df.empty:
+            return pd.DataFrame(columns=columns)
+        index = SkillIndex.from_frame(donors_df)
+    if not len(index) or requests_df.empty:
+        return pd.DataFrame(columns=columns)
+
+    cache = {}
+    rows = []
+    # Arrow 문자열 컬럼도 빠르게 순회하도록 파이썬 리스트로 변환
+    request_ids = requests_df["request_id"].tolist()
+    for request_id, request_skill in zip(request_ids, requests_df["needed_skill"].tolist()):
+        key = request_skill if isinstance(request_skill, str) else None
+        if key not in cache:
+            cache[key] = index.top_k(key, k)
+        rows.extend((donor_id, request_id, score) for donor_id, score in cache[key])
+    return pd.DataFrame(rows, columns=columns)
+
+
+def score_pairs(pairs, requests_df, index):
+    """match_frames 결과의 score를 단계별 점수로 바꾼 DataFrame 반환
+
+    Args:
+        pairs: donor_id, request_id 컬럼을 가진 매칭 쌍 DataFrame
+        requests_df: request_id, needed_skill 컬럼을 가진 수요 DataFrame
+        index: 전체 기부자로 만든 SkillIndex (희소도 계산 기준)
+    """
+    if pairs.empty:
+        return pairs
+    needed = pairs["request_id"].map(requests_df.set_index("request_id")["needed_skill"])
+    scores = [index.score(donor_id, skill)
+              for donor_id, skill in zip(pairs["donor_id"].tolist(), needed.tolist())]
+    return pairs.assign(score=scores)
+
+
+# 배치 작업자 프로세스별 기부자 색인 (작업자 초기화 시 한 번만 생성)
+_worker_index = None
+
+
+def _init_batch_worker(donors):
+    global _worker_index
+    _worker_index = SkillIndex(donors)
+
+
+def _match_shard(shard, k):
+    """수요 묶음 하나를 작업자의 기부자 색인으로 매칭"""
+    rows = []
+    for request_id, request_skill in shard:
+        rows.extend((donor_id, request_id, score) for donor_id, score in _worker_index.top_k(request_skill, k))
+    return rows
+
+
+def _read_frame(path):
+    """CSV 또는 Parquet 파일을 DataFrame으로 읽기"""
+    if path.lower().endswith((".parquet", ".pq")):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+
+
+class _PairWriter:
+    """매칭 결과를 CSV 또는 Parquet 파일로 묶음 단위로 이어 쓰기"""
+
+    def __init__(self, path):
+        self.path = path
+        self._parquet = path.lower().endswith((".parquet", ".pq"))
+        self._writer = None
+        self._first = True
+
+    def write(self, frame):
+        if self._parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema, compression="zstd")
+            self._writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="w" if self._first else "a", header=self._first,
+                         index=False, encoding="utf-8-sig" if self._first else "utf-8")
+        self._first = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+def batch_match(donors_df, requests_df, workers=None, shard_size=2000, k=None, on_shard=None):
+    """기부자 × 수요 전체 매칭을 여러 프로세스로 나누어 계산
+
+    수요 쪽을 shard_size개씩 나누어 ProcessPoolExecutor로 분산하고, 각 작업자는 기부자 색인을
+    한 번만 생성합니다. 점수는 `SkillIndex.top_k`의 단계별 점수입니다.
+
+    Args:
+        donors_df: donor_id, skill 컬럼을 가진 기부자 DataFrame
+        requests_df: request_id, needed_skill 컬럼을 가진 수요 DataFrame
+        workers: 작업자 프로세스 수 (None이면 CPU 수)
+        shard_size: 작업 단위당 수요 수
+        k: 수요자별 최대 기부자 수 (None이면 매칭되는 전체)
+        on_shard: 묶음 결과 DataFrame을 받아 처리하는 함수 (예: 파일로 이어 쓰기)
+
+    Returns:
+        dict: {"pairs_evaluated", "matches", "seconds", "pairs_per_second"}
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    import time
+
+    columns = ["donor_id", "request_id", "score"]
+    donors = list(zip(donors_df["donor_id"], donors_df["skill"]))
+    requests = list(zip(requests_df["request_id"], requests_df["needed_skill"]))
+    shards = [requests[i:i + shard_size] for i in range(0, len(requests), shard_size)]
+
+    started = time.perf_counter()
+    match_count = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker, initargs=(donors,)) as pool:
+        for rows in pool.map(_match_shard, shards, [k] * len(shards)):
+            match_count += len(rows)
+            if on_shard and rows:
+                on_shard(pd.DataFrame(rows, columns=columns))
+    seconds = time.perf_counter() - started
+
+    pairs_evaluated = len(donors) * len(requests)
+    return {
+        "pairs_evaluated": pairs_evaluated,
+        "matches": match_count,
+        "seconds": seconds,
+        "pairs_per_second": pairs_evaluated / seconds if seconds else 0.0,
+    }
+
+
+def main(argv=None):
+    """명령줄 진입점: python -m matching batch ..."""
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(prog="python -m matching", description="재능기부 Wild 매칭 배치 작업")
+    commands = parser.add_subparsers(dest="command", required=True)
+    batch = commands.add_parser("batch", help="전체 기부자 × 수요 매칭 일괄 계산")
+    batch.add_argument("--donors", help="기부자 CSV/Parquet 파일 (생략 시 --from-db 필요)")
+    batch.add_argument("--requests", help="수요 CSV/Parquet 파일 (생략 시 --from-db 필요)")
+    batch.add_argument("--from-db", action="store_true", help="database.load_table로 Supabase에서 읽기")
+    batch.add_argument("--output", help="결과를 저장할 CSV/Parquet 파일")
+    batch.add_argument("--upsert", action="store_true", help="결과로 matches 테이블 전체 교체")
+    batch.add_argument("--workers", type=int, help="작업자 프로세스 수 (기본: CPU 수)")
+    batch.add_argument("--shard-size", type=int, default=2000, help="작업 단위당 수요 수 (기본 2000)")
+    batch.add_argument("--top-k", type=int,
+                       help="수요자별 최대 기부자 수 (기본: 전체, --upsert이면 MATCH_TOP_K 설정)")
+    args = parser.parse_args(argv)
+
+    if args.from_db:
+        from database import load_table
+        donors_df = load_table("donors", columns=["donor_id", "skill"])
+        requests_df = load_table("requests", columns=["request_id", "needed_skill", "status"])
+        if "donor_id" not in donors_df.columns or "request_id" not in requests_df.columns:
+            # 조회 실패 시 load_table은 빈 DataFrame을 반환 (오류 표시는 Streamlit 화면에서만 보임)
+            print("DB에서 기부자/수요 데이터를 읽지 못했습니다. "
+                  "SUPABASE_URL/SUPABASE_KEY 설정(secrets 또는 환경 변수)과 연결 상태를 확인하세요.", file=sys.stderr)
+            return 1
+    elif args.donors and args.requests:
+        donors_df = _read_frame(args.donors)
+        requests_df = _read_frame(args.requests)
+    else:
+        parser.error("--donors와 --requests 파일을 지정하거나 --from-db를 사용하세요")
+    if not args.output and not args.upsert:
+        parser.error("--output 또는 --upsert 중 하나 이상을 지정하세요")
+    if args.upsert and args.top_k is None:
+        # matches 테이블에는 수요자별 상위 k건만 저장
+        from database import match_top_k
+        args.top_k = match_top_k()
+
+    writer = _PairWriter(args.output) if args.output else None
+    collected = []
+
+    def on_shard(frame):
+        if writer:
+            writer.write(frame)
+        if args.upsert:
+            collected.append(frame)
+
+    try:
+        stats = batch_match(donors_df, requests_df, args.workers, args.shard_size, args.top_k, on_shard)
+    finally:
+        if writer:
+            writer.close()
+
+    print(f"기부자 {len(donors_df)}명 × 수요 {len(requests_df)}건 = {stats['pairs_evaluated']}쌍, "
+          f"매칭 {stats['matches']}건, {stats['seconds']:.2f}초 "
+          f"({stats['pairs_per_second']:,.0f} pairs/s)", file=sys.stderr)
+
+    if args.upsert:
+        from database import store_matches
+        pairs = pd.concat(collected, ignore_index=True) if collected else pd.DataFrame(
+            columns=["donor_id", "request_id", "score"])
+        if "status" not in requests_df.columns:
+            requests_df = requests_df.assign(status="대기")
+        stored = store_matches(pairs, requests_df)
+        print(f"matches 테이블에 {stored}건 저장", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,211 @@
+"""성능 계측 (DB 요청/DataFrame 생성/매칭 시간, 행 수, 바이트 수)
+
+database.py가 모든 요청을 기록하고, app.py의 사이드바 성능 패널이 이번 실행(rerun)의
+구간별 시간과 누적 p50/p95를 보여줍니다. 기록은 프로세스 전역이며 최근
+PERF_METRICS_BUFFER개(기본 5000)만 유지하고, 누적 합계는 재시작 전까지 유지됩니다.
+JSON(`to_json`) 또는 Prometheus 텍스트(`to_prometheus`)로 내보낼 수 있습니다.
+PERF_METRICS = 0으로 설정하면 기록하지 않습니다.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional
+
+_lock = threading.Lock()
+_events = deque(maxlen=int(os.environ.get("PERF_METRICS_BUFFER", 5000)))
+_totals = {}  # (kind, operation, table) -> {"count", "errors", "seconds", "rows", "bytes"}
+_sequence = 0
+_local = threading.local()
+_startup_phases = set()  # record_startup으로 이미 기록한 단계
+
+def current_owner() -> int:
+    """기록을 묶는 기준 (기본: 현재 스레드, bind_owner로 다른 스레드에 넘길 수 있음)"""
+    return getattr(_local, "owner", None) or threading.get_ident()
+
+@contextmanager
+def bind_owner(owner: int):
+    """작업 스레드의 기록을 요청한 스레드(세션 실행)의 것으로 표시"""
+    previous = getattr(_local, "owner", None)
+    _local.owner = owner
+    try:
+        yield
+    finally:
+        _local.owner = previous
+
+def enabled() -> bool:
+    """계측 사용 여부 (PERF_METRICS 환경 변수, 기본 1)"""
+    return os.environ.get("PERF_METRICS", "1") != "0"
+
+def payload_bytes(data) -> int:
+    """요청/응답 데이터의 JSON 직렬화 크기 (바이트)"""
+    if not data:
+        return 0
+    return len(json.dumps(data, ensure_ascii=False, default=str).encode("utf-8"))
+
+def record(kind: str, operation: str, table: str, seconds: float,
+           rows: int = 0, nbytes: int = 0, error: bool = False, **extra):
+    """계측 이벤트 한 건 기록
+
+    Args:
+        kind: 구분 ("db", "dataframe", "matching", "export", "startup")
+        operation: 작업 이름 (select, insert, upsert, update, delete, refresh, rebuild 등)
+        table: 대상 테이블
+        seconds: 걸린 시간(초)
+        rows: 처리한 행 수
+        nbytes: 주고받은 데이터 크기(바이트)
+        error: 실패 여부
+        extra: 추가 수치 (예: 매칭의 pairs, matches)
+    """
+    global _sequence
+    if not enabled():
+        return
+    with _lock:
+        _sequence += 1
+        _events.append({
+            "seq": _sequence,
+            "owner": current_owner(),
+            "at": time.time(),
+            "kind": kind,
+            "operation": operation,
+            "table": table,
+            "seconds": seconds,
+            "rows": rows,
+            "bytes": nbytes,
+            "error": error,
+            **extra,
+        })
+        total = _totals.setdefault((kind, operation, table),
+                                   {"count": 0, "errors": 0, "seconds": 0.0, "rows": 0, "bytes": 0})
+        total["count"] += 1
+        total["errors"] += int(error)
+        total["seconds"] += seconds
+        total["rows"] += rows
+        total["bytes"] += nbytes
+        for key, value in extra.items():
+            total[key] = total.get(key, 0) + value
+
+def record_startup(phase: str, seconds: float) -> bool:
+    """프로세스 시작 구간(모듈 import, 첫 화면 표시 등) 시간을 단계별로 한 번만 기록
+
+    Returns:
+        bool: 이번 호출에서 기록했는지 여부
+    """
+    with _lock:
+        if phase in _startup_phases:
+            return False
+        _startup_phases.add(phase)
+    record("startup", phase, "app", seconds)
+    return True
+
+@contextmanager
+def timed(kind: str, operation: str, table: str):
+    """블록 실행 시간을 기록하는 컨텍스트 매니저 (yield된 dict에 rows/nbytes 등을 채움)"""
+    stats = {"rows": 0, "nbytes": 0}
+    start = time.perf_counter()
+    try:
+        yield stats
+    except Exception:
+        record(kind, operation, table, time.perf_counter() - start, error=True, **stats)
+        raise
+    record(kind, operation, table, time.perf_counter() - start, **stats)
+
+def mark() -> tuple:
+    """현재 스레드의 실행 구간 시작 표시 (events_since에 전달)"""
+    with _lock:
+        return _sequence, time.perf_counter()
+
+def events_since(marker: tuple, own_only: bool = True) -> list:
+    """mark() 이후 기록된 이벤트 (기본: current_owner, 즉 현재 세션 실행분만)"""
+    owner = current_owner()
+    with _lock:
+        return [e for e in _events
+                if e["seq"] > marker[0] and (not own_only or e["owner"] == owner)]
+
+def _percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+def breakdown(events: list) -> list:
+    """이벤트를 (구분, 작업, 테이블)별로 묶은 합계 목록 (시간이 긴 순)"""
+    groups = {}
+    for event in events:
+        group = groups.setdefault((event["kind"], event["operation"], event["table"]),
+                                  {"count": 0, "seconds": 0.0, "rows": 0, "bytes": 0})
+        group["count"] += 1
+        group["seconds"] += event["seconds"]
+        group["rows"] += event["rows"]
+        group["bytes"] += event["bytes"]
+    return sorted(
+        ({"kind": k, "operation": o, "table": t, **v} for (k, o, t), v in groups.items()),
+        key=lambda g: g["seconds"], reverse=True,
+    )
+
+def summary() -> list:
+    """(구분, 작업, 테이블)별 누적 합계와 최근 이벤트 기준 p50/p95 지연 시간(초)"""
+    with _lock:
+        latencies = {}
+        for event in _events:
+            latencies.setdefault((event["kind"], event["operation"], event["table"]), []).append(event["seconds"])
+        totals = {key: dict(value) for key, value in _totals.items()}
+    return [
+        {"kind": k, "operation": o, "table": t, **total,
+         "p50": _percentile(latencies.get((k, o, t), []), 0.5),
+         "p95": _percentile(latencies.get((k, o, t), []), 0.95)}
+        for (k, o, t), total in sorted(totals.items())
+    ]
+
+def reset():
+    """기록 전체 삭제"""
+    with _lock:
+        _events.clear()
+        _totals.clear()
+
+def to_json(events: Optional[list] = None) -> str:
+    """누적 요약과 최근 이벤트를 JSON 문자열로 내보내기"""
+    with _lock:
+        recent = list(_events) if events is None else events
+    return json.dumps({"summary": summary(), "events": recent}, ensure_ascii=False, default=str)
+
+def _labels(kind: str, operation: str, table: str, **more) -> str:
+    """Prometheus 레이블 문자열 (역슬래시/큰따옴표/줄바꿈 이스케이프)"""
+    labels = {"kind": kind, "operation": operation, "table": table, **more}
+    escaped = {
+        key: str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        for key, value in labels.items()
+    }
+    return ",".join(f'{key}="{value}"' for key, value in escaped.items())
+
+def to_prometheus(prefix: str = "talent") -> str:
+    """누적 요약을 Prometheus 텍스트 형식으로 내보내기"""
+    lines = [
+        f"# HELP {prefix}_operation_seconds Latency of database requests, DataFrame builds and matching passes.",
+        f"# TYPE {prefix}_operation_seconds summary",
+    ]
+    rows = summary()
+    for row in rows:
+        base = (row["kind"], row["operation"], row["table"])
+        lines.append(f"{prefix}_operation_seconds{{{_labels(*base, quantile='0.5')}}} {row['p50']:.6f}")
+        lines.append(f"{prefix}_operation_seconds{{{_labels(*base, quantile='0.95')}}} {row['p95']:.6f}")
+        lines.append(f"{prefix}_operation_seconds_sum{{{_labels(*base)}}} {row['seconds']:.6f}")
+        lines.append(f"{prefix}_operation_seconds_count{{{_labels(*base)}}} {row['count']}")
+    counters = [
+        ("errors", "Failed operations."),
+        ("rows", "Rows read or written."),
+        ("bytes", "JSON payload bytes sent or received."),
+        ("pairs", "Donor/request pairs evaluated by matching."),
+        ("matches", "Matches produced by matching."),
+    ]
+    for name, help_text in counters:
+        series = [row for row in rows if name in row]
+        if not series:
+            continue
+        lines.append(f"# HELP {prefix}_{name}_total {help_text}")
+        lines.append(f"# TYPE {prefix}_{name}_total counter")
+        for row in series:
+            lines.append(f"{prefix}_{name}_total{{{_labels(row['kind'], row['operation'], row['table'])}}} {row[name]}")
+    return "\n".join(lines) + "\n"
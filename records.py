@@ -0,0 +1,46 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+# 등록 폼과 일괄 가져오기에서 공통으로 사용하는 선택지
+DONOR_MODES = ["온라인", "오프라인", "온라인/오프라인"]
+REQUEST_STATUSES = ["대기", "처리 완료", "취소"]
+
+def validate_donor(row: dict) -> Optional[str]:
+    """재능기부자 입력 검증 (문제가 없으면 None, 있으면 오류 메시지 반환)"""
+    if not row.get("name") or not row.get("email") or not row.get("skill"):
+        return "필수 항목(이름, 이메일, 재능)을 모두 입력해주세요."
+    if row.get("mode") not in DONOR_MODES:
+        return f"방식은 {', '.join(DONOR_MODES)} 중 하나여야 합니다."
+    return None
+
+def validate_request(row: dict) -> Optional[str]:
+    """재능 수요 입력 검증 (문제가 없으면 None, 있으면 오류 메시지 반환)"""
+    if not row.get("email") or not row.get("needed_skill"):
+        return "필수 항목(이메일, 필요한 재능)을 모두 입력해주세요."
+    return None
+
+def new_donor_row(name: str, email: str, skill: str, mode: str, availability: str = "",
+                  created_at: Optional[str] = None) -> dict:
+    """donors 테이블에 추가할 행 생성 (donor_id, created_at 자동 생성)"""
+    return {
+        "donor_id": str(uuid.uuid4()),
+        "name": name,
+        "email": email,
+        "skill": skill,
+        "mode": mode,
+        "availability": availability if availability else "",
+        "created_at": created_at or datetime.now().isoformat()
+    }
+
+def new_request_row(email: str, needed_skill: str, description: str = "",
+                    created_at: Optional[str] = None) -> dict:
+    """requests 테이블에 추가할 행 생성 (request_id, created_at 자동 생성, 상태는 '대기')"""
+    return {
+        "request_id": str(uuid.uuid4()),
+        "email": email,
+        "needed_skill": needed_skill,
+        "description": description if description else "",
+        "status": "대기",
+        "created_at": created_at or datetime.now().isoformat()
+    }
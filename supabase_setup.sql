@@ -1,5 +1,5 @@
 -- Supabase 테이블 생성 SQL 스크립트
--- Supabase 대시보드의 SQL Editor에서 실행하세요
+-- Supabase 대시보드의 SQL Editor에서 실행하세요 (모든 문장이 IF NOT EXISTS/OR REPLACE/DROP ... IF EXISTS 형태라 다시 실행해도 됩니다)
 
 -- Donors 테이블 생성
 CREATE TABLE IF NOT EXISTS donors (
@@ -27,30 +27,234 @@ CREATE TABLE IF NOT EXISTS matches (
     match_id TEXT PRIMARY KEY,
     donor_id TEXT NOT NULL,
     request_id TEXT NOT NULL,
-    score INTEGER NOT NULL,
+    score REAL NOT NULL,
+    rank INTEGER NOT NULL DEFAULT 1,
     status TEXT NOT NULL DEFAULT '대기',
     created_at TEXT NOT NULL,
     FOREIGN KEY (donor_id) REFERENCES donors(donor_id),
     FOREIGN KEY (request_id) REFERENCES requests(request_id)
 );
 
+-- 증분 동기화용 updated_at 컬럼 (기존 테이블에도 적용되도록 ADD COLUMN IF NOT EXISTS 사용)
+ALTER TABLE donors ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT now();
+ALTER TABLE requests ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT now();
+ALTER TABLE matches ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT now();
+
+-- 행이 수정될 때마다 updated_at 갱신
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS donors_set_updated_at ON donors;
+CREATE TRIGGER donors_set_updated_at BEFORE UPDATE ON donors
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+DROP TRIGGER IF EXISTS requests_set_updated_at ON requests;
+CREATE TRIGGER requests_set_updated_at BEFORE UPDATE ON requests
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+DROP TRIGGER IF EXISTS matches_set_updated_at ON matches;
+CREATE TRIGGER matches_set_updated_at BEFORE UPDATE ON matches
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+-- 증분 조회(updated_at >= 기준 시각)용 인덱스
+CREATE INDEX IF NOT EXISTS donors_updated_at_idx ON donors (updated_at);
+CREATE INDEX IF NOT EXISTS requests_updated_at_idx ON requests (updated_at);
+CREATE INDEX IF NOT EXISTS matches_updated_at_idx ON matches (updated_at);
+
+-- 서버 측 검색(ilike '%검색어%')용 trigram GIN 인덱스
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS donors_name_trgm_idx ON donors USING GIN (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS donors_email_trgm_idx ON donors USING GIN (email gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS donors_skill_trgm_idx ON donors USING GIN (skill gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS requests_email_trgm_idx ON requests USING GIN (email gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS requests_needed_skill_trgm_idx ON requests USING GIN (needed_skill gin_trgm_ops);
+
+-- 상태 필터 및 등록일시 정렬용 B-tree 인덱스
+CREATE INDEX IF NOT EXISTS requests_status_idx ON requests (status);
+CREATE INDEX IF NOT EXISTS donors_created_at_idx ON donors (created_at);
+CREATE INDEX IF NOT EXISTS requests_created_at_idx ON requests (created_at);
+
+-- 단계별 매칭 점수(0~1) 저장 (기존 INTEGER 컬럼 변환)
+ALTER TABLE matches ALTER COLUMN score TYPE REAL;
+
+-- 매칭 결과 조회/갱신용 인덱스 (match_id는 '기부자ID:수요ID' 형식)
+CREATE UNIQUE INDEX IF NOT EXISTS matches_donor_request_idx ON matches (donor_id, request_id);
+CREATE INDEX IF NOT EXISTS matches_request_id_idx ON matches (request_id);
+
+-- 수요자별 점수 순위 (수요자당 상위 MATCH_TOP_K건만 저장, 기존 행은 전체 재계산 시 채워짐)
+ALTER TABLE matches ADD COLUMN IF NOT EXISTS rank INTEGER NOT NULL DEFAULT 1;
+CREATE INDEX IF NOT EXISTS matches_rank_idx ON matches (rank);
+
+-- 현황 화면 통계용 그룹 개수 (database.table_stats가 행 전체 대신 이 뷰만 조회)
+CREATE OR REPLACE VIEW table_stats AS
+SELECT 'donors' AS table_name, 'mode' AS column_name, mode AS value, COUNT(*) AS count
+FROM donors GROUP BY mode
+UNION ALL
+SELECT 'requests' AS table_name, 'status' AS column_name, status AS value, COUNT(*) AS count
+FROM requests GROUP BY status;
+
+-- 서버 측 매칭: matching.calculate_match_score와 같은 규칙(정규화 후 기부자/수요자 단어 중
+-- 한쪽이 다른 쪽에 포함되면 매칭)을 SQL 함수 match_pairs로 처리 (client.rpc("match_pairs", {...}))
+-- 동의어 사전 (matching.SKILL_SYNONYMS와 같게 유지, 바꾼 뒤에는 아래 skill_tokens 채우기를 다시 실행)
+CREATE TABLE IF NOT EXISTS skill_synonyms (
+    alias TEXT PRIMARY KEY,
+    canonical TEXT NOT NULL
+);
+
+INSERT INTO skill_synonyms (alias, canonical) VALUES
+    ('python', '파이썬'), ('java', '자바'), ('javascript', '자바스크립트'), ('js', '자바스크립트'),
+    ('english', '영어'), ('math', '수학'), ('mathematics', '수학'), ('coding', '코딩'),
+    ('programming', '코딩'), ('프로그래밍', '코딩'), ('design', '디자인'), ('piano', '피아노'),
+    ('data', '데이터')
+ON CONFLICT (alias) DO UPDATE SET canonical = EXCLUDED.canonical;
+
+-- 정규화된 재능 단어 (kind: 'donor' 또는 'request', 트리거로 자동 갱신)
+CREATE TABLE IF NOT EXISTS skill_tokens (
+    kind TEXT NOT NULL,
+    owner_id TEXT NOT NULL,
+    word TEXT NOT NULL,
+    PRIMARY KEY (kind, owner_id, word)
+);
+
+-- 기부자 단어가 수요자 단어에 포함되는 경우(부분 문자열 일치)용 B-tree 인덱스
+CREATE INDEX IF NOT EXISTS skill_tokens_word_idx ON skill_tokens (kind, word);
+-- 수요자 단어가 기부자 단어에 포함되는 경우(LIKE '%단어%')용 trigram GIN 인덱스
+CREATE INDEX IF NOT EXISTS skill_tokens_word_trgm_idx ON skill_tokens USING GIN (word gin_trgm_ops);
+
+-- 재능 문자열 → 정규화된 단어 (NFKC, 소문자, 문장 부호 → 공백, 쉼표/공백 분리, 동의어 → 대표 표기)
+CREATE OR REPLACE FUNCTION skill_words(p_text TEXT) RETURNS SETOF TEXT AS $$
+    SELECT DISTINCT COALESCE(s.canonical, w.word)
+    FROM regexp_split_to_table(
+        regexp_replace(lower(normalize(COALESCE(p_text, ''), NFKC)),
+                       '[()\[\]{}<>/\\|·•・''"!?;:~`]', ' ', 'g'),
+        '[[:space:],]+'
+    ) AS w(word)
+    LEFT JOIN skill_synonyms s ON s.alias = w.word
+    WHERE w.word <> ''
+$$ LANGUAGE sql STABLE;
+
+-- 단어의 모든 부분 문자열
+CREATE OR REPLACE FUNCTION word_substrings(p_word TEXT) RETURNS TEXT[] AS $$
+    SELECT array_agg(DISTINCT substr(p_word, i, n))
+    FROM generate_series(1, char_length(p_word)) AS i,
+         generate_series(1, char_length(p_word) - i + 1) AS n
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION sync_skill_tokens() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'donors' THEN
+        IF TG_OP <> 'INSERT' THEN
+            DELETE FROM skill_tokens WHERE kind = 'donor' AND owner_id = OLD.donor_id;
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            INSERT INTO skill_tokens (kind, owner_id, word)
+            SELECT 'donor', NEW.donor_id, w FROM skill_words(NEW.skill) AS w
+            ON CONFLICT DO NOTHING;
+        END IF;
+    ELSE
+        IF TG_OP <> 'INSERT' THEN
+            DELETE FROM skill_tokens WHERE kind = 'request' AND owner_id = OLD.request_id;
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            INSERT INTO skill_tokens (kind, owner_id, word)
+            SELECT 'request', NEW.request_id, w FROM skill_words(NEW.needed_skill) AS w
+            ON CONFLICT DO NOTHING;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS donors_sync_skill_tokens ON donors;
+CREATE TRIGGER donors_sync_skill_tokens AFTER INSERT OR DELETE OR UPDATE OF skill ON donors
+    FOR EACH ROW EXECUTE FUNCTION sync_skill_tokens();
+DROP TRIGGER IF EXISTS requests_sync_skill_tokens ON requests;
+CREATE TRIGGER requests_sync_skill_tokens AFTER INSERT OR DELETE OR UPDATE OF needed_skill ON requests
+    FOR EACH ROW EXECUTE FUNCTION sync_skill_tokens();
+
+-- 기존 데이터의 단어 채우기
+INSERT INTO skill_tokens (kind, owner_id, word)
+SELECT 'donor', d.donor_id, w FROM donors d, skill_words(d.skill) AS w
+UNION ALL
+SELECT 'request', r.request_id, w FROM requests r, skill_words(r.needed_skill) AS w
+ON CONFLICT DO NOTHING;
+
+-- 매칭 쌍 (수요 ID → 기부자 ID 순, score는 calculate_match_score와 같은 1)
+-- p_status가 있으면 해당 상태의 수요만 (p_exclude_status = true이면 해당 상태를 제외)
+-- p_donor_ids가 있으면 해당 기부자만 (등록/수정된 기부자가 매칭되는 수요 찾기)
+-- 인자가 바뀐 이전 버전은 이름이 같은 다른 함수로 남아 호출이 모호해지므로 먼저 삭제
+DROP FUNCTION IF EXISTS match_pairs(TEXT, BOOLEAN, INTEGER, INTEGER);
+CREATE OR REPLACE FUNCTION match_pairs(
+    p_status TEXT DEFAULT NULL,
+    p_exclude_status BOOLEAN DEFAULT false,
+    p_limit INTEGER DEFAULT 1000,
+    p_offset INTEGER DEFAULT 0,
+    p_donor_ids TEXT[] DEFAULT NULL
+) RETURNS TABLE (donor_id TEXT, request_id TEXT, score INTEGER) AS $$
+    WITH request_words AS (
+        SELECT t.owner_id AS request_id, t.word
+        FROM skill_tokens t
+        JOIN requests r ON r.request_id = t.owner_id
+        WHERE t.kind = 'request'
+          AND (p_status IS NULL OR (r.status = p_status) <> p_exclude_status)
+    ), hits AS (
+        -- 기부자 단어가 수요자 단어에 포함
+        SELECT d.owner_id AS donor_id, q.request_id
+        FROM request_words q
+        JOIN skill_tokens d ON d.kind = 'donor' AND d.word = ANY (word_substrings(q.word))
+        WHERE p_donor_ids IS NULL OR d.owner_id = ANY (p_donor_ids)
+        UNION
+        -- 수요자 단어가 기부자 단어에 포함
+        SELECT d.owner_id AS donor_id, q.request_id
+        FROM request_words q
+        JOIN skill_tokens d ON d.kind = 'donor'
+         AND d.word LIKE '%' || replace(replace(replace(q.word, '\', '\\'), '%', '\%'), '_', '\_') || '%'
+        WHERE p_donor_ids IS NULL OR d.owner_id = ANY (p_donor_ids)
+    )
+    SELECT h.donor_id, h.request_id, 1 FROM hits h
+    ORDER BY h.request_id, h.donor_id
+    LIMIT p_limit OFFSET p_offset
+$$ LANGUAGE sql STABLE;
+
 -- RLS (Row Level Security) 정책 설정 (선택사항)
 -- 공개 읽기, 인증된 사용자만 쓰기 권한
 ALTER TABLE donors ENABLE ROW LEVEL SECURITY;
 ALTER TABLE requests ENABLE ROW LEVEL SECURITY;
 ALTER TABLE matches ENABLE ROW LEVEL SECURITY;
+ALTER TABLE skill_synonyms ENABLE ROW LEVEL SECURITY;
+ALTER TABLE skill_tokens ENABLE ROW LEVEL SECURITY;
 
 -- 모든 사용자가 읽기 가능
+DROP POLICY IF EXISTS "Public read access" ON donors;
 CREATE POLICY "Public read access" ON donors FOR SELECT USING (true);
+DROP POLICY IF EXISTS "Public read access" ON requests;
 CREATE POLICY "Public read access" ON requests FOR SELECT USING (true);
+DROP POLICY IF EXISTS "Public read access" ON matches;
 CREATE POLICY "Public read access" ON matches FOR SELECT USING (true);
+-- skill_tokens는 트리거(sync_skill_tokens)만 씀
+DROP POLICY IF EXISTS "Public read access" ON skill_synonyms;
+CREATE POLICY "Public read access" ON skill_synonyms FOR SELECT USING (true);
+DROP POLICY IF EXISTS "Public read access" ON skill_tokens;
+CREATE POLICY "Public read access" ON skill_tokens FOR SELECT USING (true);
 
 -- 모든 사용자가 쓰기 가능 (인증 필요시 수정)
+DROP POLICY IF EXISTS "Public insert access" ON donors;
 CREATE POLICY "Public insert access" ON donors FOR INSERT WITH CHECK (true);
+DROP POLICY IF EXISTS "Public insert access" ON requests;
 CREATE POLICY "Public insert access" ON requests FOR INSERT WITH CHECK (true);
+DROP POLICY IF EXISTS "Public insert access" ON matches;
 CREATE POLICY "Public insert access" ON matches FOR INSERT WITH CHECK (true);
 
 -- 모든 사용자가 업데이트 가능 (인증 필요시 수정)
+DROP POLICY IF EXISTS "Public update access" ON donors;
 CREATE POLICY "Public update access" ON donors FOR UPDATE USING (true);
+DROP POLICY IF EXISTS "Public update access" ON requests;
 CREATE POLICY "Public update access" ON requests FOR UPDATE USING (true);
+DROP POLICY IF EXISTS "Public update access" ON matches;
 CREATE POLICY "Public update access" ON matches FOR UPDATE USING (true);
+
+-- 매칭 결과 갱신 시 사라진 매칭 삭제 허용
+DROP POLICY IF EXISTS "Public delete access" ON matches;
+CREATE POLICY "Public delete access" ON matches FOR DELETE USING (true);
@@ -0,0 +1,263 @@
+"""database 모듈 테스트 (메모리 SQLite 백엔드, conftest.py의 db / seeded_db fixture)"""
+import pandas as pd
+import pytest
+
+import database
+import local_backend
+
+PAGE_SIZE = 7
+
+
+def _collect_pages(page, **kwargs):
+    """page(after=..., page_size=...)를 커서가 끝날 때까지 호출하여 페이지 목록 반환"""
+    pages, cursor = [], None
+    while True:
+        df, cursor = page(after=cursor, page_size=PAGE_SIZE, **kwargs)
+        assert len(df) <= PAGE_SIZE
+        pages.append(df)
+        if cursor is None:
+            return pages
+
+
+def _expected_order(df, sort_option, id_column):
+    """SORT_OPTIONS의 (정렬 컬럼, ID) 키셋 순서로 정렬한 ID 목록"""
+    column, desc = database.SORT_OPTIONS[sort_option]
+    return df.sort_values([column, id_column], ascending=not desc)[id_column].tolist()
+
+
+def _ids(pages, id_column):
+    return [row_id for df in pages if not df.empty for row_id in df[id_column]]
+
+
+# 키셋 페이지 (page_donors / page_requests / page_matches)
+
+@pytest.mark.parametrize("sort_option", ["등록일시 (최신순)", "등록일시 (오래된순)", "이름 (가나다순)"])
+@pytest.mark.parametrize("search_term", ["", "김", "파이썬"])
+def test_donor_pages_have_no_gaps_or_duplicates(seeded_db, sort_option, search_term):
+    donors, _ = seeded_db
+    if search_term:
+        columns = database.DONOR_SEARCH_COLUMNS
+        mask = donors[columns].apply(lambda c: c.str.lower().str.contains(search_term, regex=False)).any(axis=1)
+        donors = donors[mask]
+    ids = _ids(_collect_pages(database.page_donors, search_term=search_term, sort_option=sort_option), "donor_id")
+    assert ids == _expected_order(donors, sort_option, "donor_id")
+    assert database.count_donors(search_term) == len(ids)
+    assert _ids(database.iter_donors(search_term, sort_option), "donor_id") == ids
+
+
+@pytest.mark.parametrize("sort_option", ["등록일시 (최신순)", "상태"])
+@pytest.mark.parametrize("status_filter", ["전체", "대기", "처리 완료"])
+def test_request_pages_have_no_gaps_or_duplicates(seeded_db, sort_option, status_filter):
+    _, requests = seeded_db
+    if status_filter != "전체":
+        requests = requests[(requests["status"] == "대기") == (status_filter == "대기")]
+    ids = _ids(_collect_pages(database.page_requests, status_filter=status_filter, sort_option=sort_option),
+               "request_id")
+    assert ids == _expected_order(requests, sort_option, "request_id")
+    assert database.count_requests("", status_filter) == len(ids)
+
+
+def test_pages_stay_consistent_when_rows_are_added(seeded_db):
+    donors, _ = seeded_db
+    first, cursor = database.page_donors(after=None, page_size=PAGE_SIZE)
+    # 이미 본 페이지 앞쪽(최신순)에 새 행이 추가되어도 다음 페이지가 밀리지 않음
+    database.append_row("donors", {"donor_id": "new-donor", "name": "새기부자", "email": "new@example.com",
+                                   "skill": "피아노", "mode": "온라인", "availability": "주말",
+                                   "created_at": "2099-01-01T00:00:00"})
+    pages = [first]
+    while cursor is not None:
+        df, cursor = database.page_donors(after=cursor, page_size=PAGE_SIZE)
+        pages.append(df)
+    ids = _ids(pages, "donor_id")
+    assert ids == _expected_order(donors, "등록일시 (최신순)", "donor_id")
+
+
+@pytest.mark.parametrize("sort_option", ["매칭 점수 (높은순)", "수요자별", "등록일시 (최신순)"])
+@pytest.mark.parametrize("top_k", [1, 3])
+def test_match_pages_have_no_gaps_or_duplicates(seeded_db, monkeypatch, sort_option, top_k):
+    monkeypatch.setenv("MATCH_TOP_K", "5")
+    total = database.rebuild_matches()
+    matches = database.get_supabase_client().table("matches").select("*").execute().data
+    matches = pd.DataFrame(matches)
+    assert len(matches) == total
+    assert matches.groupby("request_id")["rank"].max().max() <= 5
+
+    expected = matches[matches["rank"] <= top_k]
+    ids = _ids(_collect_pages(database.page_matches, top_k=top_k, sort_option=sort_option), "match_id")
+    assert ids == _expected_order(expected, sort_option, "match_id")
+    assert database.count_matches("전체", top_k) == len(ids)
+    assert database.count_matches("전체", top_k, rank=1) == expected["request_id"].nunique()
+
+
+@pytest.fixture
+def max_rows(monkeypatch):
+    """PostgREST의 최대 행 수(max-rows)처럼 한 번에 돌려주는 행 수를 제한"""
+    cap = 10
+    original = local_backend._Query.limit
+
+    def limit(self, count):
+        return original(self, min(count, cap))
+
+    monkeypatch.setattr(local_backend._Query, "limit", limit)
+    return cap
+
+
+@pytest.mark.parametrize("search_term", ["", "파이썬"])
+def test_exports_are_not_cut_by_server_row_limit(seeded_db, max_rows, search_term):
+    donors, _ = seeded_db
+    expected = database.count_donors(search_term)
+    assert expected > max_rows
+    ids = _ids(database.iter_donors(search_term, "이름 (가나다순)"), "donor_id")
+    assert len(ids) == len(set(ids)) == expected
+
+
+@pytest.mark.parametrize("page_size", [None, 4, 1000])
+def test_table_chunks_are_not_cut_by_server_row_limit(seeded_db, max_rows, page_size, monkeypatch):
+    donors, _ = seeded_db
+    monkeypatch.setenv("SUPABASE_PAGE_SIZE", "1000")
+    ids = _ids(database.iter_table_chunks("donors", ["donor_id"], page_size=page_size), "donor_id")
+    assert sorted(ids) == sorted(donors["donor_id"])
+    database.invalidate_snapshot("donors")
+    assert len(database.load_table("donors")) == len(donors)
+
+
+# bulk_update
+
+DONORS = [
+    {"donor_id": f"d{i}", "name": f"기부자{i}", "email": f"d{i}@example.com", "skill": skill,
+     "mode": "온라인", "availability": "평일", "created_at": f"2024-01-0{i + 1}T00:00:00"}
+    for i, skill in enumerate(["파이썬", "피아노", "영어 회화", "수학"])
+]
+DONOR_COLUMNS = {"ID": "donor_id", "이름": "name", "이메일": "email", "재능": "skill",
+                 "방식": "mode", "가능 시간": "availability"}
+
+
+@pytest.fixture
+def donors_db(db):
+    db.get_supabase_client().table("donors").insert(DONORS).execute()
+    return db
+
+
+@pytest.fixture
+def updates(monkeypatch):
+    """local_backend에 보내진 update 값 기록"""
+    calls = []
+    original = local_backend._Query.update
+
+    def update(self, values):
+        calls.append((self._table, dict(values)))
+        return original(self, values)
+
+    monkeypatch.setattr(local_backend._Query, "update", update)
+    return calls
+
+
+def _server_rows(db):
+    rows = db.get_supabase_client().table("donors").select("*").execute().data
+    return {row["donor_id"]: row for row in rows}
+
+
+def _display_frame(df):
+    return df.rename(columns={v: k for k, v in DONOR_COLUMNS.items()})[list(DONOR_COLUMNS)]
+
+
+def test_find_changed_values_returns_only_changed_cells(donors_db):
+    original = _display_frame(donors_db.get_donors())
+    edited = original.copy()
+    edited.loc[edited["ID"] == "d1", "가능 시간"] = "주말"
+    edited.loc[edited["ID"] == "d2", ["이름", "재능"]] = ["새이름", None]
+    rows = donors_db.find_changed_values(original, edited, "ID", DONOR_COLUMNS)
+    assert sorted(rows, key=lambda r: r["donor_id"]) == [
+        {"donor_id": "d1", "availability": "주말"},
+        {"donor_id": "d2", "name": "새이름", "skill": ""},
+    ]
+    assert donors_db.find_changed_values(original, original.copy(), "ID", DONOR_COLUMNS) == []
+
+
+def test_bulk_update_sends_only_changed_columns(donors_db, updates):
+    result = donors_db.bulk_update("donors", [{"donor_id": "d0", "availability": "주말"}])
+    assert result == {"d0": True}
+    assert [values for table, values in updates if table == "donors"] == [{"availability": "주말"}]
+    assert _server_rows(donors_db)["d0"]["availability"] == "주말"
+
+
+def test_bulk_update_keeps_external_changes(donors_db):
+    original = _display_frame(donors_db.get_donors())
+    # 스냅샷을 읽은 뒤 다른 곳에서 이메일을 바꿈
+    donors_db.get_supabase_client().table("donors").update({"email": "external@example.com"}).eq(
+        "donor_id", "d1").execute()
+    edited = original.copy()
+    edited.loc[edited["ID"] == "d1", "가능 시간"] = "주말"
+    donors_db.bulk_update("donors", donors_db.find_changed_values(original, edited, "ID", DONOR_COLUMNS))
+    row = _server_rows(donors_db)["d1"]
+    assert row["availability"] == "주말"
+    assert row["email"] == "external@example.com"
+
+
+def test_bulk_update_groups_identical_changes(donors_db, updates, monkeypatch):
+    monkeypatch.setenv("BULK_CHUNK_SIZE", "2")
+    rows = [{"donor_id": f"d{i}", "mode": "오프라인"} for i in range(3)] + [{"donor_id": "d3", "mode": "둘 다"}]
+    assert donors_db.bulk_update("donors", rows) == {"d0": True, "d1": True, "d2": True, "d3": True}
+    # 같은 변경 3행 → 2개씩 2번, 다른 변경 1행 → 1번
+    assert [values for table, values in updates if table == "donors"] == [{"mode": "오프라인"}] * 2 + [{"mode": "둘 다"}]
+    assert {row_id: row["mode"] for row_id, row in _server_rows(donors_db).items()} == {
+        "d0": "오프라인", "d1": "오프라인", "d2": "오프라인", "d3": "둘 다"}
+
+
+def test_bulk_update_reports_missing_rows(donors_db):
+    donors_db.get_donors()
+    # 스냅샷에 없는 행(다른 곳에서 추가)과 서버에 없는 행
+    donors_db.get_supabase_client().table("donors").insert(
+        {**DONORS[0], "donor_id": "external", "email": "external@example.com"}).execute()
+    result = donors_db.bulk_update("donors", [{"donor_id": "external", "skill": "기타"},
+                                              {"donor_id": "missing", "skill": "기타"}])
+    assert result == {"external": True, "missing": False}
+    rows = _server_rows(donors_db)
+    assert rows["external"]["skill"] == "기타"
+    assert rows["external"]["name"] == DONORS[0]["name"]
+    assert "missing" not in rows
+
+
+def test_bulk_update_refreshes_matches(donors_db):
+    donors_db.get_supabase_client().table("requests").insert({
+        "request_id": "r0", "email": "r0@example.com", "needed_skill": "기타 레슨", "description": "",
+        "status": "대기", "created_at": "2024-02-01T00:00:00"}).execute()
+    donors_db.rebuild_matches()
+    assert donors_db.count_matches() == 0
+    donors_db.bulk_update("donors", [{"donor_id": "d2", "skill": "기타"}])
+    assert donors_db.wait_for_matches(10)
+    pairs = donors_db.get_supabase_client().table("matches").select("donor_id,request_id").execute().data
+    assert pairs == [{"donor_id": "d2", "request_id": "r0"}]
+
+
+# 매칭 갱신
+
+def _stored_pairs(db):
+    rows = db.get_supabase_client().table("matches").select("donor_id,request_id").execute().data
+    return {(row["donor_id"], row["request_id"]) for row in rows}
+
+
+def test_match_refresh_reads_rows_missing_from_snapshot(donors_db):
+    # 화면 스냅샷을 먼저 읽은 뒤 다른 곳에서 추가된 기부자도 갱신에 반영됨
+    donors_db.get_donors()
+    donors_db.get_supabase_client().table("donors").insert(
+        {**DONORS[0], "donor_id": "external", "skill": "기타"}).execute()
+    donors_db.append_row("requests", {"request_id": "r0", "email": "r0@example.com", "needed_skill": "기타 레슨",
+                                      "description": "", "status": "대기", "created_at": "2024-02-01T00:00:00"})
+    assert donors_db.wait_for_matches(10)
+    assert _stored_pairs(donors_db) == {("external", "r0")}
+
+
+def test_donor_refresh_updates_only_affected_requests(donors_db):
+    client = donors_db.get_supabase_client()
+    client.table("requests").insert([
+        {"request_id": f"r{i}", "email": f"r{i}@example.com", "needed_skill": skill, "description": "",
+         "status": "대기", "created_at": "2024-02-01T00:00:00"}
+        for i, skill in enumerate(["파이썬 코딩", "피아노 레슨", "영어 회화"])
+    ]).execute()
+    donors_db.rebuild_matches()
+    before = _stored_pairs(donors_db)
+    # d0(파이썬)이 피아노로 바뀌면 r0에서 빠지고 r1에 추가됨
+    donors_db.update_donor("d0", "기부자0", "d0@example.com", "피아노", "온라인", "평일")
+    assert donors_db.wait_for_matches(10)
+    assert _stored_pairs(donors_db) == (before - {("d0", "r0")}) | {("d0", "r1")}
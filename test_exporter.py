@@ -0,0 +1,52 @@
+"""exporter 모듈 테스트"""
+import io
+
+import pandas as pd
+import pytest
+
+import exporter
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    exporter.clear_cache()
+    yield
+    exporter.clear_cache()
+
+
+def _counting_build(df):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return df
+
+    return build, calls
+
+
+def test_export_bytes_reuses_file_for_same_key():
+    build, calls = _counting_build(pd.DataFrame({"이름": ["가", "나"]}))
+    first = exporter.export_bytes(("donors", 1), "csv", build)
+    assert exporter.export_bytes(("donors", 1), "csv", build) == first
+    assert len(calls) == 1
+    exporter.export_bytes(("donors", 2), "csv", build)
+    assert len(calls) == 2
+
+
+def test_export_bytes_rebuilds_after_max_age(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(exporter.time, "monotonic", lambda: now[0])
+    rows = {"이름": ["가"]}
+    data = exporter.export_bytes(("donors", 1), "csv", lambda: pd.DataFrame(rows), max_age=60)
+    # 같은 키라도 다른 곳에서 데이터가 바뀐 경우 TTL이 지나면 다시 만듦
+    rows["이름"] = ["나"]
+    assert exporter.export_bytes(("donors", 1), "csv", lambda: pd.DataFrame(rows), max_age=60) == data
+    now[0] += 61
+    assert exporter.export_bytes(("donors", 1), "csv", lambda: pd.DataFrame(rows), max_age=60) != data
+
+
+def test_csv_export_has_bom_header_and_all_rows():
+    df = pd.DataFrame({"이름": [f"이름{i}" for i in range(25)], "점수": range(25)})
+    text = exporter.to_csv_bytes(df, chunk_size=10).decode("utf-8-sig")
+    assert text.splitlines()[0] == "이름,점수"
+    assert pd.read_csv(io.StringIO(text)).equals(df)
@@ -0,0 +1,117 @@
+"""match_frames / SkillIndex / top_k_frames ↔ calculate_match_score 일치 테스트"""
+import pandas as pd
+import pytest
+
+from datagen import generate_donors, generate_requests
+from matching import SkillIndex, calculate_match_score, match_frames, top_k_frames
+
+# 동의어, 대소문자/전각, 문장 부호, 빈 값 등 정규화 경계 사례
+EDGE_DONORS = pd.DataFrame({
+    "donor_id": [f"edge-d{i}" for i in range(6)],
+    "skill": ["Python, 피아노", "ＪＡＶＡ", "데이터 분석(엑셀)", "", "js / design", "수학"],
+})
+EDGE_REQUESTS = pd.DataFrame({
+    "request_id": [f"edge-r{i}" for i in range(6)],
+    "needed_skill": ["파이썬 코딩", "java", "엑셀", "", "자바스크립트, 디자인", "Mathematics"],
+})
+
+
+@pytest.fixture(scope="module")
+def frames():
+    donors = pd.concat([generate_donors(400, seed=11)[["donor_id", "skill"]], EDGE_DONORS], ignore_index=True)
+    requests = pd.concat([generate_requests(150, seed=12)[["request_id", "needed_skill"]], EDGE_REQUESTS],
+                         ignore_index=True)
+    return donors, requests
+
+
+@pytest.fixture(scope="module")
+def expected(frames):
+    donors, requests = frames
+    return {
+        (donor_id, request_id)
+        for request_id, needed in zip(requests["request_id"], requests["needed_skill"])
+        for donor_id, skill in zip(donors["donor_id"], donors["skill"])
+        if calculate_match_score(skill, needed)
+    }
+
+
+def test_match_frames_matches_calculate_match_score(frames, expected):
+    donors, requests = frames
+    result = match_frames(donors, requests)
+    pairs = list(zip(result["donor_id"], result["request_id"]))
+    assert len(pairs) == len(set(pairs))
+    assert set(pairs) == expected
+    assert (result["score"] == 1).all()
+
+
+def test_skill_index_lookup_matches_calculate_match_score(frames, expected):
+    donors, requests = frames
+    index = SkillIndex.from_frame(donors)
+    pairs = {(donor_id, request_id)
+             for request_id, needed in zip(requests["request_id"], requests["needed_skill"])
+             for donor_id in index.lookup(needed)}
+    assert pairs == expected
+
+
+def test_skill_index_score_is_positive_only_for_matches(frames, expected):
+    donors, requests = frames
+    index = SkillIndex.from_frame(donors)
+    for request_id, needed in zip(requests["request_id"][::10], requests["needed_skill"][::10]):
+        for donor_id in donors["donor_id"]:
+            assert (index.score(donor_id, needed) > 0) == ((donor_id, request_id) in expected)
+
+
+@pytest.mark.parametrize("k", [1, 3, 20])
+def test_top_k_is_best_prefix_of_matches(frames, expected, k):
+    donors, requests = frames
+    index = SkillIndex.from_frame(donors)
+    for request_id, needed in zip(requests["request_id"], requests["needed_skill"]):
+        ranked = index.top_k(needed)
+        matched = {donor_id for donor_id, rid in expected if rid == request_id}
+        assert {donor_id for donor_id, _ in ranked} == matched
+        scores = [score for _, score in ranked]
+        assert scores == sorted(scores, reverse=True)
+        assert index.top_k(needed, k) == ranked[:k]
+
+
+def test_top_k_frames_keeps_k_matches_per_request(frames, expected):
+    donors, requests = frames
+    k = 5
+    result = top_k_frames(donors, requests, k)
+    assert set(zip(result["donor_id"], result["request_id"])) <= expected
+    per_request = result.groupby("request_id").size()
+    for request_id in requests["request_id"]:
+        matched = sum(1 for _, rid in expected if rid == request_id)
+        assert per_request.get(request_id, 0) == min(k, matched)
+
+
+@pytest.mark.parametrize("request_skill", ["파이썬", "파이썬, 영어 회화", "python 코딩", "피아노"])
+def test_top_k_breaks_ties_like_full_ranking(request_skill):
+    # 같은 재능이 많아 동점이 흔한 경우에도 점수 상한으로 멈춘 결과가 전체 순위의 앞부분과 같음
+    skills = ["파이썬", "파이썬, 영어", "영어", "파이썬 코딩", "코딩", "피아노, 파이썬"] * 50
+    index = SkillIndex((f"d{i}", skill) for i, skill in enumerate(skills))
+    ranked = index.top_k(request_skill)
+    for k in (1, 5, 40, 400):
+        assert index.top_k(request_skill, k) == ranked[:k]
+
+
+def test_skill_index_add_replaces_existing_skill(frames):
+    donors, requests = frames
+    changed = donors.copy()
+    changed.loc[::3, "skill"] = "피아노, 기타"
+    index = SkillIndex.from_frame(donors)
+    for donor_id, skill in zip(changed["donor_id"], changed["skill"]):
+        index.add(donor_id, skill)
+    rebuilt = SkillIndex.from_frame(changed)
+    assert len(index) == len(rebuilt)
+    for needed in requests["needed_skill"]:
+        assert index.lookup(needed) == rebuilt.lookup(needed)
+        assert index.top_k(needed, 5) == rebuilt.top_k(needed, 5)
+
+
+def test_request_index_lookup_finds_requests_for_donor(frames, expected):
+    # 수요 재능으로 만든 색인을 기부자 재능으로 조회하면 그 기부자와 매칭되는 수요 (database의 영향 범위 계산)
+    donors, requests = frames
+    index = SkillIndex.from_frame(requests, id_col="request_id", skill_col="needed_skill")
+    for donor_id, skill in zip(donors["donor_id"], donors["skill"]):
+        assert set(index.lookup(skill)) == {rid for did, rid in expected if did == donor_id}